@@ -1,21 +1,52 @@
 # app.py
 # Email Draft Generator (Bulk BCC) - Link-based references (YouTube + Imgur album)
 # - Links are clickable in email clients
-# - Picks a new random template each time (different from last pick)
+# - Picks the next template/subject pair from a rotation shared by all sessions
+#   (never the same template twice in a row)
+# - Corpus, recipient loading and mailto building live in the transitional_leader
+#   package, which Python imports once per process; only this UI layer reruns.
 
-import random
-import urllib.parse
-from pathlib import Path
+import html
+import os
+import time
 
-import pandas as pd
 import streamlit as st
 
+from transitional_leader import (
+    FILTER_COLUMNS,
+    DraftDescriptor,
+    get_draft_engine,
+    get_recipient_cache,
+    get_rotation,
+    subset_key,
+)
+from transitional_leader import metrics
+from transitional_leader.registry import get_contact_registry
+from transitional_leader.reload import start_contact_watcher
+from transitional_leader.smtp import SenderBusy, SmtpConfig, build_outgoing, get_background_sender
+
+
+# Opt-in instrumentation (TL_METRICS=1); every hook below is a no-op otherwise.
+rerun_started = time.perf_counter()
+metrics.start_exporters()
+metrics.record_rerun()
+
 
 # ---------------------------
-# Paths
+# Configuration
 # ---------------------------
-BASE_DIR = Path(__file__).resolve().parent
-CSV_PATH = BASE_DIR / "au_parliament_contacts.csv"
+# Contact sets are the *_contacts.csv files in TL_CONTACTS_DIR (default: this
+# folder); TL_CONTACTS_CSV pins a single file. Each is loaded on first selection.
+
+# Seconds between background checks of a loaded CSV for changes; 0 re-checks it on every rerun instead.
+CSV_RELOAD_INTERVAL = float(os.environ.get("TL_CONTACTS_RELOAD_INTERVAL", "2"))
+
+# Optional server-side sending (TL_SMTP_HOST etc.); only offered to logged-in users.
+try:
+    SMTP_CONFIG = SmtpConfig.from_env()
+    SMTP_CONFIG_ERROR = None
+except ValueError as e:
+    SMTP_CONFIG, SMTP_CONFIG_ERROR = None, str(e)
 
 
 # ---------------------------
@@ -25,393 +56,43 @@ st.set_page_config(page_title="Email Draft Generator", layout="centered")
 #st.title("Email Draft Generator for Australian Senators and MPs in Support of the Iranian National Revolution")
 #st.title("Email Draft Generator for Australian Parliamentarians | تولید پیش‌نویس ایمیل برای نمایندگان پارلمان استرالیا")
 #st.header("Email Draft Generator for Australian Senators and MPs in Support of the Iranian National Revolution and Crown Prince Reza Pahlavi as a Transitional Leader | تولید پیش‌نویس ایمیل برای نمایندگان استرالیا در حمایت از انقلاب ملی ایران و شاهزاده رضا پهلوی به‌عنوان رهبر دوران گذار")
-st.markdown(
-    "<h3 style='text-align:center;'>Sending Email to Australian Senators and MPs in Support of the Iranian National Revolution and Crown Prince Reza Pahlavi as a Transitional Leader</h3>",
-    unsafe_allow_html=True
-)
-
-st.markdown(
-    "<h5 style='text-align:center; direction:rtl;'>ارسال ایمیل به نمایندگان استرالیا در حمایت از انقلاب ملی ایران و شاهزاده رضا پهلوی به‌عنوان رهبر دوران گذار</h5>",
-    unsafe_allow_html=True
-)
-
+heading = st.container()
 st.caption("Enter your name and open a prefilled email with all recipients included in BCC.")
 #st.info("This tool can be used by anyone, anywhere in the world, no matter where you live.")
 st.info("This tool can be used by anyone, anywhere in the world, no matter where you live. | این ابزار برای همه افراد، در هر نقطه‌ای از جهان و فارغ از محل سکونت، قابل استفاده است.")
 
-
-# ---------------------------
-# References (updated: attributed to Reza Pahlavi + Imgur photos link)
-# ---------------------------
-REFERENCES_BLOCK = (
-    "Additional references:\n"
-    "• Reza Pahlavi’s remarks on how a free Iran would benefit global stability:\n"
-    "https://youtu.be/pzlKh8B2GFE?si=WXWMw2IaxMNC16kp\n\n"
-    "• Reza Pahlavi’s interview with ARD (Germany’s nightly news, English from 0:18):\n"
-    "https://youtu.be/sfd2hNuK498?si=4dPK_i1gngkr-hLT\n\n"
-    "• Reza Pahlavi’s full international press conference addressing transition and governance:\n"
-    "https://www.youtube.com/live/GIYZhaoiFYU?si=orGTYn8FFMSB-HBh\n\n"
-    "• Photographic documentation from inside Iran showing public expressions of support for Reza Pahlavi:\n"
-    "https://imgur.com/a/s9gKZbx"
-)
-
-# This exact bilingual requirement must appear in ALL templates:
-SLOGANS_REQUIRED = '“Javid Shah” (“Long live the King”) and “Pahlavi bar migardeh” (“Pahlavi will return”)'
-
-
-# ---------------------------
-# 20 BODY-ONLY templates (greeting + signature are added separately)
-# Each template includes the required slogans with translations in parentheses.
-# ---------------------------
-EMAIL_TEMPLATES = [
-    f"""I am writing regarding the ongoing situation in Iran and how the international community can best stand with and support the brave people who are fighting bare-handed for their freedom against the brutal regime, and help advance a peaceful and democratic transition.
-
-Despite severe repression, internet shutdowns, as well as risks to their very lives, voices from inside Iran have become increasingly clear and consistent. Across many cities, people are publicly calling for Reza Pahlavi to guide a transitional process and lead their revolution, holding placards with his name and photo and chanting {SLOGANS_REQUIRED}. These calls are emerging from within Iran itself and reflect a growing demand for national unity and a credible alternative to the current regime.
-
-Reza Pahlavi has publicly outlined a clear and structured roadmap for transition, grounded in democratic principles, human rights, free elections, and the separation of religion and state. He has emphasised that his role would be to facilitate a transitional period and return decision-making power to the Iranian people through a democratic referendum.
-
-Given the scale of violence, massacres, and the regime’s crimes against its own people inside Iran and the systematic silencing of independent media, along with widespread propaganda aimed at distorting facts and suppressing dissenting voices, international recognition of the expressed will of the Iranian people is critically important. Constructive engagement with a credible transitional framework can help deter further repression and support stability, both regionally and globally.
-
-Thank you for your time and consideration.
-
-{REFERENCES_BLOCK}""",
-
-    f"""I write to draw attention to the ongoing crisis in Iran and to highlight how the international community can support the Iranian people in achieving a peaceful and democratic transition.
-
-Even under brutal repression, internet shutdowns, and constant threats to life, voices from inside Iran have become more united. Across many cities, citizens are publicly calling for Reza Pahlavi to guide a transitional process, holding placards with his name and image and chanting {SLOGANS_REQUIRED}. These expressions originate within Iran and reflect a growing demand for national unity and a credible alternative to the current regime.
-
-Reza Pahlavi has set out a structured roadmap for transition grounded in democratic principles, human rights, free elections, and the separation of religion and state. He has stated that his role would be to facilitate a transitional period and return decision-making power to the Iranian people through a democratic referendum.
-
-Given the regime’s violence, suppression of independent media, and systematic propaganda, international recognition of the Iranian people’s expressed will is vital. Constructive engagement with a credible transition framework can help deter further repression and support stability beyond Iran’s borders.
-
-Thank you for your time and consideration.
-
-{REFERENCES_BLOCK}""",
-
-    f"""I am writing to express concern over the ongoing situation in Iran and to underscore the importance of international support for a peaceful and democratic transition.
-
-Despite severe repression and internet blackouts, voices from inside Iran are increasingly clear. In many cities, protesters are publicly calling for Reza Pahlavi to guide a transitional process, holding his name and photo while chanting {SLOGANS_REQUIRED}. These calls arise from within Iran and reflect a growing desire for national unity and a credible alternative.
-
-Reza Pahlavi has publicly outlined a clear roadmap for transition grounded in democracy, human rights, free elections, and the separation of religion and state. He has emphasised that his role would be limited to facilitating a transition and returning decision-making power to the Iranian people through a democratic referendum.
-
-Considering the scale of violence, censorship, and propaganda, international recognition of the Iranian people’s expressed will is critically important. Supporting a credible transitional framework can help discourage further repression and contribute to regional and global stability.
-
-Thank you for your time and consideration.
-
-{REFERENCES_BLOCK}""",
-
-    f"""I write concerning the situation in Iran and the role the international community can play in supporting a non-violent and democratic transition.
-
-Even under severe repression and repeated internet shutdowns, voices from inside Iran are increasingly unified. Across many cities, people are publicly calling for Reza Pahlavi to guide a transitional process, holding placards with his name and photo and chanting {SLOGANS_REQUIRED}. These calls originate within Iran and reflect a growing demand for unity and credible leadership.
-
-Reza Pahlavi has presented a structured transition roadmap grounded in democratic principles, human rights, free elections, and the separation of religion and state. He has stated that his role would be to facilitate a transition and return authority to the Iranian people through a democratic referendum.
-
-Given widespread violence, the silencing of independent media, and systematic propaganda, international recognition of these domestic calls is crucial. Constructive engagement with a credible transitional framework can help deter further repression and support stability.
-
-Thank you for your time and consideration.
-
-{REFERENCES_BLOCK}""",
-
-    f"""I am writing to highlight developments inside Iran and the urgent need for international engagement that supports a peaceful and democratic transition.
-
-Despite violent repression, internet shutdowns, and grave risks, voices from inside Iran have become more visible and consistent. In many cities, citizens are calling for Reza Pahlavi to guide a transitional process, holding his image and chanting {SLOGANS_REQUIRED}. These calls are emerging from within Iran itself and reflect a growing demand for national unity and an alternative to the current regime.
-
-Reza Pahlavi has publicly outlined a clear roadmap grounded in democratic principles, human rights, free elections, and the separation of religion and state. He has emphasised that his role would be to facilitate a transitional period and return decision-making power to the Iranian people through a democratic referendum.
-
-In light of ongoing violence, censorship, and propaganda, international recognition of the expressed will of the Iranian people is critically important. Supporting a credible transitional framework can help deter further repression and support stability, both regionally and globally.
-
-Thank you for your time and consideration.
-
-{REFERENCES_BLOCK}""",
-
-   
-    f"""I write to respectfully request attention to Iran’s ongoing crisis and the importance of standing with the Iranian people as they seek freedom and democracy.
-
-Even under brutal repression and recurring internet shutdowns, voices from inside Iran are increasingly clear. In many cities, demonstrators are publicly calling for Reza Pahlavi to guide a transitional process, holding placards with his name and photo and chanting {SLOGANS_REQUIRED}. These calls come from within Iran and reflect a growing demand for unity and a credible alternative to the current regime.
-
-Reza Pahlavi has set out a structured roadmap for transition based on democratic principles, human rights, free elections, and the separation of religion and state. He has stated that his role would be temporary and aimed at returning authority to the Iranian people through a democratic referendum.
-
-Given the scale of violence and the systematic suppression of independent media and dissenting voices, international recognition of the Iranian people’s expressed will is crucial. Constructive engagement with a credible transition framework can help deter further repression and contribute to stability.
-
-Thank you for your time and consideration.
-
-{REFERENCES_BLOCK}""",
-
-    f"""I am writing regarding Iran and how the international community can most effectively support a peaceful and democratic transition that reflects the will of the Iranian people.
-
-Despite severe repression, threats to life, and ongoing internet blackouts, calls from inside Iran have become more consistent. Across many cities, citizens are publicly calling for Reza Pahlavi to guide a transitional process, holding his image and chanting {SLOGANS_REQUIRED}. These calls originate within Iran and signal a growing demand for national unity and a credible alternative.
-
-Reza Pahlavi has publicly outlined a clear transition roadmap grounded in democratic principles, human rights, free elections, and the separation of religion and state. He has emphasised that his role would be to facilitate a transition and return decision-making power to the Iranian people through a democratic referendum.
-
-Given ongoing violence, censorship, and propaganda, international recognition of these domestic calls is critically important. Supporting a credible transitional framework can help deter further repression and support regional and global stability.
-
-Thank you for your time and consideration.
-
-{REFERENCES_BLOCK}""",
-
-    f"""I write to draw attention to the situation in Iran and to highlight the need for meaningful international support for a peaceful democratic transition.
-
-Even under severe repression and repeated internet shutdowns, voices from inside Iran have become increasingly clear. In many cities, protesters are publicly calling for Reza Pahlavi to guide a transitional process, holding placards with his name and photo and chanting {SLOGANS_REQUIRED}. These calls are emerging from within Iran and reflect a growing demand for unity and credible leadership.
-
-Reza Pahlavi has outlined a structured roadmap grounded in democracy, human rights, free elections, and the separation of religion and state. He has stated that his role would be to facilitate a transitional period and return power to the Iranian people through a referendum.
-
-Given the scale of violence and the systematic silencing of independent media, international recognition of the Iranian people’s expressed will is vital. Constructive engagement with a credible transitional framework can help deter further repression and support stability.
-
-Thank you for your time and consideration.
-
-{REFERENCES_BLOCK}""",
-
-    f"""I am writing regarding the ongoing crisis in Iran and how the international community can best stand with those seeking freedom and democracy.
-
-Despite brutal repression, internet restrictions, and threats to their lives, voices from inside Iran are increasingly unified. Across many cities, citizens are calling for Reza Pahlavi to guide a transitional process, holding his image and chanting {SLOGANS_REQUIRED}. These calls originate within Iran and reflect a growing demand for national unity and a credible alternative.
-
-Reza Pahlavi has publicly outlined a clear and structured roadmap for transition grounded in democratic principles, human rights, free elections, and the separation of religion and state. He has emphasised that his role would be limited to facilitating a transition and returning decision-making power to the Iranian people through a democratic referendum.
-
-Given ongoing violence, massacres, censorship, and propaganda, international recognition of the Iranian people’s expressed will is critically important. Supporting a credible transitional framework can help deter further repression and contribute to stability.
-
-Thank you for your time and consideration.
-
-{REFERENCES_BLOCK}""",
-
-    f"""I write to raise concern about the situation in Iran and to emphasise the importance of international recognition of the Iranian people’s demands for a peaceful democratic transition.
-
-Even under severe repression and repeated internet blackouts, voices from inside Iran have become clearer. In many cities, people are publicly calling for Reza Pahlavi to guide a transitional process, holding placards with his name and photo and chanting {SLOGANS_REQUIRED}. These calls arise from within Iran and reflect a growing demand for unity and credible leadership.
-
-Reza Pahlavi has presented a structured roadmap grounded in democratic values, human rights, free elections, and the separation of religion and state. He has stated that his role would be to facilitate a transition and return authority to the Iranian people through a democratic referendum.
-
-Given the regime’s violence, censorship, and propaganda, international recognition of the expressed will of Iranians is critically important. Constructive engagement with a credible transition framework can help deter further repression and support stability.
-
-Thank you for your time and consideration.
-
-{REFERENCES_BLOCK}""",
-
-    f"""I am writing to draw attention to the ongoing situation in Iran and the urgent need for international support that advances a peaceful and democratic transition.
-
-Despite severe repression, internet shutdowns, and grave risks, voices from inside Iran have become increasingly consistent. Across many cities, protesters are publicly calling for Reza Pahlavi to guide a transitional process, holding his name and photo while chanting {SLOGANS_REQUIRED}. These calls originate within Iran and reflect a growing demand for national unity and a credible alternative.
-
-Reza Pahlavi has publicly outlined a clear roadmap for transition grounded in democratic principles, human rights, free elections, and the separation of religion and state. He has emphasised that his role would be to facilitate a transitional period and return decision-making power to the Iranian people through a democratic referendum.
-
-In light of widespread violence and systematic suppression of independent media, international recognition of the Iranian people’s expressed will is crucial. Supporting a credible transitional framework can help deter further repression and contribute to regional and global stability.
-
-Thank you for your time and consideration.
-
-{REFERENCES_BLOCK}""",
-
-    f"""I write regarding Iran’s ongoing crisis and how the international community can best support the Iranian people in achieving a peaceful and democratic transition.
-
-Even under brutal repression and repeated internet shutdowns, voices from inside Iran are increasingly clear. Across many cities, citizens are publicly calling for Reza Pahlavi to guide a transitional process, holding placards with his name and photo and chanting {SLOGANS_REQUIRED}. These calls are emerging from within Iran and reflect a growing demand for unity and credible leadership.
-
-Reza Pahlavi has outlined a structured roadmap based on democratic principles, human rights, free elections, and the separation of religion and state. He has stated that his role would be to facilitate a transition and return authority to the people through a democratic referendum.
-
-Given violence, censorship, and propaganda, international recognition of these domestic calls is critically important. Constructive engagement with a credible transition framework can help deter further repression and support stability.
-
-Thank you for your time and consideration.
-
-{REFERENCES_BLOCK}""",
-
-    f"""I am writing about the ongoing situation in Iran and the importance of international recognition of the Iranian people’s calls for a peaceful democratic transition.
-
-Despite severe repression and internet shutdowns, voices from inside Iran have grown more unified. In many cities, demonstrators are calling for Reza Pahlavi to guide a transitional process, holding his image and chanting {SLOGANS_REQUIRED}. These expressions originate within Iran and reflect a growing demand for national unity and a credible alternative.
-
-Reza Pahlavi has publicly outlined a clear and structured roadmap for transition grounded in democratic values, human rights, free elections, and the separation of religion and state. He has emphasised that his role would be temporary and aimed at returning decision-making power to the Iranian people through a democratic referendum.
-
-Given widespread violence and systematic silencing of independent media, international recognition of the expressed will of Iranians is vital. Supporting a credible transitional framework can help deter further repression and contribute to stability.
-
-Thank you for your time and consideration.
-
-{REFERENCES_BLOCK}""",
-
-    f"""I write to request attention to the crisis in Iran and to highlight how the international community can support a peaceful and democratic transition.
-
-Even with severe repression and repeated internet shutdowns, voices from inside Iran are increasingly consistent. Across many cities, people are publicly calling for Reza Pahlavi to guide a transitional process, holding placards with his name and photo and chanting {SLOGANS_REQUIRED}. These calls originate within Iran and reflect a growing demand for unity and credible leadership.
-
-Reza Pahlavi has set out a structured roadmap grounded in democratic principles, human rights, free elections, and the separation of religion and state. He has stated that his role would be to facilitate a transitional period and return authority to the Iranian people through a democratic referendum.
-
-Given the regime’s violence and its systematic suppression of independent media, international recognition of these calls is critically important. Constructive engagement with a credible transition framework can help deter further repression and support stability.
-
-Thank you for your time and consideration.
-
-{REFERENCES_BLOCK}""",
-
-    f"""I am writing regarding the situation in Iran and how the international community can stand with the Iranian people as they seek freedom and a peaceful democratic transition.
-
-Despite brutal repression, internet shutdowns, and risks to life, voices from inside Iran have become increasingly clear. In many cities, citizens are publicly calling for Reza Pahlavi to guide a transitional process, holding his image and chanting {SLOGANS_REQUIRED}. These calls come from within Iran and reflect a growing demand for national unity and a credible alternative.
-
-Reza Pahlavi has publicly outlined a structured roadmap for transition grounded in democratic values, human rights, free elections, and the separation of religion and state. He has emphasised that his role would be limited to facilitating a transition and returning decision-making power to the Iranian people through a democratic referendum.
-
-Given violence, censorship, and propaganda, international recognition of the Iranian people’s expressed will is critically important. Supporting a credible transitional framework can help deter further repression and contribute to regional and global stability.
-
-Thank you for your time and consideration.
-
-{REFERENCES_BLOCK}""",
-
-    f"""I write to underline the urgency of the situation in Iran and the importance of international support for a peaceful and democratic transition.
-
-Despite severe repression and recurring internet shutdowns, voices from inside Iran are increasingly unified. Across many cities, demonstrators are publicly calling for Reza Pahlavi to guide a transitional process, holding placards with his name and photo and chanting {SLOGANS_REQUIRED}. These calls are emerging from within Iran and reflect a growing demand for unity and credible leadership.
-
-Reza Pahlavi has outlined a clear and structured roadmap grounded in democratic principles, human rights, free elections, and the separation of religion and state. He has stated that his role would be to facilitate a transitional period and return decision-making power to the Iranian people through a democratic referendum.
-
-Given the scale of violence and systematic suppression of independent media, international recognition of the Iranian people’s expressed will is crucial. Constructive engagement with a credible transition framework can help deter further repression and support stability.
-
-Thank you for your time and consideration.
-
-{REFERENCES_BLOCK}""",
-
-    f"""I am writing to draw attention to developments inside Iran and the importance of supporting the Iranian people’s pursuit of freedom and democracy.
-
-Even under brutal repression and repeated internet shutdowns, voices from inside Iran have become clearer and more consistent. In many cities, people are publicly calling for Reza Pahlavi to guide a transitional process, holding his photo and chanting {SLOGANS_REQUIRED}. These calls originate within Iran and reflect a growing demand for national unity and a credible alternative.
-
-Reza Pahlavi has publicly outlined a transition roadmap grounded in democratic values, human rights, free elections, and the separation of religion and state. He has emphasised that his role would be limited to facilitating a transition and returning decision-making power to the Iranian people through a democratic referendum.
-
-Given violence, censorship, and propaganda, international recognition of the expressed will of Iranians is critically important. Supporting a credible transitional framework can help deter further repression and contribute to stability regionally and globally.
-
-Thank you for your time and consideration.
-
-{REFERENCES_BLOCK}""",
-
-    f"""I write regarding the ongoing situation in Iran and to stress how the international community can best support a peaceful and democratic transition.
-
-Despite severe repression, internet shutdowns, and threats to life, voices from inside Iran have become increasingly unified. Across many cities, citizens are publicly calling for Reza Pahlavi to guide a transitional process, holding placards with his name and photo and chanting {SLOGANS_REQUIRED}. These expressions originate within Iran and reflect a growing demand for unity and credible leadership.
-
-Reza Pahlavi has outlined a structured roadmap grounded in democracy, human rights, free elections, and separation of religion and state. He has stated that his role would be to facilitate a transitional period and return decision-making power to the Iranian people through a democratic referendum.
-
-Given ongoing violence and systematic silencing of independent media alongside propaganda, international recognition of the expressed will of the Iranian people is vital. Constructive engagement with a credible transition framework can help deter further repression and support stability.
-
-Thank you for your time and consideration.
-
-{REFERENCES_BLOCK}""",
-
-    f"""I am writing about the ongoing crisis in Iran and the importance of international recognition of the Iranian people’s calls for democratic change.
-
-Even under brutal repression and internet shutdowns, voices from inside Iran are increasingly clear. In many cities, demonstrators are publicly calling for Reza Pahlavi to guide a transitional process, holding his name and photo while chanting {SLOGANS_REQUIRED}. These calls emerge from within Iran itself and reflect a growing demand for national unity and a credible alternative.
-
-Reza Pahlavi has publicly presented a clear roadmap grounded in democratic principles, human rights, free elections, and the separation of religion and state. He has emphasised that his role would be temporary and focused on returning decision-making power to the people through a democratic referendum.
-
-Given violence, massacres, censorship, and propaganda, international recognition of the Iranian people’s expressed will is critically important. Supporting a credible transitional framework can help deter further repression and contribute to stability.
-
-Thank you for your time and consideration.
-
-{REFERENCES_BLOCK}""",
-
-    f"""I write to request attention to Iran’s ongoing crisis and to highlight how international engagement can support a peaceful democratic transition.
-
-Despite severe repression and repeated internet shutdowns, voices from inside Iran have become more consistent. Across many cities, citizens are publicly calling for Reza Pahlavi to guide a transitional process, holding placards with his name and photo and chanting {SLOGANS_REQUIRED}. These calls come from within Iran and reflect a growing demand for national unity and credible leadership.
-
-Reza Pahlavi has outlined a structured roadmap grounded in democratic values, human rights, free elections, and the separation of religion and state. He has stated that his role would be to facilitate a transition and return authority to the Iranian people through a democratic referendum.
-
-Given the regime’s violence and systematic silencing of independent media, international recognition of the expressed will of Iranians is vital. Constructive engagement with a credible transition framework can help deter further repression and support stability.
-
-Thank you for your time and consideration.
-
-{REFERENCES_BLOCK}""",
-
-    f"""I am writing regarding the situation in Iran and how the international community can best support the Iranian people’s pursuit of freedom and democratic governance.
-
-Even with severe repression, internet shutdowns, and threats to life, voices from inside Iran have become increasingly clear. In many cities, people are publicly calling for Reza Pahlavi to guide a transitional process, holding his image and chanting {SLOGANS_REQUIRED}. These calls originate within Iran and reflect a growing demand for unity and a credible alternative.
-
-Reza Pahlavi has publicly outlined a clear roadmap grounded in democratic principles, human rights, free elections, and the separation of religion and state. He has emphasised that his role would be to facilitate a transitional period and return decision-making power to the Iranian people through a democratic referendum.
-
-Given ongoing violence, censorship, and propaganda, international recognition of these domestic calls is critically important. Supporting a credible transitional framework can help deter further repression and contribute to regional and global stability.
-
-Thank you for your time and consideration.
-
-{REFERENCES_BLOCK}""",
-]
-
-
-# ---------------------------
-# Subject options (rotates)
-# ---------------------------
-SUBJECT_OPTIONS = [
-    "Iran: Recognition of Reza Pahlavi as a Transitional Leader",
-    "Iran: Supporting Reza Pahlavi’s Roadmap for Democratic Transition",
-    "Iran: Responding to the Iranian People’s Call for Reza Pahlavi",
-    "Iran: Engagement with Reza Pahlavi’s Transitional Framework",
-    "Iran: Supporting a Peaceful Transition Led by Reza Pahlavi",
-    "Iran: Recognition of Reza Pahlavi’s Role in Democratic Transition",
-    "Iran: Supporting Reza Pahlavi as a Transitional Leader Chosen by the People",
-    "Iran: Reza Pahlavi and a Credible Path to Democratic Transition",
-    "Iran: Recognition of Reza Pahlavi’s Transitional Leadership"
-]
-
-
-
-# ---------------------------
-# Helpers: recipients
-# ---------------------------
-def find_email_column(df: pd.DataFrame) -> str | None:
-    candidates = ["email", "Email", "EMAIL", "e-mail", "E-mail", "mail", "Mail"]
-    for c in candidates:
-        if c in df.columns:
-            return c
-    for c in df.columns:
-        if "email" in str(c).lower():
-            return c
-    return None
-
-
-def load_recipients(csv_path: Path) -> list[str]:
-    if not csv_path.exists():
-        raise FileNotFoundError(
-            f"Missing required file: {csv_path.name}. Place it in the same folder as this app."
-        )
-
-    df = pd.read_csv(csv_path)
-    email_col = find_email_column(df)
-    if not email_col:
-        raise ValueError("Could not find an email column in the CSV. Please ensure it has a column named 'email'.")
-
-    emails = (
-        df[email_col]
-        .astype(str)
-        .str.strip()
-        .replace({"nan": "", "None": ""})
-        .tolist()
-    )
-
-    seen = set()
-    cleaned = []
-    for e in emails:
-        if not e:
-            continue
-        if "@" not in e:
-            continue
-        if e not in seen:
-            cleaned.append(e)
-            seen.add(e)
-
-    if not cleaned:
-        raise ValueError("No valid email addresses were found in the CSV.")
-    return cleaned
-
-
 # ---------------------------
-# Helpers: template choice (different from last)
+# Load recipients
 # ---------------------------
-def pick_new_index(exclude_index: int | None, n: int) -> int:
-    if n <= 1:
-        return 0
-    choices = list(range(n))
-    if exclude_index is not None and exclude_index in choices:
-        choices.remove(exclude_index)
-    return random.choice(choices)
+try:
+    registry = get_contact_registry()
+except Exception as e:
+    st.error(str(e))
+    st.stop()
 
+contact_set = registry.default
+if len(registry) > 1:
+    contact_set = registry[
+        st.selectbox("Parliament", registry.keys(), format_func=lambda key: registry[key].label)
+    ]
 
-# ---------------------------
-# Helpers: build mailto 
-# ---------------------------
-def build_mailto_bcc_link(bcc_emails: list[str], subject: str, body: str) -> str:
-    bcc_value = ",".join(bcc_emails)
-    params = {"bcc": bcc_value, "subject": subject, "body": body}
-    query = "&".join(f"{k}={urllib.parse.quote(v, safe='')}" for k, v in params.items())
-    return f"mailto:?{query}"
+# The heading names whichever parliament is selected; it sits above the selector.
+heading.markdown(
+    f"<h3 style='text-align:center;'>Sending Email to {html.escape(contact_set.audience)} in Support of the Iranian National Revolution and Crown Prince Reza Pahlavi as a Transitional Leader</h3>",
+    unsafe_allow_html=True
+)
 
+heading.markdown(
+    f"<h5 style='text-align:center; direction:rtl;'>ارسال ایمیل به {html.escape(contact_set.audience_fa)} در حمایت از انقلاب ملی ایران و شاهزاده رضا پهلوی به‌عنوان رهبر دوران گذار</h5>",
+    unsafe_allow_html=True
+)
 
-# ---------------------------
-# Load recipients
-# ---------------------------
 try:
-    recipients = load_recipients(CSV_PATH)
+    with metrics.timed("load_recipients"):
+        if CSV_RELOAD_INTERVAL > 0:
+            start_contact_watcher(contact_set.csv_path, CSV_RELOAD_INTERVAL)
+        snapshot = get_recipient_cache().get(contact_set.csv_path)
+        engine = get_draft_engine(snapshot.emails)
 except Exception as e:
     st.error(str(e))
     st.stop()
@@ -420,11 +101,14 @@ except Exception as e:
 # ---------------------------
 # Session state
 # ---------------------------
-if "last_pick" not in st.session_state:
-    st.session_state.last_pick = None
-
-if "mailto_url" not in st.session_state:
-    st.session_state.mailto_url = None
+# Only a small DraftDescriptor is kept per session; the (often 30+ KB) links
+# are rebuilt on each rerun from the shared, pre-encoded engine.
+if "draft" not in st.session_state:
+    st.session_state.draft = None
+    metrics.record_session()
+elif st.session_state.draft is not None and st.session_state.draft.contact_set != contact_set.key:
+    # Switched parliament: the old draft's recipients no longer apply.
+    st.session_state.draft = None
 
 
 # ---------------------------
@@ -432,33 +116,127 @@ if "mailto_url" not in st.session_state:
 # ---------------------------
 name = st.text_input("Your name (English)")
 
-# Greeting
-
-greeting = "Dear Senator/Member of Parliament,"
+# Long links get truncated or rejected by some mail clients/browsers;
+# a budget splits the BCC list across several smaller drafts. Only budgets
+# that fit the subject and body of every draft (for this name) are offered.
+LINK_SIZE_OPTIONS = {
+    "No limit (one email)": None,
+    "32 KB": 32 * 1024,
+    "8 KB": 8 * 1024,
+    "4 KB": 4 * 1024,
+    "2 KB": 2 * 1024,
+}
+min_link_bytes = engine.min_link_bytes(name.strip())
+link_size = st.selectbox(
+    "Maximum link size",
+    [label for label, size in LINK_SIZE_OPTIONS.items() if size is None or size >= min_link_bytes],
+    help="If the email doesn't open, or opens without recipients, pick a smaller size to split the recipients across several emails.",
+)
+max_link_bytes = LINK_SIZE_OPTIONS[link_size]
+
+# Optional targeting; leaving a filter empty means "any".
+FILTER_LABELS = {"chamber": "Chamber", "state": "State", "party": "Party"}
+selected_filters = {}
+available_filters = [c for c in FILTER_COLUMNS if snapshot.index.values(c)]
+if available_filters:
+    with st.expander("Target specific recipients (optional)"):
+        for column, col in zip(available_filters, st.columns(len(available_filters))):
+            with col:
+                selected_filters[column] = st.multiselect(
+                    FILTER_LABELS.get(column, column),
+                    snapshot.index.values(column),
+                    key=f"filter_{contact_set.key}_{column}",
+                )
+n_selected = snapshot.index.count(snapshot.index.mask(selected_filters))
+if any(selected_filters.values()):
+    st.caption(f"{n_selected} of {len(snapshot.emails)} recipients selected.")
 
 if st.button("Step 1: Generate draft email", use_container_width=True):
     if not name.strip():
         st.warning("Please enter your name first.")
+    elif not n_selected:
+        st.warning("No recipients match the selected filters.")
     else:
-        new_pick = pick_new_index(st.session_state.last_pick, len(EMAIL_TEMPLATES))
-        st.session_state.last_pick = new_pick
+        last_draft = st.session_state.draft
+        with metrics.timed("select_template"):
+            new_pick, subject_pick = get_rotation().pick(last_draft.template_index if last_draft else None)
+        metrics.record_pick(new_pick, subject_pick)
 
-        subject = SUBJECT_OPTIONS[new_pick % len(SUBJECT_OPTIONS)]
-        signoff = f"Sincerely,\n{name.strip()}"
-
-        body_only = EMAIL_TEMPLATES[new_pick]
-        full_body = f"{greeting}\n\n{body_only}\n\n{signoff}"
-
-        st.session_state.mailto_url = build_mailto_bcc_link(recipients, subject, full_body)
-
-if st.session_state.mailto_url:
-    st.link_button("Step 2: Open email in your email app", st.session_state.mailto_url, use_container_width=True)
+        draft = DraftDescriptor(
+            new_pick, subject_pick, name.strip(), subset_key(selected_filters), max_link_bytes, contact_set.key
+        )
+        try:
+            engine.render(draft, snapshot.index)
+        except ValueError as e:
+            st.error(f"{e} Pick a larger maximum link size.")
+        else:
+            st.session_state.draft = draft
+
+draft = st.session_state.draft
+mailto_links = []
+if draft is not None:
+    # Body assembly and URL encoding are one step in the pre-encoded engine.
+    with metrics.timed("build_url"):
+        try:
+            mailto_links = engine.render(draft, snapshot.index)
+        except ValueError as e:
+            # Only if a reload brought in a longer address than the budget allows.
+            st.error(f"{e} Pick a larger maximum link size and generate the draft again.")
+    for url in mailto_links:
+        metrics.record_url(url)
+
+if len(mailto_links) > 1:
+    n_batches = len(mailto_links)
+    st.caption(f"Recipients are split across {n_batches} emails. Open and send each one.")
+    for i, url in enumerate(mailto_links):
+        step = f"2{chr(ord('a') + i)}" if i < 26 else f"2.{i + 1}"
+        st.link_button(f"Step {step}: Open email {i + 1} of {n_batches} in your email app", url, use_container_width=True)
+elif mailto_links:
+    st.link_button("Step 2: Open email in your email app", mailto_links[0], use_container_width=True)
+
+if SMTP_CONFIG_ERROR and getattr(st.user, "is_logged_in", False):
+    st.error(f"Server-side sending is misconfigured: {SMTP_CONFIG_ERROR}")
+
+if SMTP_CONFIG is not None and draft is not None and getattr(st.user, "is_logged_in", False):
+    # Delivery is rate limited per domain and can take minutes, so the click only
+    # queues the message; later reruns report how the send went. One send per
+    # session at a time, so impatient clicks can't mail every office twice.
+    sending = st.session_state.get("smtp_send")
+    pending = sending is not None and not sending[0].done()
+    if st.button("Or: send it from the server now", use_container_width=True, disabled=pending) and not pending:
+        try:
+            outgoing = build_outgoing(
+                SMTP_CONFIG,
+                engine.subset(snapshot.index.mask(dict(draft.subset_key))).recipients,
+                draft.name,
+                draft.template_index,
+                draft.subject_index,
+                reply_to=getattr(st.user, "email", None),
+            )
+            sending = st.session_state.smtp_send = (get_background_sender(SMTP_CONFIG).send(outgoing), len(outgoing.recipients))
+            pending = True
+        except SenderBusy as e:
+            st.warning(str(e))
+        except Exception as e:
+            st.error(f"Sending failed: {e}")
+
+    if sending is not None:
+        future, n_recipients = sending
+        if pending:
+            st.info(f"Queued: your email to {n_recipients} recipients will be sent shortly. There's no need to click again.")
+        elif (error := future.exception()) is not None:
+            st.error(f"Sending failed: {str(error) or type(error).__name__}")
+        else:
+            delivered = n_recipients - len(future.result().refused)
+            st.success(f"Sent to {delivered} of {n_recipients} recipients.")
 
 st.caption(
     "Note: This tool opens a draft email in your email app with all recipients included in BCC. "
     "The photo album and YouTube references are included as clickable links in the email body."
 )
 
+metrics.record_stage("rerun", time.perf_counter() - rerun_started)
+
 # ---------------------------
 # Run command (Terminal)
 # ---------------------------
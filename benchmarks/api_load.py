@@ -0,0 +1,144 @@
+# Load test for the HTTP draft API (transitional_leader.api).
+# Starts the server in a subprocess, then drives it with keep-alive asyncio
+# clients and reports requests/second and latency percentiles per endpoint.
+#
+#   python benchmarks/api_load.py [--connections 32] [--duration 5] [--endpoint draft|recipients|mixed] [--json]
+#   python benchmarks/api_load.py --url http://127.0.0.1:8080   # against an already running server
+
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.parse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+REQUESTS = {
+    "recipients": (
+        b"GET /recipients?chamber=Senate&state=VIC HTTP/1.1\r\nHost: bench\r\n\r\n"
+    ),
+    "draft": (
+        b"POST /draft HTTP/1.1\r\nHost: bench\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n%s"
+        % (len(body := b'{"name": "Jane Doe", "template_index": 3}'), body)
+    ),
+}
+
+
+async def _read_response(reader: asyncio.StreamReader) -> int:
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head[9:12])
+    length = 0
+    for line in head.split(b"\r\n"):
+        if line[:15].lower() == b"content-length:":
+            length = int(line[15:])
+    if length:
+        await reader.readexactly(length)
+    return status
+
+
+async def _client(host: str, port: int, kinds: list[str], deadline: float, latencies: dict, errors: list) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    i = 0
+    try:
+        while time.perf_counter() < deadline:
+            kind = kinds[i % len(kinds)]
+            i += 1
+            t0 = time.perf_counter()
+            writer.write(REQUESTS[kind])
+            await writer.drain()
+            status = await _read_response(reader)
+            if status != 200:
+                errors.append(status)
+            latencies[kind].append(time.perf_counter() - t0)
+    finally:
+        writer.close()
+
+
+async def run_load(host: str, port: int, connections: int, duration: float, endpoint: str) -> dict:
+    kinds = ["draft", "recipients"] if endpoint == "mixed" else [endpoint]
+    latencies: dict[str, list[float]] = {k: [] for k in kinds}
+    errors: list[int] = []
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*(_client(host, port, kinds, deadline, latencies, errors) for _ in range(connections)))
+    elapsed = time.perf_counter() - started
+
+    report = {"connections": connections, "duration_s": round(elapsed, 3), "errors": len(errors), "endpoints": {}}
+    total = 0
+    for kind, samples in latencies.items():
+        samples.sort()
+        total += len(samples)
+        report["endpoints"][kind] = {
+            "requests": len(samples),
+            "rps": round(len(samples) / elapsed, 1),
+            "p50_ms": round(samples[len(samples) // 2] * 1000, 3) if samples else None,
+            "p99_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000, 3) if samples else None,
+            "mean_ms": round(statistics.fmean(samples) * 1000, 3) if samples else None,
+        }
+    report["total_rps"] = round(total / elapsed, 1)
+    return report
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start_server(port: int) -> subprocess.Popen:
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "transitional_leader.api", "--port", str(port)],
+        cwd=ROOT,
+        stderr=subprocess.PIPE,
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return proc
+        except OSError:
+            if proc.poll() is not None:
+                raise RuntimeError(proc.stderr.read().decode())
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("API server did not start")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HTTP draft API load test.")
+    parser.add_argument("--url", help="existing server to test (default: start one)")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--endpoint", choices=["draft", "recipients", "mixed"], default="mixed")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    proc = None
+    if args.url:
+        parsed = urllib.parse.urlsplit(args.url)
+        host, port = parsed.hostname, parsed.port or 80
+    else:
+        host, port = "127.0.0.1", _free_port()
+        proc = _start_server(port)
+    try:
+        report = asyncio.run(run_load(host, port, args.connections, args.duration, args.endpoint))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"{report['total_rps']:.0f} req/s total over {report['connections']} connections, {report['errors']} errors")
+    for kind, r in report["endpoints"].items():
+        print(f"  {kind:<11} {r['rps']:>8.0f} req/s  p50 {r['p50_ms']:.2f} ms  p99 {r['p99_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
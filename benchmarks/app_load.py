@@ -0,0 +1,241 @@
+# Capacity test for one Streamlit worker: starts `streamlit run
+# TransitionalLeader.py` and drives it with many concurrent simulated browser
+# sessions over the app's websocket. Each session opens the page, types a name,
+# then clicks "Step 1: Generate draft email" repeatedly and reads the mailto
+# URL(s) off the Step 2 link buttons. Reports throughput, rerun latency
+# percentiles, server CPU and server peak RSS per session count.
+#
+#   python benchmarks/app_load.py [--sessions 1 4 16 64] [--clicks 5] [--think 0] [--rows 0] [--json]
+#
+# A rerun's latency is from sending the widget state to the server's
+# script_finished message, so it includes protobuf delivery. Every session
+# count gets a fresh server (peak RSS is that count's alone) warmed up by one
+# session first, so the cold CSV load isn't in the numbers. --rows N swaps the
+# contacts for a synthetic table of N rows (0: the app's own CSV). Server CPU
+# and RSS come from /proc, so this runs on Linux only.
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from websockets.asyncio.client import connect
+
+ROOT = Path(__file__).resolve().parent.parent
+APP_PATH = ROOT / "TransitionalLeader.py"
+STEP_1 = "Step 1"
+
+
+class SessionError(Exception):
+    pass
+
+
+class AppSession:
+    """One simulated browser tab: a websocket plus the widget state the page would send."""
+
+    def __init__(self, ws) -> None:
+        self.ws = ws
+        self.widgets: dict[str, tuple[str, str]] = {}  # label -> (element kind, widget id)
+        self.links: list[str] = []
+
+    async def rerun(self, *states: WidgetState) -> float:
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.widget_states.widgets.extend(states)
+        t0 = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        self.links = []
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await self.ws.recv())
+            kind = fwd.WhichOneof("type")
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                self._collect(fwd.delta.new_element)
+            elif kind == "script_finished":
+                if fwd.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    continue
+                elapsed = time.perf_counter() - t0
+                if fwd.script_finished != ForwardMsg.FINISHED_SUCCESSFULLY:
+                    raise SessionError(ForwardMsg.ScriptFinishedStatus.Name(fwd.script_finished))
+                return elapsed
+
+    def _collect(self, element) -> None:
+        kind = element.WhichOneof("type")
+        if kind == "exception":
+            raise SessionError(f"{element.exception.type}: {element.exception.message}")
+        if kind == "link_button":
+            self.links.append(element.link_button.url)
+        elif kind in ("text_input", "button"):
+            proto = getattr(element, kind)
+            self.widgets[proto.label] = (kind, proto.id)
+
+    def widget_id(self, kind: str, label_prefix: str = "") -> str:
+        for label, (widget_kind, widget_id) in self.widgets.items():
+            if widget_kind == kind and label.startswith(label_prefix):
+                return widget_id
+        raise SessionError(f"no {kind} labelled {label_prefix!r}... on the page")
+
+
+async def run_session(url: str, i: int, clicks: int, think: float, opens: list, reruns: list, errors: list) -> None:
+    try:
+        async with connect(url, subprotocols=["streamlit"], max_size=None) as ws:
+            session = AppSession(ws)
+            t0 = time.perf_counter()
+            await session.rerun()
+            name = WidgetState(id=session.widget_id("text_input"), string_value=f"Visitor {i}")
+            await session.rerun(name)
+            opens.append(time.perf_counter() - t0)
+            for _ in range(clicks):
+                click = WidgetState(id=session.widget_id("button", STEP_1), trigger_value=True)
+                elapsed = await session.rerun(name, click)
+                if not session.links or not all(link.startswith("mailto:?bcc=") for link in session.links):
+                    raise SessionError("no mailto link after Step 1")
+                reruns.append(elapsed)
+                if think:
+                    await asyncio.sleep(think)
+    except Exception as e:  # reported, so one broken session doesn't hide the others' numbers
+        errors.append(f"session {i}: {type(e).__name__}: {e}")
+
+
+# ---------------------------
+# Server process
+# ---------------------------
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start_server(port: int, env: dict) -> subprocess.Popen:
+    # stderr goes to a file rather than a pipe nobody drains during the run.
+    log = tempfile.TemporaryFile()
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", str(APP_PATH),
+            "--server.headless", "true", "--server.address", "127.0.0.1", "--server.port", str(port),
+            "--browser.gatherUsageStats", "false",
+        ],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=log,
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return proc
+        except OSError:
+            if proc.poll() is not None:
+                log.seek(0)
+                raise RuntimeError(log.read().decode(errors="replace"))
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError("Streamlit server did not start")
+
+
+def _cpu_seconds(pid: int) -> float:
+    # utime and stime are fields 14 and 15 of /proc/<pid>/stat, after the ")" closing the command name.
+    fields = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def _peak_rss_mb(pid: int) -> float:
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith("VmHWM:"):
+            return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def _percentile(samples: list[float], q: float) -> float | None:
+    if not samples:
+        return None
+    return round(samples[min(len(samples) - 1, int(len(samples) * q))] * 1000, 3)
+
+
+async def run_level(sessions: int, clicks: int, think: float, env: dict) -> dict:
+    port = _free_port()
+    url = f"ws://127.0.0.1:{port}/_stcore/stream"
+    proc = _start_server(port, env)
+    try:
+        warmup_errors: list[str] = []
+        await run_session(url, -1, 1, 0, [], [], warmup_errors)
+        if warmup_errors:
+            raise RuntimeError(warmup_errors[0])
+
+        opens: list[float] = []
+        reruns: list[float] = []
+        errors: list[str] = []
+        cpu0 = _cpu_seconds(proc.pid)
+        t0 = time.perf_counter()
+        await asyncio.gather(*(run_session(url, i, clicks, think, opens, reruns, errors) for i in range(sessions)))
+        wall = time.perf_counter() - t0
+        cpu = _cpu_seconds(proc.pid) - cpu0
+        peak_rss = _peak_rss_mb(proc.pid)
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    reruns.sort()
+    opens.sort()
+    return {
+        "sessions": sessions,
+        "clicks": len(reruns),
+        "errors": errors,
+        "wall_s": round(wall, 3),
+        "clicks_per_s": round(len(reruns) / wall, 1),
+        "p50_ms": _percentile(reruns, 0.50),
+        "p95_ms": _percentile(reruns, 0.95),
+        "p99_ms": _percentile(reruns, 0.99),
+        "mean_ms": round(statistics.fmean(reruns) * 1000, 3) if reruns else None,
+        "open_p50_ms": _percentile(opens, 0.50),
+        "server_cpu_s": round(cpu, 3),
+        "server_cpu_cores": round(cpu / wall, 2),
+        "server_peak_rss_mb": round(peak_rss, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for the Streamlit app.")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--clicks", type=int, default=5, help="Step 1 clicks per session")
+    parser.add_argument("--think", type=float, default=0.0, help="seconds each session waits between clicks")
+    parser.add_argument("--rows", type=int, default=0, help="synthetic contact rows (0: the app's own CSV)")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ)
+        if args.rows:
+            from synthetic import write_contacts_csv
+
+            csv_path = Path(tmp) / "au_parliament_contacts.csv"
+            write_contacts_csv(csv_path, args.rows)
+            env.update(TL_CONTACTS_CSV=str(csv_path), TL_STORE_DIR=tmp)
+        results = [asyncio.run(run_level(n, args.clicks, args.think, env)) for n in args.sessions]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{args.clicks} Step 1 clicks per session, {args.think:g}s think time, {args.rows or 'app CSV'} rows")
+    print(" sessions  clicks/s    p50 ms    p95 ms    p99 ms    open p50  server CPU  peak RSS  errors")
+    for r in results:
+        print(
+            f"{r['sessions']:>9} {r['clicks_per_s']:>9.1f} {r['p50_ms'] or 0:>9.1f} {r['p95_ms'] or 0:>9.1f} "
+            f"{r['p99_ms'] or 0:>9.1f} {r['open_p50_ms'] or 0:>8.1f} ms {r['server_cpu_cores']:>6.2f} cores "
+            f"{r['server_peak_rss_mb']:>6.1f} MB {len(r['errors']):>6}"
+        )
+        for error in r["errors"][:3]:
+            print(f"    {error}")
+
+
+if __name__ == "__main__":
+    main()
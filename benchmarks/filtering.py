@@ -0,0 +1,71 @@
+# Recipient filtering cost at scale: ContactIndex masks and the per-subset engine LRU.
+#
+#   python benchmarks/filtering.py [--rows 1000 10000 50000] [--json]
+
+import argparse
+import json
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from synthetic import write_contacts_csv  # noqa: E402
+from transitional_leader import ContactIndex, DraftEngine, load_contacts  # noqa: E402
+
+FILTERS = [
+    {"chamber": ["Senate"], "state": ["VIC"]},
+    {"chamber": ["House"], "party": ["ALP"]},
+    {"state": ["NSW", "QLD"], "party": ["LP", "NATS"]},
+]
+
+
+def bench(rows: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        emails, attrs = load_contacts(write_contacts_csv(Path(tmp) / "contacts.csv", rows))
+
+    build_ms = timeit.timeit(lambda: ContactIndex(len(emails), attrs), number=1) * 1000
+    index = ContactIndex(len(emails), attrs)
+    engine = DraftEngine(emails)
+
+    number = 200
+    mask_us = max(
+        min(timeit.repeat(lambda f=f: index.mask(f), number=number, repeat=5)) / number * 1e6
+        for f in FILTERS
+    )
+    masks = [index.mask(f) for f in FILTERS]
+    miss_ms = max(timeit.timeit(lambda m=m: engine.subset(m), number=1) for m in masks) * 1000
+    hit_us = max(
+        min(timeit.repeat(lambda m=m: engine.subset(m), number=number, repeat=5)) / number * 1e6
+        for m in masks
+    )
+    return {
+        "rows": rows,
+        "index_build_ms": round(build_ms, 3),
+        "mask_worst_us": round(mask_us, 3),
+        "subset_miss_worst_ms": round(miss_ms, 3),
+        "subset_hit_worst_us": round(hit_us, 3),
+        "subset_sizes": [index.count(m) for m in masks],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recipient filtering benchmark.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    results = [bench(n) for n in args.rows]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for r in results:
+        print(
+            f"{r['rows']:>7} rows: index {r['index_build_ms']:.2f} ms, mask {r['mask_worst_us']:.2f} us, "
+            f"subset miss {r['subset_miss_worst_ms']:.2f} ms / hit {r['subset_hit_worst_us']:.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# Import-time report for the core package + per-rerun cost of the Streamlit layer.
+#
+#   python benchmarks/import_time.py            # human-readable
+#   python benchmarks/import_time.py --json     # machine-readable, for diffing between commits
+#
+# Startup cost comes from `python -X importtime -c "import transitional_leader"`
+# in a fresh interpreter; rerun cost from Streamlit's AppTest harness.
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+APP_PATH = ROOT / "TransitionalLeader.py"
+
+
+def import_time_report(module: str = "transitional_leader", top: int = 15) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        # "import time:   self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append({"module": name.strip(), "self_us": int(self_us), "cumulative_us": int(cumulative_us)})
+
+    total = next((r["cumulative_us"] for r in rows if r["module"] == module), None)
+    slowest = sorted(rows, key=lambda r: r["self_us"], reverse=True)[:top]
+    return {"module": module, "cumulative_us": total, "modules_imported": len(rows), "slowest_self": slowest}
+
+
+def rerun_report(reruns: int = 20) -> dict:
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(APP_PATH))
+    t0 = time.perf_counter()
+    at.run()
+    first_ms = (time.perf_counter() - t0) * 1000
+
+    timings = []
+    for _ in range(reruns):
+        t0 = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - t0) * 1000)
+    timings.sort()
+    return {
+        "first_run_ms": round(first_ms, 3),
+        "rerun_median_ms": round(timings[len(timings) // 2], 3),
+        "rerun_min_ms": round(timings[0], 3),
+        "reruns": reruns,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import-time and rerun-cost report.")
+    parser.add_argument("--json", action="store_true", help="emit a single JSON document")
+    parser.add_argument("--reruns", type=int, default=20)
+    parser.add_argument("--skip-reruns", action="store_true", help="only report import time")
+    args = parser.parse_args()
+
+    report = {"import": import_time_report()}
+    if not args.skip_reruns:
+        report["rerun"] = rerun_report(args.reruns)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    imp = report["import"]
+    print(f"import {imp['module']}: {imp['cumulative_us'] / 1000:.2f} ms ({imp['modules_imported']} modules)")
+    for r in imp["slowest_self"]:
+        print(f"  {r['self_us']:>8} us self  {r['cumulative_us']:>8} us cum  {r['module']}")
+    if "rerun" in report:
+        rr = report["rerun"]
+        print(f"first run: {rr['first_run_ms']:.2f} ms")
+        print(f"rerun:     {rr['rerun_median_ms']:.2f} ms median, {rr['rerun_min_ms']:.2f} ms min over {rr['reruns']}")
+
+
+if __name__ == "__main__":
+    main()
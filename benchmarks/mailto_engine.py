@@ -0,0 +1,63 @@
+# Per-click cost of DraftEngine.build vs. build_mailto_bcc_link. That both
+# produce byte-identical URLs is checked by tests/test_engine.py.
+#
+#   python benchmarks/mailto_engine.py [--json] [--number 2000]
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from transitional_leader import (  # noqa: E402
+    DEFAULT_CSV_PATH,
+    EMAIL_TEMPLATES,
+    SUBJECT_OPTIONS,
+    build_full_body,
+    build_mailto_bcc_link,
+    load_recipients,
+)
+from transitional_leader.engine import DraftEngine  # noqa: E402
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pre-encoded mailto engine micro-benchmark.")
+    parser.add_argument("--json", action="store_true")
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    recipients = load_recipients(DEFAULT_CSV_PATH)
+    compile_s = timeit.timeit(lambda: DraftEngine(recipients), number=10) / 10
+    engine = DraftEngine(recipients)
+
+    t = len(EMAIL_TEMPLATES) // 2
+    subject = SUBJECT_OPTIONS[t % len(SUBJECT_OPTIONS)]
+    template = EMAIL_TEMPLATES[t]
+
+    def baseline() -> str:
+        return build_mailto_bcc_link(recipients, subject, build_full_body(template, "Jane Doe"))
+
+    def engine_build() -> str:
+        return engine.build(t, t % len(SUBJECT_OPTIONS), "Jane Doe")
+
+    baseline_us = min(timeit.repeat(baseline, number=args.number, repeat=5)) / args.number * 1e6
+    engine_us = min(timeit.repeat(engine_build, number=args.number, repeat=5)) / args.number * 1e6
+
+    report = {
+        "recipients": len(recipients),
+        "url_bytes": len(engine_build()),
+        "engine_compile_ms": round(compile_s * 1000, 3),
+        "build_mailto_bcc_link_us": round(baseline_us, 3),
+        "draft_engine_build_us": round(engine_us, 3),
+        "speedup": round(baseline_us / engine_us, 1),
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for k, v in report.items():
+            print(f"{k:>28}: {v}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# Email cleaning at scale, on a synthetic column with case-variant duplicates,
+# blanks, junk and multi-address cells mixed in:
+#   legacy     the original trim + "@" check + exact-match dedup loop
+#   per_row    the same normalisation as normalize_emails, one cell at a time
+#   normalize  normalize_emails
+#   floor      what any column-wise version must do at least: one regex pass,
+#              one case-insensitive hash dedup and the Python list it returns
+#
+# The request asked for 10x over legacy; that isn't reachable. On Arrow-backed
+# pandas the legacy loop is already ~0.4 us/row and the floor above costs about
+# as much, so normalize_emails is measured against per_row (the same checks)
+# and against the floor, and is expected to land near legacy, not 10x under it.
+#
+#   python benchmarks/normalize.py [--rows 1000 10000 100000] [--json]
+
+import argparse
+import json
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd  # noqa: E402
+from synthetic import make_rows  # noqa: E402
+from transitional_leader.normalize import _CANONICAL_PATTERN, normalize_address, normalize_emails  # noqa: E402
+
+
+def legacy_clean(column: pd.Series) -> list[str]:
+    # load_recipients before the normalisation stage, kept here for comparison.
+    # Under pandas 3, astype(str) keeps missing cells as NaN floats (which then
+    # crash the "@" check), so give it the "nan" strings pandas 2 produced.
+    emails = column.fillna("nan").astype(str).str.strip().replace({"nan": "", "None": ""}).tolist()
+    seen = set()
+    cleaned = []
+    for e in emails:
+        if not e:
+            continue
+        if "@" not in e:
+            continue
+        if e not in seen:
+            cleaned.append(e)
+            seen.add(e)
+    return cleaned
+
+
+def per_row_clean(column: pd.Series) -> list[str]:
+    seen = set()
+    cleaned = []
+    for cell in column.fillna("").tolist():
+        for e in normalize_address(cell)[0]:
+            key = e.lower()
+            if key not in seen:
+                cleaned.append(e)
+                seen.add(key)
+    return cleaned
+
+
+def floor_clean(column: pd.Series) -> list[str]:
+    cells = column.fillna("")
+    emails = cells[cells.str.fullmatch(_CANONICAL_PATTERN)]
+    return emails[~emails.str.lower().duplicated()].tolist()
+
+
+def dirty_column(n: int, seed: int = 0) -> pd.Series:
+    rng = random.Random(seed)
+    source = [r["email"] for r in make_rows(n, seed)]
+    emails = list(source)
+    for i in range(n):
+        roll = rng.random()
+        if roll < 0.05:
+            emails[i] = source[rng.randrange(i + 1)].upper().replace("@APH.GOV.AU", "@aph.gov.au")
+        elif roll < 0.06:
+            emails[i] = None
+        elif roll < 0.07:
+            emails[i] = rng.choice(["n/a", "TBC", "someone@", "a..b@aph.gov.au"])
+        elif roll < 0.075:
+            emails[i] = f" {emails[i]}; {rng.choice(source)} "
+    return pd.Series(emails, dtype="str")
+
+
+def bench(n: int) -> dict:
+    column = dirty_column(n)
+    legacy_s = min(timeit.repeat(lambda: legacy_clean(column), number=1, repeat=5))
+    per_row_s = min(timeit.repeat(lambda: per_row_clean(column), number=1, repeat=5))
+    new_s = min(timeit.repeat(lambda: normalize_emails(column), number=1, repeat=5))
+    floor_s = min(timeit.repeat(lambda: floor_clean(column), number=1, repeat=5))
+    result = normalize_emails(column)
+    assert result.emails == per_row_clean(column)
+    return {
+        "rows": n,
+        "legacy_ms": round(legacy_s * 1000, 2),
+        "per_row_ms": round(per_row_s * 1000, 2),
+        "normalize_ms": round(new_s * 1000, 2),
+        "floor_ms": round(floor_s * 1000, 2),
+        "speedup_vs_per_row": round(per_row_s / new_s, 1),
+        "speedup_vs_legacy": round(legacy_s / new_s, 1),
+        "legacy_kept": len(legacy_clean(column)),
+        "normalize_kept": len(result.emails),
+        "rejected": len(result.rejections),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Email normalisation benchmark.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    results = [bench(n) for n in args.rows]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for r in results:
+        print(
+            f"{r['rows']:>7} rows: legacy {r['legacy_ms']:.1f} ms ({r['legacy_kept']} kept), "
+            f"per-row {r['per_row_ms']:.1f} ms, floor {r['floor_ms']:.1f} ms, normalize {r['normalize_ms']:.1f} ms "
+            f"({r['normalize_kept']} kept, {r['rejected']} rejected); "
+            f"x{r['speedup_vs_per_row']} vs per-row, x{r['speedup_vs_legacy']} vs legacy"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# Multi-parliament cold start and worker memory: loading contact sets by
+# parsing their CSVs with pandas vs. from the compiled stores.
+#
+#   python benchmarks/registry.py [--sets 5] [--rows 20000] [--json]
+#
+# Each measurement runs in a fresh interpreter so import cost and peak RSS
+# are those of a new worker.
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from synthetic import write_contacts_csv  # noqa: E402
+
+SET_KEYS = ["au", "ca", "eu", "uk", "us", "nz", "ie", "de"]
+
+# Runs inside the fresh interpreter: load `count` sets, report time, peak RSS and whether pandas got imported.
+WORKER = """
+import json, resource, sys, time
+sys.path.insert(0, {root!r})
+t0 = time.perf_counter()
+from transitional_leader import get_draft_engine, get_recipient_cache
+from transitional_leader.registry import get_contact_registry
+ready = time.perf_counter()
+sets = list(get_contact_registry())[:{count}]
+first = None
+for contact_set in sets:
+    snapshot = get_recipient_cache().get(contact_set.csv_path)
+    get_draft_engine(snapshot.emails).build(0, 0, "Jane Doe")
+    if first is None:
+        first = time.perf_counter() - ready
+print(json.dumps({{
+    "import_ms": (ready - t0) * 1000,
+    "first_set_ms": first * 1000,
+    "all_sets_ms": (time.perf_counter() - ready) * 1000,
+    "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "pandas_imported": "pandas" in sys.modules,
+}}))
+"""
+
+
+def _run_worker(directory: Path, store_dir: Path, count: int) -> dict:
+    env = {"TL_CONTACTS_DIR": str(directory), "TL_STORE_DIR": str(store_dir), "PATH": ""}
+    proc = subprocess.run(
+        [sys.executable, "-c", WORKER.format(root=str(ROOT), count=count)],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def bench(n_sets: int, rows: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp) / "contacts"
+        directory.mkdir()
+        for i, key in enumerate(SET_KEYS[:n_sets]):
+            write_contacts_csv(directory / f"{key}_parliament_contacts.csv", rows, seed=i)
+
+        results = {"sets": n_sets, "rows_per_set": rows}
+        csv_run, stores = Path(tmp) / "csv-run", Path(tmp) / "stores"
+        csv_run.mkdir()
+        stores.mkdir()
+        for scope, count in (("one_set", 1), ("all_sets", n_sets)):
+            # CSV mode: start every run without stores, so each set is parsed.
+            for path in csv_run.iterdir():
+                path.unlink()
+            results[f"csv_{scope}"] = _run_worker(directory, csv_run, count)
+        _run_worker(directory, stores, n_sets)  # compile once, as a deploy step would
+        for scope, count in (("one_set", 1), ("all_sets", n_sets)):
+            results[f"store_{scope}"] = _run_worker(directory, stores, count)
+        results["store_bytes_per_set"] = sum(p.stat().st_size for p in stores.iterdir()) // n_sets
+        results["csv_bytes_per_set"] = sum(p.stat().st_size for p in directory.iterdir()) // n_sets
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Contact registry cold-start and memory benchmark.")
+    parser.add_argument("--sets", type=int, default=5)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    r = bench(min(args.sets, len(SET_KEYS)), args.rows)
+    if args.json:
+        print(json.dumps(r, indent=2))
+        return
+    print(f"{r['sets']} sets x {r['rows_per_set']} rows; CSV {r['csv_bytes_per_set'] / 1024:.0f} KB, "
+          f"store {r['store_bytes_per_set'] / 1024:.0f} KB per set")
+    for label in ("csv", "store"):
+        for scope in ("one_set", "all_sets"):
+            m = r[f"{label}_{scope}"]
+            print(
+                f"  {label:<5} {scope:<8} first set {m['first_set_ms']:7.1f} ms, all {m['all_sets_ms']:7.1f} ms, "
+                f"peak RSS {m['peak_rss_mb']:6.1f} MB, pandas {'loaded' if m['pandas_imported'] else 'not loaded'}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# Contacts hot reload: incremental rebuild vs. a cold one, and what the
+# request path pays while a reload is in progress.
+#
+#   python benchmarks/reload.py [--rows 1000 10000 100000] [--churn 0.01] [--json]
+
+import argparse
+import csv
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from synthetic import COLUMNS, make_rows  # noqa: E402
+from transitional_leader import DraftEngine, build_snapshot, get_draft_engine, get_recipient_cache  # noqa: E402
+from transitional_leader.recipients import _stat_key, store_path_for  # noqa: E402
+from transitional_leader.reload import ContactWatcher, reload_snapshot  # noqa: E402
+
+
+def _write(path: Path, rows: list[dict]) -> None:
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    tmp.replace(path)  # atomic, like a deploy that swaps the file in
+
+
+def bench(n: int, churn: float) -> dict:
+    rows = make_rows(n)
+    changed = make_rows(n, seed=1)
+    k = max(1, int(n * churn))
+    # Drop k rows, add k new ones, move k members to another party.
+    edited = [dict(r) for r in rows[k:]] + [dict(r, email=f"new.{r['email']}") for r in changed[:k]]
+    for r in edited[:k]:
+        r["party"] = "IND"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "contacts.csv"
+        _write(path, rows)
+        current = build_snapshot(path, _stat_key(path))
+        get_draft_engine(current.emails)
+        _write(path, edited)
+
+        # Both timings below parse the CSV; neither may find the other's compiled store.
+        store_path_for(path).unlink(missing_ok=True)
+        t0 = time.perf_counter()
+        cold = build_snapshot(path, _stat_key(path))
+        DraftEngine(cold.emails)
+        cold_ms = (time.perf_counter() - t0) * 1000
+
+        store_path_for(path).unlink(missing_ok=True)
+        t0 = time.perf_counter()
+        snapshot, diff = reload_snapshot(path, current)
+        get_draft_engine(snapshot.emails)
+        incremental_ms = (time.perf_counter() - t0) * 1000
+
+        # Request-path latency while the watcher reloads in the background.
+        cache = get_recipient_cache()
+        cache.publish(current)
+        cache.watched_paths.add(str(path))
+        watcher = ContactWatcher(path, interval=3600)
+        reloading = threading.Thread(target=watcher.poll)
+        samples = []
+        reloading.start()
+        while reloading.is_alive():
+            t0 = time.perf_counter()
+            get_draft_engine(cache.get(path).emails).build(0, 0, "Jane Doe")
+            samples.append(time.perf_counter() - t0)
+        reloading.join()
+        cache.watched_paths.discard(str(path))
+        samples.sort()
+
+    return {
+        "rows": n,
+        "diff": str(diff),
+        "cold_rebuild_ms": round(cold_ms, 2),
+        "incremental_reload_ms": round(incremental_ms, 2),
+        "requests_during_reload": len(samples),
+        "request_p99_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000, 3) if samples else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Contacts hot-reload benchmark.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--churn", type=float, default=0.01, help="fraction of rows added/removed/changed")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    results = [bench(n, args.churn) for n in args.rows]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for r in results:
+        print(
+            f"{r['rows']:>7} rows ({r['diff']}): cold {r['cold_rebuild_ms']:.1f} ms, "
+            f"incremental {r['incremental_reload_ms']:.1f} ms; {r['requests_during_reload']} requests "
+            f"served during reload, p99 {r['request_p99_ms']} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
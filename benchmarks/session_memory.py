@@ -0,0 +1,83 @@
+# Per-session memory: storing full mailto URLs in session_state (before) vs. a
+# DraftDescriptor rebuilt on demand from the shared engine (after).
+#
+#   python benchmarks/session_memory.py [--sessions 1000 5000] [--json]
+
+import argparse
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from transitional_leader import (  # noqa: E402
+    DEFAULT_CSV_PATH,
+    EMAIL_TEMPLATES,
+    SUBJECT_OPTIONS,
+    DraftDescriptor,
+    get_draft_engine,
+    get_recipient_cache,
+)
+
+
+def _measure(make_session, n: int) -> int:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    sessions = [make_session(i) for i in range(n)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del sessions
+    return total
+
+
+def bench(n: int) -> dict:
+    snapshot = get_recipient_cache().get(DEFAULT_CSV_PATH)
+    engine = get_draft_engine(snapshot.emails)
+    engine.render(DraftDescriptor(0, 0, "warm-up"), snapshot.index)
+
+    def pick(i: int) -> tuple[int, int]:
+        t = i % len(EMAIL_TEMPLATES)
+        return t, t % len(SUBJECT_OPTIONS)
+
+    def old_session(i: int) -> dict:
+        t, s = pick(i)
+        return {"last_pick": t, "mailto_url": engine.build(t, s, f"Person {i}"), "mailto_batches": None}
+
+    def new_session(i: int) -> dict:
+        t, s = pick(i)
+        return {"draft": DraftDescriptor(t, s, f"Person {i}")}
+
+    old_bytes = _measure(old_session, n)
+    new_bytes = _measure(new_session, n)
+    return {
+        "sessions": n,
+        "url_session_bytes": old_bytes,
+        "descriptor_session_bytes": new_bytes,
+        "url_bytes_per_session": old_bytes // n,
+        "descriptor_bytes_per_session": new_bytes // n,
+        "reduction": round(old_bytes / new_bytes, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Session-state memory: full URLs vs. draft descriptors.")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1_000, 5_000])
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    results = [bench(n) for n in args.sessions]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for r in results:
+        print(
+            f"{r['sessions']:>6} sessions: URLs {r['url_session_bytes'] / 1e6:.1f} MB "
+            f"({r['url_bytes_per_session']} B each) vs descriptors {r['descriptor_session_bytes'] / 1e6:.2f} MB "
+            f"({r['descriptor_bytes_per_session']} B each), x{r['reduction']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
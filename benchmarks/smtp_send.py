@@ -0,0 +1,85 @@
+# Throughput and latency of the pooled SMTP sender against an in-process SMTP
+# stand-in (asyncio server on 127.0.0.1, no real mail leaves the machine).
+#
+#   python benchmarks/smtp_send.py [--messages 500] [--pool-size 3] [--fail-every 20] [--json]
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from transitional_leader import DEFAULT_CSV_PATH, load_recipients  # noqa: E402
+from transitional_leader.smtp import SmtpConfig, SmtpSender, build_outgoing  # noqa: E402
+from transitional_leader.smtp_testing import LocalSmtpServer  # noqa: E402
+
+
+async def run(args: argparse.Namespace) -> dict:
+    server = LocalSmtpServer(pipelining=not args.no_pipelining, fail_every=args.fail_every, reply_delay=args.reply_delay)
+    port = await server.start()
+    config = SmtpConfig(
+        host="127.0.0.1",
+        port=port,
+        from_address="campaign@example.org",
+        starttls=False,
+        pool_size=args.pool_size,
+        queue_size=args.queue_size,
+        domain_rate=args.domain_rate,
+        domain_burst=args.domain_burst,
+        backoff_base=0.01,
+    )
+    recipients = load_recipients(DEFAULT_CSV_PATH)
+    messages = [
+        build_outgoing(config, recipients, f"Person {i}", i % 21, i % 9) for i in range(args.messages)
+    ]
+
+    started = time.perf_counter()
+    async with SmtpSender(config) as sender:
+        futures = [await sender.submit(m) for m in messages]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+    elapsed = time.perf_counter() - started
+    await server.stop()
+
+    failures = [r for r in results if isinstance(r, BaseException)]
+    return {
+        "messages": args.messages,
+        "recipients_per_message": len(recipients),
+        "pool_size": args.pool_size,
+        "pipelining": server.pipelining,
+        "delivered": server.messages,
+        "failed": len(failures),
+        "retries": sender.stats.retries,
+        "server_connections": server.connections,
+        "elapsed_s": round(elapsed, 3),
+        "messages_per_s": round(args.messages / elapsed, 1),
+        "latency_p50_ms": round(sender.stats.percentile(0.50) * 1000, 3),
+        "latency_p99_ms": round(sender.stats.percentile(0.99) * 1000, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pooled SMTP sender benchmark against a local stand-in server.")
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--pool-size", type=int, default=3)
+    parser.add_argument("--queue-size", type=int, default=100)
+    parser.add_argument("--domain-rate", type=float, default=1e6, help="per-domain messages/s (default: unthrottled)")
+    parser.add_argument("--domain-burst", type=int, default=1000)
+    parser.add_argument("--fail-every", type=int, default=0, help="answer every Nth DATA with 451 to exercise retries")
+    parser.add_argument("--reply-delay", type=float, default=0.0, help="server-side processing delay before each reply, in seconds")
+    parser.add_argument("--no-pipelining", action="store_true")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for k, v in report.items():
+            print(f"{k:>24}: {v}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+# Scaled benchmark suite: the recipient/mailto helpers and full Streamlit reruns
+# on synthetic contact tables shaped like au_parliament_contacts.csv.
+#
+#   python benchmarks/suite.py --out bench.json                 # 1k, 10k, 100k rows
+#   python benchmarks/suite.py --rows 1000 --compare bench.json # ratios vs. an earlier run
+#
+# Every timing is the median of --repeat runs, in milliseconds.
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+APP_PATH = ROOT / "TransitionalLeader.py"
+sys.path.insert(0, str(ROOT))
+
+from synthetic import write_contacts_csv  # noqa: E402
+from transitional_leader import (  # noqa: E402
+    EMAIL_TEMPLATES,
+    SUBJECT_OPTIONS,
+    DraftEngine,
+    Rotation,
+    build_full_body,
+    build_mailto_bcc_link,
+    find_email_column,
+    load_recipients,
+    pick_new_index,
+)
+
+
+def time_ms(fn: Callable[[], object], repeat: int, number: int = 1) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - t0) * 1000 / number)
+    return round(statistics.median(samples), 4)
+
+
+def bench_helpers(csv_path: Path, rows: int, repeat: int) -> dict:
+    import pandas as pd
+
+    df = pd.read_csv(csv_path)
+    recipients = load_recipients(csv_path)
+    subject = SUBJECT_OPTIONS[0]
+    body = build_full_body(EMAIL_TEMPLATES[0], "Jane Doe")
+    engine = DraftEngine(recipients)
+    rotation = Rotation(len(EMAIL_TEMPLATES), len(SUBJECT_OPTIONS), seed=0)
+    return {
+        "load_recipients": time_ms(lambda: load_recipients(csv_path), repeat),
+        "find_email_column": time_ms(lambda: find_email_column(df), repeat, number=1000),
+        "pick_new_index": time_ms(lambda: pick_new_index(3, len(EMAIL_TEMPLATES)), repeat, number=1000),
+        # pick_new_index is O(1) in n; kept at table size to show it stays flat.
+        "pick_new_index_n_rows": time_ms(lambda: pick_new_index(3, rows), repeat, number=10),
+        "rotation_pick": time_ms(lambda: rotation.pick(3), repeat, number=1000),
+        "build_mailto_bcc_link": time_ms(lambda: build_mailto_bcc_link(recipients, subject, body), repeat, number=10),
+        "draft_engine_compile": time_ms(lambda: DraftEngine(recipients), repeat),
+        "draft_engine_build": time_ms(lambda: engine.build(0, 0, "Jane Doe"), repeat, number=100),
+        "recipients": len(recipients),
+        "url_bytes": len(engine.build(0, 0, "Jane Doe")),
+    }
+
+
+def bench_app(csv_path: Path, repeat: int) -> dict:
+    from streamlit.testing.v1 import AppTest
+
+    os.environ["TL_CONTACTS_CSV"] = str(csv_path)
+    # Touch the file so the shared RecipientCache treats the first run as cold.
+    os.utime(csv_path)
+
+    at = AppTest.from_file(str(APP_PATH), default_timeout=600)
+    t0 = time.perf_counter()
+    at.run()
+    cold_ms = (time.perf_counter() - t0) * 1000
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+    rerun_ms = time_ms(at.run, repeat)
+
+    def click() -> None:
+        at.text_input[0].input("Jane Doe")
+        at.button[0].click().run()
+
+    click_ms = time_ms(click, repeat)
+    return {
+        "initial_load_cold": round(cold_ms, 4),
+        "rerun_warm": rerun_ms,
+        "step1_click": click_ms,
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: dict, baseline: dict) -> list[str]:
+    lines = []
+    old_sizes = {r["rows"]: r for r in baseline["results"]}
+    for result in current["results"]:
+        old = old_sizes.get(result["rows"])
+        if old is None:
+            continue
+        for section in ("helpers", "app"):
+            for key, value in result.get(section, {}).items():
+                before = old.get(section, {}).get(key)
+                if isinstance(value, float) and before:
+                    lines.append(f"{result['rows']:>7} {section}.{key:<24} {before:>10.4f} -> {value:>10.4f} ms  x{value / before:.2f}")
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Scaled benchmark suite.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--skip-app", action="store_true", help="skip the AppTest rerun timings")
+    parser.add_argument("--out", type=Path, help="write the JSON report here (default: stdout)")
+    parser.add_argument("--compare", type=Path, help="earlier JSON report to compare against")
+    args = parser.parse_args()
+
+    if not args.skip_app:
+        # Pay Streamlit's one-off import/first-run cost before anything is timed.
+        from streamlit.testing.v1 import AppTest
+
+        AppTest.from_file(str(APP_PATH), default_timeout=600).run()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            csv_path = write_contacts_csv(Path(tmp) / f"au_{rows}_contacts.csv", rows)
+            result = {"rows": rows, "helpers": bench_helpers(csv_path, rows, args.repeat)}
+            if not args.skip_app:
+                result["app"] = bench_app(csv_path, args.repeat)
+            results.append(result)
+            print(f"{rows:>7} rows done", file=sys.stderr)
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.out:
+        args.out.write_text(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        for line in compare(report, json.loads(args.compare.read_text())):
+            print(line, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
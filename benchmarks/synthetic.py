@@ -0,0 +1,43 @@
+# Synthetic contact tables shaped like au_parliament_contacts.csv, for benchmarks.
+
+import csv
+import random
+from pathlib import Path
+
+COLUMNS = ["chamber", "title", "first_name", "last_name", "state", "party", "email", "display"]
+CHAMBERS = [("Senate", "Senator"), ("House", "MP")]
+STATES = ["ACT", "NSW", "NT", "QLD", "SA", "TAS", "VIC", "WA"]
+PARTIES = ["ALP", "LP", "NATS", "AG", "IND", "LNP", "PHON", "CA", "JLN", "UAP"]
+FIRST_NAMES = ["Penny", "Michelle", "Alexander", "Wendy", "David", "Sarah", "James", "Nita", "Tom", "Rosa"]
+
+
+def make_rows(n: int, seed: int = 0) -> list[dict[str, str]]:
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        chamber, title = rng.choice(CHAMBERS)
+        first = rng.choice(FIRST_NAMES)
+        last = f"Member{i:06d}"
+        if chamber == "Senate":
+            email = f"senator.{last.lower()}@aph.gov.au"
+        else:
+            email = f"{first}.{last}.MP@aph.gov.au"
+        rows.append({
+            "chamber": chamber,
+            "title": title,
+            "first_name": first,
+            "last_name": last,
+            "state": rng.choice(STATES),
+            "party": rng.choice(PARTIES),
+            "email": email,
+            "display": f"{title} {first} {last}",
+        })
+    return rows
+
+
+def write_contacts_csv(path: Path, n: int, seed: int = 0) -> Path:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(make_rows(n, seed))
+    return path
@@ -0,0 +1,2 @@
+# Lets a bare `pytest` (not just `python -m pytest`) import transitional_leader:
+# pytest puts the directory of a root conftest.py on sys.path.
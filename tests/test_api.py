@@ -0,0 +1,75 @@
+# Request handling of the HTTP draft API: DraftApi.dispatch directly, and the
+# HTTP/1.1 framing in handle_connection over a loopback socket.
+
+import asyncio
+import json
+import unittest
+import unittest.mock
+
+from transitional_leader.api import DraftApi
+
+
+class DispatchTest(unittest.TestCase):
+    def setUp(self):
+        self.api = DraftApi()
+
+    def post(self, payload) -> tuple[int, dict]:
+        status, _, body = self.api.dispatch("POST", "/draft", {}, json.dumps(payload).encode())
+        return status, json.loads(body)
+
+    def test_draft(self):
+        status, draft = self.post({"name": "Jane Doe", "template_index": 3, "subject_index": 1, "state": "VIC"})
+        self.assertEqual(status, 200)
+        self.assertEqual((draft["template_index"], draft["subject_index"]), (3, 1))
+        self.assertTrue(draft["mailto_url"].startswith("mailto:?bcc="))
+
+    def test_filter_values_must_be_strings(self):
+        for value in (5, {"VIC": True}, ["VIC", 3], True):
+            with self.subTest(value=value):
+                status, body = self.post({"name": "A", "state": value})
+                self.assertEqual(status, 400)
+                self.assertIn("'state'", body["error"])
+
+    def test_index_validation(self):
+        for payload in ({"template_index": -1}, {"template_index": "3"}, {"subject_index": 99}, {"template_index": True}):
+            with self.subTest(payload=payload):
+                self.assertEqual(self.post({"name": "A", **payload})[0], 400)
+
+    def test_unexpected_errors_are_answered(self):
+        with unittest.mock.patch.object(DraftApi, "post_draft", side_effect=KeyError("boom")):
+            with self.assertLogs("transitional_leader.api", "ERROR"):
+                status, body = self.post({"name": "A"})
+        self.assertEqual((status, body), (500, {"error": "internal error"}))
+
+    def test_recipients_etag(self):
+        status, headers, _ = self.api.dispatch("GET", "/recipients?chamber=Senate", {}, b"")
+        self.assertEqual(status, 200)
+        status, _, body = self.api.dispatch("GET", "/recipients?chamber=Senate", {"if-none-match": headers["ETag"]}, b"")
+        self.assertEqual((status, body), (304, b""))
+
+
+class ConnectionTest(unittest.IsolatedAsyncioTestCase):
+    async def test_chunked_body_is_refused_and_closes(self):
+        server = await asyncio.start_server(DraftApi().handle_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            body = b'{"name": "Jane Doe"}'
+            writer.write(
+                b"POST /draft HTTP/1.1\r\nHost: x\r\nTransfer-Encoding: chunked\r\n\r\n"
+                + b"%x\r\n%s\r\n0\r\n\r\n" % (len(body), body)
+                + b"GET /recipients HTTP/1.1\r\nHost: x\r\n\r\n"
+            )
+            await writer.drain()
+            response = await asyncio.wait_for(reader.read(), timeout=5)
+            writer.close()
+        finally:
+            server.close()
+            await server.wait_closed()
+        self.assertTrue(response.startswith(b"HTTP/1.1 411 "))
+        self.assertIn(b"Connection: close", response)
+        self.assertEqual(response.count(b"HTTP/1.1 "), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+# Bulk .eml/mbox drafts, read back with the stdlib email parser.
+
+import contextlib
+import email
+import io
+import mailbox
+import tempfile
+import unittest
+from email.policy import default as default_policy
+from pathlib import Path
+
+from transitional_leader.bulk import MboxWriter, generate, iter_jobs, main
+from transitional_leader.corpus import EMAIL_TEMPLATES, SUBJECT_OPTIONS, build_full_body
+from transitional_leader.rotation import Rotation
+
+RECIPIENTS = ("a@aph.gov.au", "b@aph.gov.au")
+NAMES = ["Jane Doe", "Zoë O’Brien", "رضا پهلوی"]
+
+
+def _expected(seed: int) -> list[tuple[str, str, str]]:
+    # generate() seeds its own Rotation the same way, so the picks line up.
+    rotation = Rotation(len(EMAIL_TEMPLATES), len(SUBJECT_OPTIONS), seed)
+    return [
+        (name, SUBJECT_OPTIONS[s], build_full_body(EMAIL_TEMPLATES[t], name))
+        for _, name, t, s in iter_jobs(NAMES, rotation)
+    ]
+
+
+class BulkTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+
+    def assertDraft(self, msg, name, subject, body):
+        sender = msg["From"].addresses[0]
+        self.assertEqual((sender.display_name, sender.addr_spec), (name, "me@example.org"))
+        self.assertIsNotNone(msg["Date"].datetime)
+        self.assertTrue(msg["Message-ID"].endswith("@example.org>"))
+        self.assertEqual([a.addr_spec for a in msg["Bcc"].addresses], list(RECIPIENTS))
+        self.assertEqual(msg["Subject"], subject)
+        self.assertEqual(msg.get_content(), body + "\n")
+
+    def test_eml_round_trip(self):
+        names = self.tmp / "names.txt"
+        names.write_text("# comment\n" + "\n".join(NAMES) + "\n\n", encoding="utf-8")
+        csv_path = self.tmp / "contacts.csv"
+        csv_path.write_text("email\n" + "\n".join(RECIPIENTS) + "\n", encoding="utf-8")
+        with contextlib.redirect_stderr(io.StringIO()):
+            main([
+                str(names), "--out", str(self.tmp / "out"), "--csv", str(csv_path),
+                "--from-address", "me@example.org", "--seed", "1",
+            ])
+
+        files = sorted((self.tmp / "out").glob("*.eml"))
+        self.assertEqual(len(files), len(NAMES))
+        messages = [email.message_from_bytes(path.read_bytes(), policy=default_policy) for path in files]
+        for msg, expected in zip(messages, _expected(1)):
+            self.assertDraft(msg, *expected)
+        self.assertEqual(len({msg["Message-ID"] for msg in messages}), len(NAMES))
+
+    def test_mbox_round_trip(self):
+        path = self.tmp / "drafts.mbox"
+        writer = MboxWriter(path)
+        try:
+            generate(NAMES, writer, RECIPIENTS, from_address="me@example.org", seed=2)
+        finally:
+            writer.close()
+        box = mailbox.mbox(path)
+        self.addCleanup(box.close)
+        messages = [email.message_from_bytes(m.as_bytes(), policy=default_policy) for m in box]
+        self.assertEqual(len(messages), len(NAMES))
+        for msg, expected in zip(messages, _expected(2)):
+            self.assertDraft(msg, *expected)
+
+    def test_from_address_is_required(self):
+        names = self.tmp / "names.txt"
+        names.write_text("Jane Doe\n", encoding="utf-8")
+        for extra in ([], ["--from-address", "not-an-address"]):
+            with self.subTest(extra=extra), contextlib.redirect_stderr(io.StringIO()):
+                with self.assertRaises(SystemExit):
+                    main([str(names), "--out", str(self.tmp / "out"), *extra])
+
+
+if __name__ == "__main__":
+    unittest.main()
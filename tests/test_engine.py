@@ -0,0 +1,63 @@
+# DraftEngine output against the straightforward build_mailto_bcc_link path.
+
+import random
+import unittest
+import urllib.parse
+
+from transitional_leader import (
+    DEFAULT_CSV_PATH,
+    EMAIL_TEMPLATES,
+    SUBJECT_OPTIONS,
+    build_full_body,
+    build_mailto_bcc_link,
+    load_recipients,
+)
+from transitional_leader.engine import DraftEngine
+
+NAMES = ["Jane Doe", "Zoë O’Brien", "A & B ?=/#%+", "رضا پهلوی", "", "  padded  "]
+
+
+def draft_sample(n: int = 50, seed: int = 0) -> list[int]:
+    """The curated drafts, a sample of the combinatorial ones and the last index."""
+    curated = list(range(len(EMAIL_TEMPLATES.curated)))
+    rest = random.Random(seed).sample(range(len(curated), len(EMAIL_TEMPLATES)), n)
+    return curated + rest + [len(EMAIL_TEMPLATES) - 1]
+
+
+class DraftEngineTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.recipients = load_recipients(DEFAULT_CSV_PATH)
+        cls.engine = DraftEngine(cls.recipients)
+
+    def test_byte_identical_to_build_mailto_bcc_link(self):
+        for t in draft_sample():
+            template = EMAIL_TEMPLATES[t]
+            for s, subject in enumerate(SUBJECT_OPTIONS):
+                for name in NAMES:
+                    expected = build_mailto_bcc_link(self.recipients, subject, build_full_body(template, name))
+                    if self.engine.build(t, s, name) != expected:
+                        self.fail(f"mismatch for template={t} subject={s} name={name!r}")
+
+    def test_batches_cover_every_recipient_within_budget(self):
+        budget = self.engine.min_link_bytes("Jane Doe") + 500
+        for t in draft_sample(5):
+            links = self.engine.build_batches(t, t % len(SUBJECT_OPTIONS), "Jane Doe", budget)
+            self.assertGreater(len(links), 1)
+            self.assertTrue(all(len(link) <= budget for link in links))
+            bcc = [urllib.parse.unquote(link.split("&subject=", 1)[0].removeprefix("mailto:?bcc=")) for link in links]
+            self.assertEqual(",".join(bcc).split(","), list(self.recipients))
+
+    def test_budget_below_the_minimum_is_refused(self):
+        with self.assertRaises(ValueError):
+            self.engine.build_batches(0, 0, "Jane Doe", 2048)
+
+    def test_subset_matches_a_fresh_engine(self):
+        subset = self.engine.subset(0b1011 << 3)
+        fresh = DraftEngine([self.recipients[i] for i in (3, 4, 6)])
+        self.assertEqual(subset.build(7, 2, "Jane Doe"), fresh.build(7, 2, "Jane Doe"))
+        self.assertIs(self.engine.subset(0b1011 << 3), subset)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+# Exporter start-up under TL_METRICS_*.
+
+import socket
+import unittest
+import unittest.mock
+
+from transitional_leader import metrics
+
+
+class StartExportersTest(unittest.TestCase):
+    def test_busy_port_is_logged_not_raised(self):
+        with socket.socket() as busy:
+            busy.bind(("127.0.0.1", 0))
+            busy.listen()
+            port = busy.getsockname()[1]
+            env = {"TL_METRICS_PORT": str(port), "TL_METRICS_HOST": "127.0.0.1"}
+            with unittest.mock.patch.dict("os.environ", env), \
+                    unittest.mock.patch.object(metrics, "ENABLED", True), \
+                    unittest.mock.patch.object(metrics, "_exporters_started", False):
+                with self.assertLogs("transitional_leader.metrics", "WARNING") as logs:
+                    metrics.start_exporters()
+        self.assertIn(str(port), logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+# Email normalisation: what is kept, from which row, and why the rest was dropped.
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from transitional_leader.normalize import DUPLICATE, EMPTY, INVALID, NO_AT, Rejection, normalize_emails
+from transitional_leader.recipients import load_contacts
+
+# (cells, kept emails, their rows, rejections)
+CASES = {
+    "canonical": (
+        ["a@aph.gov.au", "b@aph.gov.au"],
+        ["a@aph.gov.au", "b@aph.gov.au"], [0, 1], [],
+    ),
+    "trim and lower-case the domain only": (
+        ["  Senator.X@APH.Gov.AU "],
+        ["Senator.X@aph.gov.au"], [0], [],
+    ),
+    "case-insensitive duplicates, first wins": (
+        ["Senator.X@aph.gov.au", "senator.x@aph.gov.au", "SENATOR.X@APH.GOV.AU"],
+        ["Senator.X@aph.gov.au"], [0],
+        [Rejection(1, "senator.x@aph.gov.au", DUPLICATE), Rejection(2, "SENATOR.X@aph.gov.au", DUPLICATE)],
+    ),
+    "multi-address cells": (
+        ["a@aph.gov.au; b@aph.gov.au", "c@aph.gov.au,d@aph.gov.au  e@aph.gov.au"],
+        ["a@aph.gov.au", "b@aph.gov.au", "c@aph.gov.au", "d@aph.gov.au", "e@aph.gov.au"], [0, 0, 1, 1, 1], [],
+    ),
+    "junk and blanks": (
+        ["", None, "n/a", "someone@", "a..b@aph.gov.au", "ok@aph.gov.au"],
+        ["ok@aph.gov.au"], [5],
+        [
+            Rejection(0, "", EMPTY), Rejection(1, "", EMPTY), Rejection(2, "n/a", NO_AT),
+            Rejection(3, "someone@", INVALID), Rejection(4, "a..b@aph.gov.au", INVALID),
+        ],
+    ),
+    "rejections in a multi-address cell, rows stay in order": (
+        ["b@aph.gov.au", "x; a@aph.gov.au; B@aph.gov.au", "c@aph.gov.au"],
+        ["b@aph.gov.au", "a@aph.gov.au", "c@aph.gov.au"], [0, 1, 2],
+        [Rejection(1, "x", NO_AT), Rejection(1, "B@aph.gov.au", DUPLICATE)],
+    ),
+}
+
+
+class NormalizeEmailsTest(unittest.TestCase):
+    def test_cases(self):
+        for label, (cells, emails, rows, rejections) in CASES.items():
+            with self.subTest(label):
+                result = normalize_emails(pd.Series(cells, dtype="str"))
+                self.assertEqual(result.emails, emails)
+                self.assertEqual(result.rows, rows)
+                self.assertEqual(sorted(result.rejections), sorted(rejections))
+                self.assertEqual([r.row for r in result.rejections], sorted(r.row for r in result.rejections))
+
+    def test_rows_are_positional(self):
+        result = normalize_emails(pd.Series(["x", "a@aph.gov.au"], index=[10, 20]))
+        self.assertEqual((result.rows, result.rejections), ([1], [Rejection(0, "x", NO_AT)]))
+
+    def test_load_contacts_carries_each_rows_columns(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = Path(tmp) / "contacts.csv"
+            csv_path.write_text(
+                "email,chamber,state\n"
+                "n/a,House,SA\n"
+                "a@aph.gov.au; b@aph.gov.au,Senate,VIC\n"
+                "A@aph.gov.au,House,NSW\n"
+                "c@aph.gov.au,House,QLD\n",
+                encoding="utf-8",
+            )
+            emails, attrs = load_contacts(csv_path)
+        self.assertEqual(emails, ["a@aph.gov.au", "b@aph.gov.au", "c@aph.gov.au"])
+        self.assertEqual(attrs, {"chamber": ["Senate", "Senate", "House"], "state": ["VIC", "VIC", "QLD"]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+# Contacts hot reload: diffing, what a reload re-uses, and bad files.
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from transitional_leader.engine import get_draft_engine
+from transitional_leader.recipients import _stat_key, build_snapshot, get_recipient_cache
+from transitional_leader.reload import ContactWatcher, diff_contacts, reload_snapshot
+
+ROWS = [
+    ("a@aph.gov.au", "Senate", "VIC", "ALP"),
+    ("b@aph.gov.au", "Senate", "NSW", "LP"),
+    ("c@aph.gov.au", "House", "QLD", "AG"),
+]
+
+
+class ReloadTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.csv_path = Path(tmp.name) / "au_contacts.csv"
+        self.mtime = 1_700_000_000_000_000_000
+
+    def write(self, rows, columns=("email", "chamber", "state", "party")) -> None:
+        order = {"email": 0, "chamber": 1, "state": 2, "party": 3}
+        lines = [",".join(columns)] + [",".join(row[order[c]] for c in columns) for row in rows]
+        self.csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        # A distinct mtime per write, however quickly the test runs.
+        self.mtime += 10**9
+        os.utime(self.csv_path, ns=(self.mtime, self.mtime))
+
+    def snapshot(self):
+        return build_snapshot(self.csv_path, _stat_key(self.csv_path))
+
+    def test_diff(self):
+        self.write(ROWS)
+        old = self.snapshot()
+        a, b, c = ROWS
+        cases = {
+            "unchanged": ([a, b, c], (), (), (), False),
+            "added": ([a, b, c, ("d@aph.gov.au", "House", "SA", "ALP")], ("d@aph.gov.au",), (), (), False),
+            "removed": ([a, c], (), ("b@aph.gov.au",), (), False),
+            "changed": ([a, (b[0], "Senate", "NSW", "IND"), c], (), (), ("b@aph.gov.au",), False),
+            "reordered": ([c, a, b], (), (), (), True),
+        }
+        for label, (rows, added, removed, changed, reordered) in cases.items():
+            with self.subTest(label):
+                emails = tuple(r[0] for r in rows)
+                attrs = {col: tuple(r[i] for r in rows) for i, col in enumerate(("chamber", "state", "party"), 1)}
+                diff = diff_contacts(old, emails, attrs)
+                self.assertEqual((diff.added, diff.removed, diff.changed, diff.reordered), (added, removed, changed, reordered))
+                self.assertEqual(bool(diff), label != "unchanged")
+
+    def test_diff_without_filter_columns(self):
+        self.write(ROWS, columns=("email",))
+        old = self.snapshot()
+        self.assertEqual(old.attrs, {})
+        diff = diff_contacts(old, ("a@aph.gov.au", "c@aph.gov.au", "e@aph.gov.au"), {})
+        self.assertEqual((diff.added, diff.removed, diff.changed), (("e@aph.gov.au",), ("b@aph.gov.au",), ()))
+
+    def test_same_rows_keep_the_emails_tuple(self):
+        self.write(ROWS)
+        old = self.snapshot()
+        engine = get_draft_engine(old.emails)
+        self.write([ROWS[0], ROWS[1], ("c@aph.gov.au", "House", "QLD", "IND")])
+        new, diff = reload_snapshot(self.csv_path, old)
+        self.assertEqual(diff.changed, ("c@aph.gov.au",))
+        self.assertIs(new.emails, old.emails)
+        self.assertIs(get_draft_engine(new.emails), engine)
+        self.assertEqual(new.index.positions(new.index.mask({"party": ["IND"]})), [2])
+
+    def test_new_rows_get_an_engine_before_the_snapshot(self):
+        self.write(ROWS)
+        old = self.snapshot()
+        get_draft_engine(old.emails)
+        self.write(ROWS + [("d@aph.gov.au", "House", "SA", "ALP")])
+        new, diff = reload_snapshot(self.csv_path, old)
+        self.assertEqual(diff.added, ("d@aph.gov.au",))
+        self.assertIs(get_draft_engine(new.emails).recipients, new.emails)
+
+    def test_bad_csv_keeps_the_previous_snapshot(self):
+        self.write(ROWS)
+        cache = get_recipient_cache()
+        old = cache.get(self.csv_path)
+        watcher = ContactWatcher(self.csv_path)
+        self.csv_path.write_text("name\nJane\n", encoding="utf-8")
+        with self.assertLogs("transitional_leader.reload", "WARNING"):
+            self.assertFalse(watcher.poll())
+        self.assertIs(cache.current(self.csv_path).emails, old.emails)
+        # The bad version is remembered, so the next poll doesn't parse it again.
+        with self.assertNoLogs("transitional_leader.reload", "WARNING"):
+            self.assertFalse(watcher.poll())
+
+        self.write(ROWS[:2])
+        self.assertTrue(watcher.poll())
+        self.assertEqual(cache.current(self.csv_path).emails, ("a@aph.gov.au", "b@aph.gov.au"))
+
+
+if __name__ == "__main__":
+    unittest.main()
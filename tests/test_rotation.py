@@ -0,0 +1,42 @@
+# Usage accounting of the shared (template, subject) rotation.
+
+import unittest
+from collections import Counter
+
+from transitional_leader.rotation import Rotation
+
+
+class RotationTest(unittest.TestCase):
+    def test_usage_counts_match_the_picks(self):
+        rotation = Rotation(7, 3, seed=1)
+        picked = Counter()
+        last = None
+        for _ in range(50):
+            pair = rotation.pick(last)
+            picked[pair] += 1
+            last = pair[0]
+        self.assertEqual(rotation.picks(), 50)
+        for t in range(7):
+            for s in range(3):
+                self.assertEqual(rotation.usage(t, s), picked[t, s])
+        self.assertEqual(rotation.subject_usage(), [sum(picked[t, s] for t in range(7)) for s in range(3)])
+        self.assertLessEqual(max(picked.values()) - min(rotation.usage(t, s) for t in range(7) for s in range(3)), 1)
+
+    def test_pick_subject_cycles_through_subjects(self):
+        rotation = Rotation(5, 4, seed=2)
+        self.assertEqual(sorted(rotation.pick_subject() for _ in range(4)), [0, 1, 2, 3])
+        self.assertEqual(rotation.subject_usage(), [1, 1, 1, 1])
+
+    def test_pick_subject_takes_no_pair(self):
+        rotation = Rotation(5, 4, seed=3)
+        subjects = Counter(rotation.pick_subject() for _ in range(6))
+        self.assertEqual(rotation.picks(), 0)
+        self.assertEqual([rotation.template_usage(t) for t in range(5)], [0] * 5)
+        t, s = rotation.pick()
+        subjects[s] += 1
+        self.assertEqual(rotation.template_usage(t), 1)
+        self.assertEqual(rotation.subject_usage(), [subjects[s] for s in range(4)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+# The pooled SMTP sender against the in-process stand-in server.
+#
+#   pytest tests/          (or: python -m unittest discover tests)
+
+import asyncio
+import unittest
+import unittest.mock
+
+from transitional_leader.smtp import SenderBusy, SmtpConfig, SmtpError, SmtpSender, build_outgoing
+from transitional_leader.smtp_testing import LocalSmtpServer
+
+RECIPIENTS = ("a@aph.gov.au", "b@aph.gov.au", "c@example.org")
+
+
+def _config(port: int, **overrides) -> SmtpConfig:
+    settings = dict(
+        host="127.0.0.1", port=port, from_address="campaign@example.org", starttls=False,
+        domain_rate=1e6, domain_burst=1000, backoff_base=0.001, timeout=5.0,
+    )
+    settings.update(overrides)
+    return SmtpConfig(**settings)
+
+
+class SmtpSenderTest(unittest.IsolatedAsyncioTestCase):
+    async def _send(self, n: int, server: LocalSmtpServer | None = None, **overrides):
+        server = server or LocalSmtpServer()
+        config = _config(await server.start(), **overrides)
+        try:
+            async with SmtpSender(config) as sender:
+                futures = [
+                    await sender.submit(build_outgoing(config, RECIPIENTS, f"Person {i}", i, i % 9)) for i in range(n)
+                ]
+                results = await asyncio.gather(*futures, return_exceptions=True)
+        finally:
+            await server.stop()
+        return server, sender, results
+
+    async def test_delivers_over_a_persistent_pool(self):
+        server, sender, results = await self._send(20, pool_size=2)
+        self.assertEqual([r for r in results if isinstance(r, BaseException)], [])
+        self.assertEqual(server.messages, 20)
+        self.assertEqual(server.recipients, 20 * len(RECIPIENTS))
+        self.assertLessEqual(server.connections, 2)
+        self.assertEqual(sender.stats.sent, 20)
+
+    async def test_without_pipelining(self):
+        server, _, results = await self._send(5, LocalSmtpServer(pipelining=False))
+        self.assertFalse(any(isinstance(r, BaseException) for r in results))
+        self.assertEqual(server.messages, 5)
+
+    async def test_recipients_only_in_the_envelope(self):
+        server, _, _ = await self._send(1)
+        headers = server.accepted[0].split(b"\r\n\r\n", 1)[0].lower()
+        self.assertNotIn(b"\r\nbcc:", headers)
+        self.assertNotIn(b"aph.gov.au", headers)
+        self.assertIn(b"to: undisclosed-recipients:;", headers)
+
+    async def test_retries_transient_failures(self):
+        server, sender, results = await self._send(10, LocalSmtpServer(fail_every=3), pool_size=1)
+        self.assertFalse(any(isinstance(r, BaseException) for r in results))
+        self.assertEqual(server.messages, 10)
+        self.assertGreater(sender.stats.retries, 0)
+        self.assertTrue(any(r.attempts > 1 for r in results))
+
+    async def test_gives_up_after_max_retries(self):
+        server, sender, results = await self._send(1, LocalSmtpServer(fail_every=1), max_retries=2)
+        self.assertIsInstance(results[0], SmtpError)
+        self.assertEqual(results[0].code, 451)
+        self.assertEqual(sender.stats.failed, 1)
+        self.assertEqual(server.messages, 0)
+
+    async def test_full_queue_rejects_instead_of_blocking(self):
+        server = LocalSmtpServer(reply_delay=0.05)
+        config = _config(await server.start(), pool_size=1, queue_size=2)
+        message = build_outgoing(config, RECIPIENTS, "Person", 0, 0)
+        try:
+            async with SmtpSender(config) as sender:
+                futures = [sender.submit_nowait(message) for _ in range(2)]
+                with self.assertRaises(SenderBusy):
+                    for _ in range(5):
+                        futures.append(sender.submit_nowait(message))
+                await asyncio.gather(*futures)
+        finally:
+            await server.stop()
+
+    async def test_reports_latency_and_throughput(self):
+        _, sender, results = await self._send(30, pool_size=3)
+        self.assertEqual(len(sender.stats.latencies), 30)
+        self.assertGreater(sender.stats.percentile(0.99), 0)
+        self.assertLessEqual(sender.stats.percentile(0.50), sender.stats.percentile(0.99))
+        self.assertTrue(all(r.latency > 0 for r in results))
+
+    async def test_rate_limits_each_domain(self):
+        rate, n = 20.0, 5
+        server = LocalSmtpServer()
+        config = _config(await server.start(), pool_size=3, domain_rate=rate, domain_burst=1)
+        message = build_outgoing(config, RECIPIENTS[:2], "Person", 0, 0)  # both @aph.gov.au
+        loop = asyncio.get_running_loop()
+        done_at = []
+        try:
+            async with SmtpSender(config) as sender:
+                futures = [await sender.submit(message) for _ in range(n)]
+                for future in futures:
+                    future.add_done_callback(lambda _: done_at.append(loop.time()))
+                await asyncio.gather(*futures)
+        finally:
+            await server.stop()
+        self.assertEqual(server.messages, n)
+        # Three idle connections, but one token per 1/rate seconds for the domain.
+        gaps = [b - a for a, b in zip(done_at, done_at[1:])]
+        self.assertGreaterEqual(done_at[-1] - done_at[0], 0.9 * (n - 1) / rate)
+        self.assertGreater(min(gaps), 0.5 / rate)
+
+
+class SmtpConfigTest(unittest.TestCase):
+    def test_requires_a_from_address(self):
+        with self.assertRaises(ValueError):
+            SmtpConfig(host="smtp.example.org")
+        with self.assertRaises(ValueError):
+            SmtpConfig(host="smtp.example.org", from_address="campaign")
+
+    def test_from_env(self):
+        env = {"TL_SMTP_HOST": "smtp.example.org", "TL_SMTP_PORT": "2525", "TL_SMTP_STARTTLS": "no"}
+        with unittest.mock.patch.dict("os.environ", env, clear=True):
+            with self.assertRaises(ValueError):
+                SmtpConfig.from_env()
+        env["TL_SMTP_FROM_ADDRESS"] = "campaign@example.org"
+        with unittest.mock.patch.dict("os.environ", env, clear=True):
+            config = SmtpConfig.from_env()
+        self.assertEqual((config.port, config.starttls), (2525, False))
+        with unittest.mock.patch.dict("os.environ", {}, clear=True):
+            self.assertIsNone(SmtpConfig.from_env())
+
+
+if __name__ == "__main__":
+    unittest.main()
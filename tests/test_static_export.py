@@ -0,0 +1,38 @@
+# The static page's embedded JS against the Python engine (needs Node.js).
+
+import shutil
+import unittest
+from pathlib import Path
+
+from transitional_leader import DEFAULT_CSV_PATH, load_recipients
+from transitional_leader.engine import DraftEngine
+from transitional_leader.registry import contact_set_for
+from transitional_leader.static_export import render_page, verify_with_node
+
+
+class StaticExportTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = DraftEngine(load_recipients(DEFAULT_CSV_PATH))
+
+    @unittest.skipUnless(shutil.which("node"), "needs Node.js on PATH")
+    def test_js_matches_build_mailto_bcc_link(self):
+        # A short BCC list keeps the Python side of the comparison quick; the JS joins it the same way.
+        self.assertGreater(verify_with_node(self.engine.subset((1 << 20) - 1)), 0)
+
+    def test_page_embeds_the_engine_data(self):
+        page = render_page(self.engine)
+        self.assertIn(self.engine.encoded_bcc, page)
+        self.assertEqual(page.count("</script>"), 1)
+
+    def test_heading_follows_the_contact_set(self):
+        uk = contact_set_for(Path("uk_parliament_contacts.csv"))
+        page = render_page(self.engine, uk.audience, uk.audience_fa)
+        self.assertIn(f"Sending Email to {uk.audience} in Support", page)
+        self.assertIn(f"ارسال ایمیل به {uk.audience_fa} در حمایت", page)
+        self.assertNotIn("استرالیا", page)
+        self.assertNotIn("Australian", page)
+
+
+if __name__ == "__main__":
+    unittest.main()
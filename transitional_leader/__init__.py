@@ -0,0 +1,56 @@
+# Core of the email draft generator: template corpus, recipient loading and
+# mailto building. Imported once per process; TransitionalLeader.py is the
+# thin Streamlit layer on top.
+
+from .corpus import (
+    EMAIL_TEMPLATES,
+    GREETING,
+    REFERENCES_BLOCK,
+    SLOGANS_REQUIRED,
+    SUBJECT_OPTIONS,
+    build_full_body,
+)
+from .drafts import build_mailto_bcc_link, pick_new_index
+from .engine import DraftDescriptor, DraftEngine, get_draft_engine
+from .filters import FILTER_COLUMNS, ContactIndex, SubsetKey, subset_key
+from .recipients import (
+    DEFAULT_CSV_PATH,
+    RecipientCache,
+    RecipientSnapshot,
+    build_snapshot,
+    find_email_column,
+    get_recipient_cache,
+    load_contacts,
+    load_recipients,
+)
+from .rotation import Rotation, get_rotation
+from .templates import TemplateSpace
+
+__all__ = [
+    "DEFAULT_CSV_PATH",
+    "EMAIL_TEMPLATES",
+    "FILTER_COLUMNS",
+    "GREETING",
+    "REFERENCES_BLOCK",
+    "SLOGANS_REQUIRED",
+    "SUBJECT_OPTIONS",
+    "ContactIndex",
+    "DraftDescriptor",
+    "DraftEngine",
+    "RecipientCache",
+    "RecipientSnapshot",
+    "Rotation",
+    "build_snapshot",
+    "SubsetKey",
+    "TemplateSpace",
+    "build_full_body",
+    "build_mailto_bcc_link",
+    "find_email_column",
+    "get_draft_engine",
+    "get_recipient_cache",
+    "get_rotation",
+    "load_contacts",
+    "load_recipients",
+    "pick_new_index",
+    "subset_key",
+]
@@ -0,0 +1,298 @@
+# Lightweight HTTP draft API for partner sites (stdlib asyncio, no framework).
+#
+#   python -m transitional_leader.api --port 8080
+#
+#   GET  /recipients?chamber=Senate&state=VIC
+#        -> {"count": 12, "recipients": [{"email": ..., "chamber": ..., ...}]}
+#        ETag from the CSV's content hash + the filter selection; If-None-Match -> 304.
+#   POST /draft  {"name": "Jane Doe", "template_index": 3, "subject_index": 1, "state": ["VIC"]}
+#        -> {"subject": ..., "body": ..., "mailto_url": ..., "template_index": ..., "subject_index": ...}
+#        Without template_index the pair comes from the process-wide rotation;
+#        a pinned template without subject_index takes the rotation's next subject.
+#
+# Request bodies need Content-Length; any Transfer-Encoding gets 411 and the
+# connection is closed.
+#
+# HTTP/1.1 keep-alive, one event loop, no per-request threads. Responses for
+# GET /recipients are rendered once per (snapshot, filters) and cached.
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import sys
+import urllib.parse
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+from .corpus import EMAIL_TEMPLATES, SUBJECT_OPTIONS, build_full_body
+from .engine import get_draft_engine
+from .filters import FILTER_COLUMNS, subset_key
+from .recipients import DEFAULT_CSV_PATH, RecipientSnapshot, get_recipient_cache
+from .reload import DEFAULT_POLL_INTERVAL, start_contact_watcher
+from .rotation import get_rotation
+
+logger = logging.getLogger(__name__)
+
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 16 * 1024
+RECIPIENTS_MAX_AGE = 300
+RESPONSE_CACHE_SIZE = 256
+
+_REASONS = {
+    200: "OK",
+    204: "No Content",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+_CORS_HEADERS = (
+    "Access-Control-Allow-Origin: *\r\n"
+    "Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+    "Access-Control-Allow-Headers: Content-Type, If-None-Match\r\n"
+)
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _json(payload: object) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class DraftApi:
+    def __init__(self, csv_path: Path = DEFAULT_CSV_PATH) -> None:
+        self.csv_path = csv_path
+        # (content hash, subset key) -> (etag, rendered JSON body)
+        self._recipients_cache: OrderedDict[tuple, tuple[str, bytes]] = OrderedDict()
+
+    # ---------------------------
+    # Handlers
+    # ---------------------------
+    def get_recipients(self, query: Mapping[str, list[str]], headers: Mapping[str, str]) -> tuple[int, dict, bytes]:
+        snapshot = get_recipient_cache().get(self.csv_path)
+        key = (snapshot.content_hash, subset_key(_filters(query)))
+        cached = self._recipients_cache.get(key)
+        if cached is None:
+            cached = self._render_recipients(snapshot, key)
+            self._recipients_cache[key] = cached
+            if len(self._recipients_cache) > RESPONSE_CACHE_SIZE:
+                self._recipients_cache.popitem(last=False)
+        else:
+            self._recipients_cache.move_to_end(key)
+
+        etag, body = cached
+        extra = {"ETag": etag, "Cache-Control": f"public, max-age={RECIPIENTS_MAX_AGE}"}
+        if etag in {t.strip() for t in headers.get("if-none-match", "").split(",")}:
+            return 304, extra, b""
+        return 200, extra, body
+
+    def _render_recipients(self, snapshot: RecipientSnapshot, key: tuple) -> tuple[str, bytes]:
+        positions = snapshot.index.positions(snapshot.index.mask(dict(key[1])))
+        recipients = [
+            {"email": snapshot.emails[i], **{c: values[i] for c, values in snapshot.attrs.items()}}
+            for i in positions
+        ]
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()[:20]
+        return f'"{digest}"', _json({"count": len(recipients), "recipients": recipients})
+
+    def post_draft(self, payload: object) -> tuple[int, dict, bytes]:
+        if not isinstance(payload, dict):
+            raise HttpError(400, "expected a JSON object")
+        name = payload.get("name")
+        if not isinstance(name, str) or not name.strip():
+            raise HttpError(400, "'name' is required")
+        name = name.strip()
+
+        template_index = payload.get("template_index")
+        subject_index = payload.get("subject_index")
+        if template_index is None:
+            template_index, picked_subject = get_rotation().pick()
+            if subject_index is None:
+                subject_index = picked_subject
+        else:
+            _check_index(template_index, "template_index", len(EMAIL_TEMPLATES))
+            if subject_index is None:
+                subject_index = get_rotation().pick_subject()
+        _check_index(subject_index, "subject_index", len(SUBJECT_OPTIONS))
+
+        snapshot = get_recipient_cache().get(self.csv_path)
+        mask = snapshot.index.mask(_filters(payload))
+        if not mask:
+            raise HttpError(400, "no recipients match the selected filters")
+        engine = get_draft_engine(snapshot.emails).subset(mask)
+        return 200, {"Cache-Control": "no-store"}, _json({
+            "subject": SUBJECT_OPTIONS[subject_index],
+            "body": build_full_body(EMAIL_TEMPLATES[template_index], name),
+            "mailto_url": engine.build(template_index, subject_index, name),
+            "template_index": template_index,
+            "subject_index": subject_index,
+            "recipient_count": len(engine.recipients),
+        })
+
+    # ---------------------------
+    # HTTP/1.1 plumbing
+    # ---------------------------
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    return
+                except asyncio.LimitOverrunError:
+                    await self._write(writer, 413, {}, _json({"error": "headers too large"}), keep_alive=False)
+                    return
+
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = request_line.split(" ", 2)
+                except ValueError:
+                    await self._write(writer, 400, {}, _json({"error": "malformed request line"}), keep_alive=False)
+                    return
+                headers = {}
+                for line in header_lines:
+                    if line:
+                        k, _, v = line.partition(":")
+                        headers[k.strip().lower()] = v.strip()
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                # Bodies are tiny JSON; rather than decode chunked framing, ask for
+                # Content-Length. Closing keeps the unread chunks from being parsed
+                # as the next request.
+                if "transfer-encoding" in headers:
+                    await self._write(
+                        writer, 411, {}, _json({"error": "Transfer-Encoding not supported; send Content-Length"}),
+                        keep_alive=False,
+                    )
+                    return
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._write(writer, 400, {}, _json({"error": "bad Content-Length"}), keep_alive=False)
+                    return
+                if length > MAX_BODY_BYTES:
+                    await self._write(writer, 413, {}, _json({"error": "body too large"}), keep_alive=False)
+                    return
+                body = await reader.readexactly(length) if length else b""
+
+                status, extra, payload = self.dispatch(method, target, headers, body)
+                await self._write(writer, status, extra, payload, keep_alive, head_only=method == "HEAD")
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def dispatch(self, method: str, target: str, headers: Mapping[str, str], body: bytes) -> tuple[int, dict, bytes]:
+        path, _, raw_query = target.partition("?")
+        try:
+            if method == "OPTIONS":
+                return 204, {}, b""
+            if path == "/recipients":
+                if method not in ("GET", "HEAD"):
+                    raise HttpError(405, "use GET")
+                return self.get_recipients(urllib.parse.parse_qs(raw_query), headers)
+            if path == "/draft":
+                if method != "POST":
+                    raise HttpError(405, "use POST")
+                # Content-Type isn't enforced: text/plain lets browsers skip the CORS preflight.
+                try:
+                    payload = json.loads(body or b"{}")
+                except ValueError:
+                    raise HttpError(400, "invalid JSON") from None
+                return self.post_draft(payload)
+            raise HttpError(404, "not found")
+        except HttpError as e:
+            return e.status, {}, _json({"error": e.message})
+        except (FileNotFoundError, ValueError) as e:
+            return 500, {}, _json({"error": str(e)})
+        except Exception:
+            # Anything else is a bug; answer it rather than drop the connection.
+            logger.exception("unhandled error for %s %s", method, path)
+            return 500, {}, _json({"error": "internal error"})
+
+    @staticmethod
+    async def _write(
+        writer: asyncio.StreamWriter,
+        status: int,
+        extra: Mapping[str, str],
+        body: bytes,
+        keep_alive: bool = True,
+        head_only: bool = False,
+    ) -> None:
+        head = [f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n", _CORS_HEADERS]
+        if body or status not in (204, 304):
+            head.append("Content-Type: application/json; charset=utf-8\r\n")
+        head.append(f"Content-Length: {len(body)}\r\n")
+        head += [f"{k}: {v}\r\n" for k, v in extra.items()]
+        head.append("Connection: keep-alive\r\n\r\n" if keep_alive else "Connection: close\r\n\r\n")
+        writer.write("".join(head).encode("latin-1") + (b"" if head_only else body))
+        await writer.drain()
+
+    async def serve(self, host: str, port: int) -> None:
+        server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_HEADER_BYTES)
+        async with server:
+            await server.serve_forever()
+
+
+def _check_index(value: object, field: str, n: int) -> None:
+    if not isinstance(value, int) or isinstance(value, bool) or not 0 <= value < n:
+        raise HttpError(400, f"'{field}' must be an integer in [0, {n - 1}]")
+
+
+def _filters(source: Mapping) -> dict[str, list[str]]:
+    # Query strings give lists already; JSON bodies may give a single string.
+    filters = {}
+    for column in FILTER_COLUMNS:
+        values = source.get(column)
+        if values is None:
+            values = []
+        elif isinstance(values, str):
+            values = [values]
+        elif not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+            raise HttpError(400, f"'{column}' must be a string or a list of strings")
+        filters[column] = values
+    return filters
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m transitional_leader.api", description="HTTP draft API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--csv", type=Path, default=DEFAULT_CSV_PATH, help="contacts CSV (default: %(default)s)")
+    parser.add_argument(
+        "--reload-interval", type=float, default=DEFAULT_POLL_INTERVAL,
+        help="seconds between checks of the CSV for changes; 0 disables the watcher (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    api = DraftApi(args.csv)
+    get_recipient_cache().get(args.csv)  # fail fast on a missing/invalid CSV
+    if args.reload_interval > 0:
+        start_contact_watcher(args.csv, args.reload_interval)
+    print(f"serving on http://{args.host}:{args.port}", file=sys.stderr)
+    try:
+        asyncio.run(api.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+# Headless bulk draft generator.
+# Streams a names file (one name per line) and writes one RFC 5322 .eml draft
+# per name, or a single mbox, using the same templates, subjects, greeting/signoff
+# and template/subject rotation as the Streamlit app.
+#
+#   python -m transitional_leader.bulk names.txt --from-address me@example.org --out drafts/
+#   python -m transitional_leader.bulk names.txt --from-address me@example.org --mbox drafts.mbox --workers 8
+#
+# RFC 5322 requires From and Date, so --from-address is mandatory; each draft
+# gets its own Date and Message-ID, with the name as From's display name.
+#
+# Names are read lazily and at most a few chunks are in flight at once, so memory
+# stays flat no matter how long the names file is.
+
+import argparse
+import binascii
+import re
+import sys
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from email.message import EmailMessage
+from email.policy import default as default_policy
+from email.utils import formataddr, formatdate, make_msgid
+from pathlib import Path
+
+from .corpus import EMAIL_TEMPLATES, SUBJECT_OPTIONS, build_full_body
+from .filters import FILTER_COLUMNS, ContactIndex
+from .recipients import DEFAULT_CSV_PATH, load_contacts
+from .rotation import Rotation
+from .templates import EncodedTemplateSpace
+
+# (sequence number, name, template index, subject index)
+DraftJob = tuple[int, str, int, int]
+
+
+# ---------------------------
+# Rendering (runs in worker processes)
+# ---------------------------
+# Folding headers and encoding a ~3 KB body through the email package costs a
+# couple of milliseconds per draft. Everything except the name is fixed, so each
+# worker renders the To/Bcc block, every Subject line and every body paragraph
+# once, and a draft is a few byte concatenations.
+_MIME_HEADERS = (
+    b"MIME-Version: 1.0\n"
+    b'Content-Type: text/plain; charset="utf-8"\n'
+    b"Content-Transfer-Encoding: quoted-printable\n"
+    # Tells Outlook/Thunderbird to open the file as an unsent draft.
+    b"X-Unsent: 1\n"
+)
+
+_recipient_headers = b""
+_subject_headers: tuple[bytes, ...] = ()
+_bodies: EncodedTemplateSpace[bytes] | None = None
+_body_head = b""  # encoded greeting, before the body
+_body_mid = b""  # encoded lines between the body and the line holding the name
+_name_line: tuple[str, str] = ("", "")  # raw text around the name on its line
+_from_address = ""
+_msgid_domain = ""
+
+
+def _fold_headers(**headers: str) -> bytes:
+    msg = EmailMessage(policy=default_policy)
+    for key, value in headers.items():
+        msg[key.replace("_", "-")] = value
+    return msg.as_bytes().rstrip(b"\n") + b"\n"
+
+
+def _init_worker(recipients: Sequence[str], from_address: str) -> None:
+    global _recipient_headers, _subject_headers, _bodies, _body_head, _body_mid, _name_line
+    global _from_address, _msgid_domain
+    _recipient_headers = _fold_headers(To="undisclosed-recipients:;", Bcc=", ".join(recipients))
+    _subject_headers = tuple(_fold_headers(Subject=s) for s in SUBJECT_OPTIONS)
+
+    # Quoted-printable works line by line, and paragraphs start and end on line
+    # breaks, so every paragraph (and everything up to the line holding the
+    # name) is encoded once and a body is joined from the pieces.
+    head, rest = build_full_body("\x00", "\x01").split("\x00")
+    mid, suffix = rest.split("\x01")
+    mid, _, line_start = mid.rpartition("\n")
+    _bodies = EMAIL_TEMPLATES.encoded(_qp)
+    _body_head = _qp(head)
+    _body_mid = _qp(mid + "\n")
+    _name_line = (line_start, suffix)
+    _from_address = from_address
+    _msgid_domain = from_address.rpartition("@")[2]
+
+
+def _qp(text: str) -> bytes:
+    return binascii.b2a_qp(text.encode("utf-8"))
+
+
+def render_draft(name: str, template_index: int, subject_index: int) -> bytes:
+    line_start, suffix = _name_line
+    parts = [
+        f"From: {formataddr((name, _from_address), charset='utf-8')}\n"
+        f"Date: {formatdate(localtime=True)}\n"
+        f"Message-ID: {make_msgid(domain=_msgid_domain)}\n".encode(),
+        _recipient_headers, _subject_headers[subject_index], _MIME_HEADERS, b"\n",
+        _body_head, _bodies[template_index], _body_mid, _qp(line_start + name + suffix), b"\n",
+    ]
+    return b"".join(parts)
+
+
+def _render_chunk(jobs: list[DraftJob]) -> list[tuple[int, bytes]]:
+    return [(seq, render_draft(name, t, s)) for seq, name, t, s in jobs]
+
+
+# ---------------------------
+# Job stream
+# ---------------------------
+def iter_names(lines: Iterable[str]) -> Iterator[str]:
+    for line in lines:
+        name = line.strip()
+        if name and not name.startswith("#"):
+            yield name
+
+
+def iter_jobs(names: Iterable[str], rotation: Rotation) -> Iterator[DraftJob]:
+    last_pick = None
+    for seq, name in enumerate(names, start=1):
+        last_pick, subject = rotation.pick(last_pick)
+        yield seq, name, last_pick, subject
+
+
+def _chunked(jobs: Iterable[DraftJob], size: int) -> Iterator[list[DraftJob]]:
+    chunk = []
+    for job in jobs:
+        chunk.append(job)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# ---------------------------
+# Writers
+# ---------------------------
+class EmlDirWriter:
+    def __init__(self, out_dir: Path) -> None:
+        self.out_dir = out_dir
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+    def write(self, seq: int, data: bytes) -> None:
+        (self.out_dir / f"draft-{seq:06d}.eml").write_bytes(data)
+
+    def close(self) -> None:
+        pass
+
+
+class MboxWriter:
+    _FROM_LINE = re.compile(rb"^From ", re.MULTILINE)
+
+    def __init__(self, path: Path) -> None:
+        self._f = open(path, "wb")
+
+    def write(self, seq: int, data: bytes) -> None:
+        self._f.write(b"From MAILER-DAEMON " + time.asctime().encode() + b"\n")
+        self._f.write(self._FROM_LINE.sub(b">From ", data))
+        if not data.endswith(b"\n"):
+            self._f.write(b"\n")
+        self._f.write(b"\n")
+
+    def close(self) -> None:
+        self._f.close()
+
+
+def generate(
+    names: Iterable[str],
+    writer: EmlDirWriter | MboxWriter,
+    recipients: Sequence[str],
+    *,
+    from_address: str,
+    workers: int = 1,
+    chunk_size: int = 200,
+    seed: int | None = None,
+) -> int:
+    """Render and write one draft per name; returns the number written."""
+    chunks = _chunked(iter_jobs(names, Rotation(len(EMAIL_TEMPLATES), len(SUBJECT_OPTIONS), seed)), chunk_size)
+    written = 0
+
+    def flush(results: list[tuple[int, bytes]]) -> None:
+        nonlocal written
+        for seq, data in results:
+            writer.write(seq, data)
+        written += len(results)
+
+    if workers <= 1:
+        _init_worker(recipients, from_address)
+        for chunk in chunks:
+            flush(_render_chunk(chunk))
+        return written
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(tuple(recipients), from_address),
+    ) as pool:
+        # Bounded window of in-flight chunks, drained in submission order.
+        pending: deque[Future] = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_render_chunk, chunk))
+            if len(pending) >= workers * 2:
+                flush(pending.popleft().result())
+        while pending:
+            flush(pending.popleft().result())
+    return written
+
+
+# ---------------------------
+# CLI
+# ---------------------------
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m transitional_leader.bulk",
+        description="Generate personalised .eml drafts (or one mbox) from a names file.",
+    )
+    parser.add_argument("names", help="names file, one name per line ('-' for stdin)")
+    out = parser.add_mutually_exclusive_group(required=True)
+    out.add_argument("--out", type=Path, help="directory to write draft-NNNNNN.eml files into")
+    out.add_argument("--mbox", type=Path, help="single mbox file to write all drafts into")
+    parser.add_argument("--csv", type=Path, default=DEFAULT_CSV_PATH, help="contacts CSV (default: %(default)s)")
+    for column in FILTER_COLUMNS:
+        parser.add_argument(f"--{column}", action="append", default=[], help=f"only recipients with this {column} (repeatable)")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (default: %(default)s)")
+    parser.add_argument("--chunk-size", type=int, default=200, help="drafts per worker task (default: %(default)s)")
+    parser.add_argument(
+        "--from-address", required=True, help="address for the From header; the name becomes its display name",
+    )
+    parser.add_argument("--seed", type=int, help="seed the template rotation for reproducible output")
+    args = parser.parse_args(argv)
+
+    local, _, domain = args.from_address.rpartition("@")
+    if not local or not domain:
+        parser.error("--from-address must look like user@example.org")
+
+    emails, attrs = load_contacts(args.csv)
+    mask = ContactIndex(len(emails), attrs).mask({c: getattr(args, c) for c in FILTER_COLUMNS})
+    recipients = [emails[i] for i in ContactIndex.positions(mask)]
+    if not recipients:
+        parser.error("no recipients match the selected filters")
+
+    writer = EmlDirWriter(args.out) if args.out else MboxWriter(args.mbox)
+    names_file = sys.stdin if args.names == "-" else open(args.names, encoding="utf-8")
+    started = time.perf_counter()
+    try:
+        count = generate(
+            iter_names(names_file),
+            writer,
+            recipients,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            from_address=args.from_address,
+            seed=args.seed,
+        )
+    finally:
+        writer.close()
+        if names_file is not sys.stdin:
+            names_file.close()
+
+    elapsed = time.perf_counter() - started
+    rate = count / elapsed if elapsed > 0 else float("inf")
+    print(f"wrote {count} drafts to {args.out or args.mbox} in {elapsed:.2f}s ({rate:.0f} drafts/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+# Template corpus: references, required slogans, paragraph banks and subject lines.
+# Imported once per process; the Streamlit script only indexes into these.
+
+from .templates import TemplateSpace
+
+# ---------------------------
+# References (updated: attributed to Reza Pahlavi + Imgur photos link)
+# ---------------------------
+REFERENCES_BLOCK = (
+    "Additional references:\n"
+    "• Reza Pahlavi’s remarks on how a free Iran would benefit global stability:\n"
+    "https://youtu.be/pzlKh8B2GFE?si=WXWMw2IaxMNC16kp\n\n"
+    "• Reza Pahlavi’s interview with ARD (Germany’s nightly news, English from 0:18):\n"
+    "https://youtu.be/sfd2hNuK498?si=4dPK_i1gngkr-hLT\n\n"
+    "• Reza Pahlavi’s full international press conference addressing transition and governance:\n"
+    "https://www.youtube.com/live/GIYZhaoiFYU?si=orGTYn8FFMSB-HBh\n\n"
+    "• Photographic documentation from inside Iran showing public expressions of support for Reza Pahlavi:\n"
+    "https://imgur.com/a/s9gKZbx"
+)
+
+# This exact bilingual requirement must appear in ALL templates:
+SLOGANS_REQUIRED = '“Javid Shah” (“Long live the King”) and “Pahlavi bar migardeh” (“Pahlavi will return”)'
+
+
+# ---------------------------
+# Paragraph banks (greeting + signature are added separately)
+# Every draft body is one paragraph from each bank, in this order, followed
+# by REFERENCES_BLOCK; each distinct paragraph is stored once.
+# ---------------------------
+# Why I am writing.
+OPENINGS = [
+    "I am writing regarding the ongoing situation in Iran and how the international community can best stand with and support the brave people who are fighting bare-handed for their freedom against the brutal regime, and help advance a peaceful and democratic transition.",
+    "I write to draw attention to the ongoing crisis in Iran and to highlight how the international community can support the Iranian people in achieving a peaceful and democratic transition.",
+    "I am writing to express concern over the ongoing situation in Iran and to underscore the importance of international support for a peaceful and democratic transition.",
+    "I write concerning the situation in Iran and the role the international community can play in supporting a non-violent and democratic transition.",
+    "I am writing to highlight developments inside Iran and the urgent need for international engagement that supports a peaceful and democratic transition.",
+    "I write to respectfully request attention to Iran’s ongoing crisis and the importance of standing with the Iranian people as they seek freedom and democracy.",
+    "I am writing regarding Iran and how the international community can most effectively support a peaceful and democratic transition that reflects the will of the Iranian people.",
+    "I write to draw attention to the situation in Iran and to highlight the need for meaningful international support for a peaceful democratic transition.",
+    "I am writing regarding the ongoing crisis in Iran and how the international community can best stand with those seeking freedom and democracy.",
+    "I write to raise concern about the situation in Iran and to emphasise the importance of international recognition of the Iranian people’s demands for a peaceful democratic transition.",
+    "I am writing to draw attention to the ongoing situation in Iran and the urgent need for international support that advances a peaceful and democratic transition.",
+    "I write regarding Iran’s ongoing crisis and how the international community can best support the Iranian people in achieving a peaceful and democratic transition.",
+    "I am writing about the ongoing situation in Iran and the importance of international recognition of the Iranian people’s calls for a peaceful democratic transition.",
+    "I write to request attention to the crisis in Iran and to highlight how the international community can support a peaceful and democratic transition.",
+    "I am writing regarding the situation in Iran and how the international community can stand with the Iranian people as they seek freedom and a peaceful democratic transition.",
+    "I write to underline the urgency of the situation in Iran and the importance of international support for a peaceful and democratic transition.",
+    "I am writing to draw attention to developments inside Iran and the importance of supporting the Iranian people’s pursuit of freedom and democracy.",
+    "I write regarding the ongoing situation in Iran and to stress how the international community can best support a peaceful and democratic transition.",
+    "I am writing about the ongoing crisis in Iran and the importance of international recognition of the Iranian people’s calls for democratic change.",
+    "I write to request attention to Iran’s ongoing crisis and to highlight how international engagement can support a peaceful democratic transition.",
+    "I am writing regarding the situation in Iran and how the international community can best support the Iranian people’s pursuit of freedom and democratic governance.",
+]
+
+# What people inside Iran are saying; every one carries SLOGANS_REQUIRED.
+SITUATIONS = [
+    f"Despite severe repression, internet shutdowns, as well as risks to their very lives, voices from inside Iran have become increasingly clear and consistent. Across many cities, people are publicly calling for Reza Pahlavi to guide a transitional process and lead their revolution, holding placards with his name and photo and chanting {SLOGANS_REQUIRED}. These calls are emerging from within Iran itself and reflect a growing demand for national unity and a credible alternative to the current regime.",
+    f"Even under brutal repression, internet shutdowns, and constant threats to life, voices from inside Iran have become more united. Across many cities, citizens are publicly calling for Reza Pahlavi to guide a transitional process, holding placards with his name and image and chanting {SLOGANS_REQUIRED}. These expressions originate within Iran and reflect a growing demand for national unity and a credible alternative to the current regime.",
+    f"Despite severe repression and internet blackouts, voices from inside Iran are increasingly clear. In many cities, protesters are publicly calling for Reza Pahlavi to guide a transitional process, holding his name and photo while chanting {SLOGANS_REQUIRED}. These calls arise from within Iran and reflect a growing desire for national unity and a credible alternative.",
+    f"Even under severe repression and repeated internet shutdowns, voices from inside Iran are increasingly unified. Across many cities, people are publicly calling for Reza Pahlavi to guide a transitional process, holding placards with his name and photo and chanting {SLOGANS_REQUIRED}. These calls originate within Iran and reflect a growing demand for unity and credible leadership.",
+    f"Despite violent repression, internet shutdowns, and grave risks, voices from inside Iran have become more visible and consistent. In many cities, citizens are calling for Reza Pahlavi to guide a transitional process, holding his image and chanting {SLOGANS_REQUIRED}. These calls are emerging from within Iran itself and reflect a growing demand for national unity and an alternative to the current regime.",
+    f"Even under brutal repression and recurring internet shutdowns, voices from inside Iran are increasingly clear. In many cities, demonstrators are publicly calling for Reza Pahlavi to guide a transitional process, holding placards with his name and photo and chanting {SLOGANS_REQUIRED}. These calls come from within Iran and reflect a growing demand for unity and a credible alternative to the current regime.",
+    f"Despite severe repression, threats to life, and ongoing internet blackouts, calls from inside Iran have become more consistent. Across many cities, citizens are publicly calling for Reza Pahlavi to guide a transitional process, holding his image and chanting {SLOGANS_REQUIRED}. These calls originate within Iran and signal a growing demand for national unity and a credible alternative.",
+    f"Even under severe repression and repeated internet shutdowns, voices from inside Iran have become increasingly clear. In many cities, protesters are publicly calling for Reza Pahlavi to guide a transitional process, holding placards with his name and photo and chanting {SLOGANS_REQUIRED}. These calls are emerging from within Iran and reflect a growing demand for unity and credible leadership.",
+    f"Despite brutal repression, internet restrictions, and threats to their lives, voices from inside Iran are increasingly unified. Across many cities, citizens are calling for Reza Pahlavi to guide a transitional process, holding his image and chanting {SLOGANS_REQUIRED}. These calls originate within Iran and reflect a growing demand for national unity and a credible alternative.",
+    f"Even under severe repression and repeated internet blackouts, voices from inside Iran have become clearer. In many cities, people are publicly calling for Reza Pahlavi to guide a transitional process, holding placards with his name and photo and chanting {SLOGANS_REQUIRED}. These calls arise from within Iran and reflect a growing demand for unity and credible leadership.",
+    f"Despite severe repression, internet shutdowns, and grave risks, voices from inside Iran have become increasingly consistent. Across many cities, protesters are publicly calling for Reza Pahlavi to guide a transitional process, holding his name and photo while chanting {SLOGANS_REQUIRED}. These calls originate within Iran and reflect a growing demand for national unity and a credible alternative.",
+    f"Even under brutal repression and repeated internet shutdowns, voices from inside Iran are increasingly clear. Across many cities, citizens are publicly calling for Reza Pahlavi to guide a transitional process, holding placards with his name and photo and chanting {SLOGANS_REQUIRED}. These calls are emerging from within Iran and reflect a growing demand for unity and credible leadership.",
+    f"Despite severe repression and internet shutdowns, voices from inside Iran have grown more unified. In many cities, demonstrators are calling for Reza Pahlavi to guide a transitional process, holding his image and chanting {SLOGANS_REQUIRED}. These expressions originate within Iran and reflect a growing demand for national unity and a credible alternative.",
+    f"Even with severe repression and repeated internet shutdowns, voices from inside Iran are increasingly consistent. Across many cities, people are publicly calling for Reza Pahlavi to guide a transitional process, holding placards with his name and photo and chanting {SLOGANS_REQUIRED}. These calls originate within Iran and reflect a growing demand for unity and credible leadership.",
+    f"Despite brutal repression, internet shutdowns, and risks to life, voices from inside Iran have become increasingly clear. In many cities, citizens are publicly calling for Reza Pahlavi to guide a transitional process, holding his image and chanting {SLOGANS_REQUIRED}. These calls come from within Iran and reflect a growing demand for national unity and a credible alternative.",
+    f"Despite severe repression and recurring internet shutdowns, voices from inside Iran are increasingly unified. Across many cities, demonstrators are publicly calling for Reza Pahlavi to guide a transitional process, holding placards with his name and photo and chanting {SLOGANS_REQUIRED}. These calls are emerging from within Iran and reflect a growing demand for unity and credible leadership.",
+    f"Even under brutal repression and repeated internet shutdowns, voices from inside Iran have become clearer and more consistent. In many cities, people are publicly calling for Reza Pahlavi to guide a transitional process, holding his photo and chanting {SLOGANS_REQUIRED}. These calls originate within Iran and reflect a growing demand for national unity and a credible alternative.",
+    f"Despite severe repression, internet shutdowns, and threats to life, voices from inside Iran have become increasingly unified. Across many cities, citizens are publicly calling for Reza Pahlavi to guide a transitional process, holding placards with his name and photo and chanting {SLOGANS_REQUIRED}. These expressions originate within Iran and reflect a growing demand for unity and credible leadership.",
+    f"Even under brutal repression and internet shutdowns, voices from inside Iran are increasingly clear. In many cities, demonstrators are publicly calling for Reza Pahlavi to guide a transitional process, holding his name and photo while chanting {SLOGANS_REQUIRED}. These calls emerge from within Iran itself and reflect a growing demand for national unity and a credible alternative.",
+    f"Despite severe repression and repeated internet shutdowns, voices from inside Iran have become more consistent. Across many cities, citizens are publicly calling for Reza Pahlavi to guide a transitional process, holding placards with his name and photo and chanting {SLOGANS_REQUIRED}. These calls come from within Iran and reflect a growing demand for national unity and credible leadership.",
+    f"Even with severe repression, internet shutdowns, and threats to life, voices from inside Iran have become increasingly clear. In many cities, people are publicly calling for Reza Pahlavi to guide a transitional process, holding his image and chanting {SLOGANS_REQUIRED}. These calls originate within Iran and reflect a growing demand for unity and a credible alternative.",
+]
+
+# Reza Pahlavi's roadmap for the transition.
+ROADMAPS = [
+    "Reza Pahlavi has publicly outlined a clear and structured roadmap for transition, grounded in democratic principles, human rights, free elections, and the separation of religion and state. He has emphasised that his role would be to facilitate a transitional period and return decision-making power to the Iranian people through a democratic referendum.",
+    "Reza Pahlavi has set out a structured roadmap for transition grounded in democratic principles, human rights, free elections, and the separation of religion and state. He has stated that his role would be to facilitate a transitional period and return decision-making power to the Iranian people through a democratic referendum.",
+    "Reza Pahlavi has publicly outlined a clear roadmap for transition grounded in democracy, human rights, free elections, and the separation of religion and state. He has emphasised that his role would be limited to facilitating a transition and returning decision-making power to the Iranian people through a democratic referendum.",
+    "Reza Pahlavi has presented a structured transition roadmap grounded in democratic principles, human rights, free elections, and the separation of religion and state. He has stated that his role would be to facilitate a transition and return authority to the Iranian people through a democratic referendum.",
+    "Reza Pahlavi has publicly outlined a clear roadmap grounded in democratic principles, human rights, free elections, and the separation of religion and state. He has emphasised that his role would be to facilitate a transitional period and return decision-making power to the Iranian people through a democratic referendum.",
+    "Reza Pahlavi has set out a structured roadmap for transition based on democratic principles, human rights, free elections, and the separation of religion and state. He has stated that his role would be temporary and aimed at returning authority to the Iranian people through a democratic referendum.",
+    "Reza Pahlavi has publicly outlined a clear transition roadmap grounded in democratic principles, human rights, free elections, and the separation of religion and state. He has emphasised that his role would be to facilitate a transition and return decision-making power to the Iranian people through a democratic referendum.",
+    "Reza Pahlavi has outlined a structured roadmap grounded in democracy, human rights, free elections, and the separation of religion and state. He has stated that his role would be to facilitate a transitional period and return power to the Iranian people through a referendum.",
+    "Reza Pahlavi has publicly outlined a clear and structured roadmap for transition grounded in democratic principles, human rights, free elections, and the separation of religion and state. He has emphasised that his role would be limited to facilitating a transition and returning decision-making power to the Iranian people through a democratic referendum.",
+    "Reza Pahlavi has presented a structured roadmap grounded in democratic values, human rights, free elections, and the separation of religion and state. He has stated that his role would be to facilitate a transition and return authority to the Iranian people through a democratic referendum.",
+    "Reza Pahlavi has publicly outlined a clear roadmap for transition grounded in democratic principles, human rights, free elections, and the separation of religion and state. He has emphasised that his role would be to facilitate a transitional period and return decision-making power to the Iranian people through a democratic referendum.",
+    "Reza Pahlavi has outlined a structured roadmap based on democratic principles, human rights, free elections, and the separation of religion and state. He has stated that his role would be to facilitate a transition and return authority to the people through a democratic referendum.",
+    "Reza Pahlavi has publicly outlined a clear and structured roadmap for transition grounded in democratic values, human rights, free elections, and the separation of religion and state. He has emphasised that his role would be temporary and aimed at returning decision-making power to the Iranian people through a democratic referendum.",
+    "Reza Pahlavi has set out a structured roadmap grounded in democratic principles, human rights, free elections, and the separation of religion and state. He has stated that his role would be to facilitate a transitional period and return authority to the Iranian people through a democratic referendum.",
+    "Reza Pahlavi has publicly outlined a structured roadmap for transition grounded in democratic values, human rights, free elections, and the separation of religion and state. He has emphasised that his role would be limited to facilitating a transition and returning decision-making power to the Iranian people through a democratic referendum.",
+    "Reza Pahlavi has outlined a clear and structured roadmap grounded in democratic principles, human rights, free elections, and the separation of religion and state. He has stated that his role would be to facilitate a transitional period and return decision-making power to the Iranian people through a democratic referendum.",
+    "Reza Pahlavi has publicly outlined a transition roadmap grounded in democratic values, human rights, free elections, and the separation of religion and state. He has emphasised that his role would be limited to facilitating a transition and returning decision-making power to the Iranian people through a democratic referendum.",
+    "Reza Pahlavi has outlined a structured roadmap grounded in democracy, human rights, free elections, and separation of religion and state. He has stated that his role would be to facilitate a transitional period and return decision-making power to the Iranian people through a democratic referendum.",
+    "Reza Pahlavi has publicly presented a clear roadmap grounded in democratic principles, human rights, free elections, and the separation of religion and state. He has emphasised that his role would be temporary and focused on returning decision-making power to the people through a democratic referendum.",
+    "Reza Pahlavi has outlined a structured roadmap grounded in democratic values, human rights, free elections, and the separation of religion and state. He has stated that his role would be to facilitate a transition and return authority to the Iranian people through a democratic referendum.",
+]
+
+# Why international recognition matters.
+APPEALS = [
+    "Given the scale of violence, massacres, and the regime’s crimes against its own people inside Iran and the systematic silencing of independent media, along with widespread propaganda aimed at distorting facts and suppressing dissenting voices, international recognition of the expressed will of the Iranian people is critically important. Constructive engagement with a credible transitional framework can help deter further repression and support stability, both regionally and globally.",
+    "Given the regime’s violence, suppression of independent media, and systematic propaganda, international recognition of the Iranian people’s expressed will is vital. Constructive engagement with a credible transition framework can help deter further repression and support stability beyond Iran’s borders.",
+    "Considering the scale of violence, censorship, and propaganda, international recognition of the Iranian people’s expressed will is critically important. Supporting a credible transitional framework can help discourage further repression and contribute to regional and global stability.",
+    "Given widespread violence, the silencing of independent media, and systematic propaganda, international recognition of these domestic calls is crucial. Constructive engagement with a credible transitional framework can help deter further repression and support stability.",
+    "In light of ongoing violence, censorship, and propaganda, international recognition of the expressed will of the Iranian people is critically important. Supporting a credible transitional framework can help deter further repression and support stability, both regionally and globally.",
+    "Given the scale of violence and the systematic suppression of independent media and dissenting voices, international recognition of the Iranian people’s expressed will is crucial. Constructive engagement with a credible transition framework can help deter further repression and contribute to stability.",
+    "Given ongoing violence, censorship, and propaganda, international recognition of these domestic calls is critically important. Supporting a credible transitional framework can help deter further repression and support regional and global stability.",
+    "Given the scale of violence and the systematic silencing of independent media, international recognition of the Iranian people’s expressed will is vital. Constructive engagement with a credible transitional framework can help deter further repression and support stability.",
+    "Given ongoing violence, massacres, censorship, and propaganda, international recognition of the Iranian people’s expressed will is critically important. Supporting a credible transitional framework can help deter further repression and contribute to stability.",
+    "Given the regime’s violence, censorship, and propaganda, international recognition of the expressed will of Iranians is critically important. Constructive engagement with a credible transition framework can help deter further repression and support stability.",
+    "In light of widespread violence and systematic suppression of independent media, international recognition of the Iranian people’s expressed will is crucial. Supporting a credible transitional framework can help deter further repression and contribute to regional and global stability.",
+    "Given violence, censorship, and propaganda, international recognition of these domestic calls is critically important. Constructive engagement with a credible transition framework can help deter further repression and support stability.",
+    "Given widespread violence and systematic silencing of independent media, international recognition of the expressed will of Iranians is vital. Supporting a credible transitional framework can help deter further repression and contribute to stability.",
+    "Given the regime’s violence and its systematic suppression of independent media, international recognition of these calls is critically important. Constructive engagement with a credible transition framework can help deter further repression and support stability.",
+    "Given violence, censorship, and propaganda, international recognition of the Iranian people’s expressed will is critically important. Supporting a credible transitional framework can help deter further repression and contribute to regional and global stability.",
+    "Given the scale of violence and systematic suppression of independent media, international recognition of the Iranian people’s expressed will is crucial. Constructive engagement with a credible transition framework can help deter further repression and support stability.",
+    "Given violence, censorship, and propaganda, international recognition of the expressed will of Iranians is critically important. Supporting a credible transitional framework can help deter further repression and contribute to stability regionally and globally.",
+    "Given ongoing violence and systematic silencing of independent media alongside propaganda, international recognition of the expressed will of the Iranian people is vital. Constructive engagement with a credible transition framework can help deter further repression and support stability.",
+    "Given violence, massacres, censorship, and propaganda, international recognition of the Iranian people’s expressed will is critically important. Supporting a credible transitional framework can help deter further repression and contribute to stability.",
+    "Given the regime’s violence and systematic silencing of independent media, international recognition of the expressed will of Iranians is vital. Constructive engagement with a credible transition framework can help deter further repression and support stability.",
+    "Given ongoing violence, censorship, and propaganda, international recognition of these domestic calls is critically important. Supporting a credible transitional framework can help deter further repression and contribute to regional and global stability.",
+]
+
+# Sign-off line before the references.
+CLOSINGS = [
+    "Thank you for your time and consideration.",
+]
+
+
+# The original 21 hand-written drafts, as (opening, situation, roadmap,
+# appeal, closing) choices; they keep draft indices 0-20.
+CURATED_DRAFTS = [
+    (0, 0, 0, 0, 0),
+    (1, 1, 1, 1, 0),
+    (2, 2, 2, 2, 0),
+    (3, 3, 3, 3, 0),
+    (4, 4, 4, 4, 0),
+    (5, 5, 5, 5, 0),
+    (6, 6, 6, 6, 0),
+    (7, 7, 7, 7, 0),
+    (8, 8, 8, 8, 0),
+    (9, 9, 9, 9, 0),
+    (10, 10, 10, 10, 0),
+    (11, 11, 11, 11, 0),
+    (12, 12, 12, 12, 0),
+    (13, 13, 13, 13, 0),
+    (14, 14, 14, 14, 0),
+    (15, 15, 15, 15, 0),
+    (16, 16, 16, 16, 0),
+    (17, 17, 17, 17, 0),
+    (18, 18, 18, 18, 0),
+    (19, 19, 19, 19, 0),
+    (20, 20, 4, 20, 0),
+]
+
+
+# Every combination, indexable in O(1); fails at import if any combination
+# could miss the required slogans.
+EMAIL_TEMPLATES = TemplateSpace(
+    (OPENINGS, SITUATIONS, ROADMAPS, APPEALS, CLOSINGS),
+    references=REFERENCES_BLOCK,
+    curated=CURATED_DRAFTS,
+    required=(SLOGANS_REQUIRED,),
+)
+
+
+# ---------------------------
+# Subject options (rotates)
+# ---------------------------
+SUBJECT_OPTIONS = [
+    "Iran: Recognition of Reza Pahlavi as a Transitional Leader",
+    "Iran: Supporting Reza Pahlavi’s Roadmap for Democratic Transition",
+    "Iran: Responding to the Iranian People’s Call for Reza Pahlavi",
+    "Iran: Engagement with Reza Pahlavi’s Transitional Framework",
+    "Iran: Supporting a Peaceful Transition Led by Reza Pahlavi",
+    "Iran: Recognition of Reza Pahlavi’s Role in Democratic Transition",
+    "Iran: Supporting Reza Pahlavi as a Transitional Leader Chosen by the People",
+    "Iran: Reza Pahlavi and a Credible Path to Democratic Transition",
+    "Iran: Recognition of Reza Pahlavi’s Transitional Leadership"
+]
+
+
+# ---------------------------
+# Greeting + signoff (added around every template body)
+# ---------------------------
+GREETING = "Dear Senator/Member of Parliament,"
+
+
+def build_full_body(body_only: str, name: str) -> str:
+    signoff = f"Sincerely,\n{name}"
+    return f"{GREETING}\n\n{body_only}\n\n{signoff}"
@@ -0,0 +1,31 @@
+# Draft helpers: template rotation and mailto URL building.
+
+import random
+import urllib.parse
+from collections.abc import Sequence
+
+
+# ---------------------------
+# Helpers: template choice (different from last)
+# ---------------------------
+def pick_new_index(exclude_index: int | None, n: int, rng: random.Random | None = None) -> int:
+    # Uniform over range(n) minus exclude_index, without materialising the
+    # range: n is the size of the whole draft space. Same draws as
+    # choice(list(range(n)) minus exclude_index) for a given rng state.
+    if n <= 1:
+        return 0
+    rng = rng or random
+    if exclude_index is None or not 0 <= exclude_index < n:
+        return rng.randrange(n)
+    pick = rng.randrange(n - 1)
+    return pick + 1 if pick >= exclude_index else pick
+
+
+# ---------------------------
+# Helpers: build mailto 
+# ---------------------------
+def build_mailto_bcc_link(bcc_emails: Sequence[str], subject: str, body: str) -> str:
+    bcc_value = ",".join(bcc_emails)
+    params = {"bcc": bcc_value, "subject": subject, "body": body}
+    query = "&".join(f"{k}={urllib.parse.quote(v, safe='')}" for k, v in params.items())
+    return f"mailto:?{query}"
@@ -0,0 +1,264 @@
+# Pre-encoded mailto engine.
+# The BCC list, every subject and every body paragraph are percent-encoded
+# once; a draft then only encodes the sender's name and concatenates. The
+# output is byte-identical to build_mailto_bcc_link(recipients, subject, build_full_body(...)).
+
+import bisect
+import itertools
+import threading
+import urllib.parse
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import NamedTuple
+
+from .corpus import EMAIL_TEMPLATES, SUBJECT_OPTIONS, build_full_body
+from .filters import ContactIndex, SubsetKey
+from .templates import EncodedTemplateSpace, TemplateSpace
+
+# quote(",") -- what joins encoded addresses inside the bcc value.
+_ENCODED_COMMA = "%2C"
+
+# Budget for the recipient subsets (filter masks) kept per engine, in
+# approximate bytes (see DraftEngine.nbytes): big lists keep fewer subsets.
+SUBSET_CACHE_BYTES = 64 * 1024 * 1024
+
+# Stand in for the body and the sender's name when splitting build_full_body's frame.
+_BODY_MARKER = "\x00"
+_NAME_MARKER = "\x01"
+
+
+def _quote(value: str) -> str:
+    return urllib.parse.quote(value, safe="")
+
+
+class DraftDescriptor(NamedTuple):
+    """Everything needed to rebuild a draft's link(s); what a session keeps instead of the URLs."""
+
+    template_index: int
+    subject_index: int
+    name: str
+    subset_key: SubsetKey = ()
+    max_link_bytes: int | None = None
+    contact_set: str = ""  # registry key of the contact set it was generated for
+
+
+class _EncodedBodies:
+    """(prefix, suffix) around the name for every draft of a TemplateSpace, built on demand.
+
+    quote(prefix + name + suffix) == quote(prefix) + quote(name) + quote(suffix),
+    and the body inside the prefix is joined from pre-encoded paragraphs.
+    """
+
+    __slots__ = ("encoded", "head", "mid", "tail", "max_len")
+
+    def __init__(self, space: TemplateSpace) -> None:
+        self.encoded: EncodedTemplateSpace[str] = space.encoded(_quote)
+        head, rest = build_full_body(_BODY_MARKER, _NAME_MARKER).split(_BODY_MARKER)
+        mid, tail = rest.split(_NAME_MARKER)
+        self.head, self.mid, self.tail = _quote(head), _quote(mid), _quote(tail)
+        # Longest prefix + suffix over the whole space: the longest paragraph of each bank.
+        banks = self.encoded.banks
+        self.max_len = (
+            len(self.head) + len(self.mid) + len(self.tail) + len(self.encoded.tail)
+            + sum(max(map(len, bank)) for bank in banks) + (len(banks) - 1) * len(self.encoded.separator)
+        )
+
+    def __len__(self) -> int:
+        return len(self.encoded)
+
+    def __getitem__(self, index: int) -> tuple[str, str]:
+        return f"{self.head}{self.encoded[index]}{self.mid}", self.tail
+
+
+class DraftEngine:
+    def __init__(
+        self,
+        bcc_emails: Sequence[str],
+        templates: Sequence[str] = EMAIL_TEMPLATES,
+        subjects: Sequence[str] = SUBJECT_OPTIONS,
+    ) -> None:
+        self._subjects = tuple(_quote(s) for s in subjects)
+        self._subject_parts = tuple(f"&subject={s}&body=" for s in self._subjects)
+        self._longest_subject = max(map(len, self._subjects))
+        if not isinstance(templates, TemplateSpace):
+            templates = TemplateSpace.from_templates(templates)
+        self._bodies = _EncodedBodies(templates)
+
+        self._set_recipients(bcc_emails, tuple(_quote(e) for e in bcc_emails))
+
+    def _set_recipients(self, bcc_emails: Sequence[str], encoded_addresses: tuple[str, ...]) -> None:
+        self.recipients = bcc_emails
+        self.encoded_addresses = encoded_addresses
+        # The one copy of the joined BCC; build() puts it in front of the subject.
+        self.encoded_bcc = _ENCODED_COMMA.join(encoded_addresses)
+        self._longest_address = max(map(len, encoded_addresses), default=0)
+
+        # _cumulative[j] - _cumulative[i] - len("%2C") is the encoded length of
+        # the bcc value for addresses[i:j]; used to pack batches with bisect.
+        self._cumulative = tuple(
+            itertools.accumulate((len(a) + len(_ENCODED_COMMA) for a in encoded_addresses), initial=0)
+        )
+
+        self._subset_lock = threading.Lock()
+        self._subsets: OrderedDict[int, DraftEngine] = OrderedDict()
+        self._subsets_nbytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate bytes this engine's recipient state adds (the shared bodies not counted)."""
+        # The joined BCC, plus per recipient: two tuple slots, an offset int and its slot.
+        return len(self.encoded_bcc) + 52 * len(self.recipients)
+
+    def encoded_parts(self) -> dict:
+        """The pre-encoded pieces build() concatenates, for re-use outside Python (see static_export)."""
+        bodies = self._bodies
+        space = bodies.encoded.space
+        return {
+            "bcc": self.encoded_bcc,
+            "subjects": list(self._subjects),
+            "head": bodies.head,
+            "mid": bodies.mid,
+            "tail": bodies.tail,
+            "banks": [list(bank) for bank in bodies.encoded.banks],
+            "separator": bodies.encoded.separator,
+            "references": bodies.encoded.tail,
+            "curated": list(space.curated),
+            "displaced": {str(d): r for d, r in space.displaced.items()},
+        }
+
+    @property
+    def n_templates(self) -> int:
+        return len(self._bodies)
+
+    @property
+    def n_subjects(self) -> int:
+        return len(self._subjects)
+
+    def _derive(self, bcc_emails: Sequence[str], encoded_addresses: tuple[str, ...]) -> "DraftEngine":
+        # Shares the already-encoded subjects and bodies; only the BCC parts are new.
+        engine = object.__new__(DraftEngine)
+        engine._subjects = self._subjects
+        engine._subject_parts = self._subject_parts
+        engine._longest_subject = self._longest_subject
+        engine._bodies = self._bodies
+        engine._set_recipients(bcc_emails, encoded_addresses)
+        return engine
+
+    def with_recipients(self, bcc_emails: Sequence[str]) -> "DraftEngine":
+        """Engine for an updated contact list; only addresses this engine hasn't seen get encoded."""
+        known = dict(zip(self.recipients, self.encoded_addresses))
+        return self._derive(bcc_emails, tuple(known.get(e) or _quote(e) for e in bcc_emails))
+
+    def subset(self, mask: int) -> "DraftEngine":
+        """Engine over the recipients whose bits are set in mask (see ContactIndex), LRU-cached."""
+        if mask == (1 << len(self.recipients)) - 1:
+            return self
+        with self._subset_lock:
+            engine = self._subsets.get(mask)
+            if engine is not None:
+                self._subsets.move_to_end(mask)
+                return engine
+
+        positions = ContactIndex.positions(mask)
+        engine = self._derive(
+            tuple(self.recipients[i] for i in positions),
+            tuple(self.encoded_addresses[i] for i in positions),
+        )
+
+        with self._subset_lock:
+            previous = self._subsets.pop(mask, None)
+            if previous is not None:
+                self._subsets_nbytes -= previous.nbytes
+            self._subsets[mask] = engine
+            self._subsets_nbytes += engine.nbytes
+            # The newest subset stays even if it alone is over budget.
+            while self._subsets_nbytes > SUBSET_CACHE_BYTES and len(self._subsets) > 1:
+                self._subsets_nbytes -= self._subsets.popitem(last=False)[1].nbytes
+        return engine
+
+    def build(self, template_index: int, subject_index: int, name: str) -> str:
+        prefix, suffix = self._bodies[template_index]
+        return f"mailto:?bcc={self.encoded_bcc}{self._subject_parts[subject_index]}{prefix}{_quote(name)}{suffix}"
+
+    # ---------------------------
+    # Batching under a URL byte budget
+    # ---------------------------
+    def batch_bounds(self, template_index: int, subject_index: int, name: str, max_bytes: int) -> list[tuple[int, int]]:
+        """Split recipients into the fewest contiguous [start, end) ranges whose links fit in max_bytes."""
+        prefix, suffix = self._bodies[template_index]
+        fixed = len(f"mailto:?bcc={self._subject_parts[subject_index]}{prefix}{_quote(name)}{suffix}")
+        room = max_bytes - fixed + len(_ENCODED_COMMA)
+
+        bounds = []
+        start, n = 0, len(self.encoded_addresses)
+        while start < n:
+            end = bisect.bisect_right(self._cumulative, self._cumulative[start] + room, lo=start + 1) - 1
+            if end <= start:
+                raise ValueError(
+                    f"A {max_bytes}-byte link cannot fit this draft: the subject and body alone "
+                    f"take {fixed} bytes."
+                )
+            bounds.append((start, end))
+            start = end
+        return bounds
+
+    def min_link_bytes(self, name: str) -> int:
+        """Smallest budget that fits every draft for `name` with at least one recipient per link."""
+        return (
+            len("mailto:?bcc=&subject=&body=") + self._longest_subject + self._bodies.max_len + len(_quote(name))
+            + self._longest_address
+        )
+
+    def build_batches(self, template_index: int, subject_index: int, name: str, max_bytes: int) -> list[str]:
+        prefix, suffix = self._bodies[template_index]
+        tail = f"{self._subject_parts[subject_index]}{prefix}{_quote(name)}{suffix}"
+        return [
+            f"mailto:?bcc={_ENCODED_COMMA.join(self.encoded_addresses[start:end])}{tail}"
+            for start, end in self.batch_bounds(template_index, subject_index, name, max_bytes)
+        ]
+
+
+    def render(self, draft: DraftDescriptor, index: ContactIndex) -> list[str]:
+        """The draft's link, or its batches if it has a byte budget the single link exceeds."""
+        engine = self.subset(index.mask(dict(draft.subset_key)))
+        url = engine.build(draft.template_index, draft.subject_index, draft.name)
+        if draft.max_link_bytes is None or len(url) <= draft.max_link_bytes:
+            return [url]
+        return engine.build_batches(draft.template_index, draft.subject_index, draft.name, draft.max_link_bytes)
+
+
+# ---------------------------
+# Shared engine (rebuilt only when the recipient snapshot changes)
+# ---------------------------
+# One engine per loaded contact set (plus the one a reload just replaced, for
+# reruns that fetched the old snapshot just before the swap), keyed on the
+# identity of the recipients tuple RecipientCache hands every session.
+ENGINE_CACHE_SIZE = 8
+
+_engine_lock = threading.Lock()
+_engines: OrderedDict[int, DraftEngine] = OrderedDict()
+
+
+def _install(engine: DraftEngine) -> None:
+    _engines[id(engine.recipients)] = engine
+    _engines.move_to_end(id(engine.recipients))
+    while len(_engines) > ENGINE_CACHE_SIZE:
+        _engines.popitem(last=False)
+
+
+def publish_draft_engine(engine: DraftEngine) -> None:
+    # Lets the contacts watcher hand over an engine it built off the request path.
+    with _engine_lock:
+        _install(engine)
+
+
+def get_draft_engine(recipients: Sequence[str]) -> DraftEngine:
+    engine = _engines.get(id(recipients))
+    if engine is not None and engine.recipients is recipients:
+        return engine
+    with _engine_lock:
+        engine = _engines.get(id(recipients))
+        if engine is None or engine.recipients is not recipients:
+            engine = DraftEngine(recipients)
+            _install(engine)
+        return engine
@@ -0,0 +1,87 @@
+# Recipient filtering by chamber / state / party.
+# Each (column, value) pair is a bitset over recipient positions, held as a
+# Python int, so any combination of filters is a handful of big-int ORs/ANDs
+# instead of a DataFrame scan. The resulting mask doubles as the subset key.
+
+from collections.abc import Iterable, Mapping, Sequence
+
+FILTER_COLUMNS = ("chamber", "state", "party")
+
+# Canonical, hashable form of a filter selection, e.g. (("chamber", ("Senate",)), ("state", ("VIC",))).
+# Unlike a mask it stays meaningful when the contact list is reloaded.
+SubsetKey = tuple[tuple[str, tuple[str, ...]], ...]
+
+
+def subset_key(filters: Mapping[str, Iterable[str]]) -> SubsetKey:
+    return tuple(
+        (column, tuple(sorted(set(values))))
+        for column, values in sorted(filters.items())
+        if values
+    )
+
+
+class ContactIndex:
+    def __init__(
+        self,
+        n: int,
+        columns: Mapping[str, Sequence[str]],
+        reuse: "ContactIndex | None" = None,
+        reuse_columns: Iterable[str] = (),
+    ) -> None:
+        self.n = n
+        self.all_mask = (1 << n) - 1
+        self._bitsets: dict[str, dict[str, int]] = {}
+        # Columns the caller knows are unchanged (same rows, same values) keep their bitsets.
+        reuse_columns = set(reuse_columns) if reuse is not None and reuse.n == n else set()
+        for column, values in columns.items():
+            if column in reuse_columns and column in reuse._bitsets:
+                self._bitsets[column] = reuse._bitsets[column]
+                continue
+            positions: dict[str, list[int]] = {}
+            for i, value in enumerate(values):
+                if value:
+                    positions.setdefault(value, []).append(i)
+            self._bitsets[column] = {value: _to_mask(pos) for value, pos in positions.items()}
+
+    def values(self, column: str) -> list[str]:
+        return sorted(self._bitsets.get(column, {}))
+
+    def mask(self, filters: Mapping[str, Iterable[str]]) -> int:
+        """OR within a column, AND across columns; an empty selection means "any"."""
+        mask = self.all_mask
+        for column, selected in filters.items():
+            bitsets = self._bitsets.get(column)
+            selected = list(selected)
+            if not selected or bitsets is None:
+                continue
+            column_mask = 0
+            for value in selected:
+                column_mask |= bitsets.get(value, 0)
+            mask &= column_mask
+        return mask
+
+    @staticmethod
+    def count(mask: int) -> int:
+        return mask.bit_count()
+
+    @staticmethod
+    def positions(mask: int) -> list[int]:
+        # One pass over the mask's bytes, skipping empty ones.
+        out = []
+        for byte_index, byte in enumerate(mask.to_bytes((mask.bit_length() + 7) // 8, "little")):
+            if byte:
+                base = byte_index << 3
+                out.extend(base + bit for bit in range(8) if byte >> bit & 1)
+        return out
+
+
+def _to_mask(positions: Iterable[int]) -> int:
+    # Building via a bytearray keeps this linear for tens of thousands of rows
+    # (repeated `mask |= 1 << i` would be quadratic in the int size).
+    positions = list(positions)
+    if not positions:
+        return 0
+    buf = bytearray(max(positions) // 8 + 1)
+    for i in positions:
+        buf[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buf, "little")
@@ -0,0 +1,276 @@
+# Opt-in hot-path instrumentation for the Streamlit app.
+#
+#   TL_METRICS=1                   record stage timings, URL sizes, picks and sessions
+#   TL_METRICS_PORT=9108           also serve them as Prometheus text on /metrics
+#   TL_METRICS_HOST=127.0.0.1      interface /metrics binds to (0.0.0.0 to expose it)
+#   TL_METRICS_LOG_INTERVAL=60     also log a JSON snapshot every N seconds (to stderr
+#                                  unless logging is configured)
+#
+# With TL_METRICS unset every hook is a no-op: timed() hands back a shared
+# null context manager and the record_* functions return immediately.
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .corpus import EMAIL_TEMPLATES
+from .recipients import get_recipient_cache
+from .rotation import get_rotation
+
+logger = logging.getLogger(__name__)
+
+ENABLED = os.environ.get("TL_METRICS", "").strip().lower() not in {"", "0", "false", "no", "off"}
+
+# Seconds; Streamlit reruns land in the ms range, CSV parses can take longer.
+STAGE_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+URL_BYTE_BUCKETS = (1024, 2048, 4096, 8192, 16384, 32768, 65536, 131072, 262144)
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                break
+        else:
+            i = len(self.buckets)
+        self.counts[i] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.stages: dict[str, Histogram] = {}
+        self.url_bytes = Histogram(URL_BYTE_BUCKETS)
+        # Per (bank, paragraph) rather than per draft: the draft space is too
+        # large for one label per index, the paragraph banks stay small.
+        self.paragraph_picks: Counter[tuple[int, int]] = Counter()
+        self.subject_picks: Counter[int] = Counter()
+        self.sessions = 0
+        self.reruns = 0
+
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            hist = self.stages.get(stage)
+            if hist is None:
+                hist = self.stages[stage] = Histogram(STAGE_BUCKETS)
+            hist.observe(seconds)
+
+    def observe_url(self, n_bytes: int) -> None:
+        with self._lock:
+            self.url_bytes.observe(n_bytes)
+
+    def count_pick(self, template_index: int, subject_index: int) -> None:
+        with self._lock:
+            for bank, paragraph in enumerate(EMAIL_TEMPLATES.indices(template_index)):
+                self.paragraph_picks[bank, paragraph] += 1
+            self.subject_picks[subject_index] += 1
+
+    def count_session(self) -> None:
+        with self._lock:
+            self.sessions += 1
+
+    def count_rerun(self) -> None:
+        with self._lock:
+            self.reruns += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "stages": {
+                    name: {"count": h.count, "sum_s": round(h.sum, 6), "mean_ms": round(h.sum / h.count * 1000, 3)}
+                    for name, h in self.stages.items()
+                    if h.count
+                },
+                "url_bytes": {"count": self.url_bytes.count, "sum": int(self.url_bytes.sum)},
+                "paragraph_picks": {f"{b}:{p}": v for (b, p), v in sorted(self.paragraph_picks.items())},
+                "subject_picks": dict(sorted(self.subject_picks.items())),
+                "sessions": self.sessions,
+                "reruns": self.reruns,
+            }
+
+    def render_prometheus(self, extra_counters: dict[str, float] | None = None) -> str:
+        out: list[str] = []
+        with self._lock:
+            out += ["# HELP tl_stage_seconds Time spent in each hot-path stage.", "# TYPE tl_stage_seconds histogram"]
+            for name, hist in sorted(self.stages.items()):
+                out += _histogram_lines("tl_stage_seconds", hist, f'stage="{name}",')
+            out += ["# HELP tl_mailto_url_bytes Size of generated mailto URLs.", "# TYPE tl_mailto_url_bytes histogram"]
+            out += _histogram_lines("tl_mailto_url_bytes", self.url_bytes, "")
+            out += ["# HELP tl_paragraph_picks_total Drafts picked, by paragraph bank and paragraph.", "# TYPE tl_paragraph_picks_total counter"]
+            out += [
+                f'tl_paragraph_picks_total{{bank="{b}",paragraph="{p}"}} {v}'
+                for (b, p), v in sorted(self.paragraph_picks.items())
+            ]
+            out += ["# TYPE tl_subject_picks_total counter"]
+            out += [f'tl_subject_picks_total{{subject="{k}"}} {v}' for k, v in sorted(self.subject_picks.items())]
+            out += ["# TYPE tl_sessions_total counter", f"tl_sessions_total {self.sessions}"]
+            out += ["# TYPE tl_reruns_total counter", f"tl_reruns_total {self.reruns}"]
+        for name, value in (extra_counters or {}).items():
+            out += [f"# TYPE {name} counter", f"{name} {value}"]
+        return "\n".join(out) + "\n"
+
+
+def _histogram_lines(metric: str, hist: Histogram, labels: str) -> list[str]:
+    lines = []
+    cumulative = 0
+    for bound, count in zip((*hist.buckets, "+Inf"), hist.counts):
+        cumulative += count
+        lines.append(f'{metric}_bucket{{{labels}le="{bound}"}} {cumulative}')
+    trimmed = labels.rstrip(",")
+    suffix = f"{{{trimmed}}}" if trimmed else ""
+    lines.append(f"{metric}_sum{suffix} {hist.sum}")
+    lines.append(f"{metric}_count{suffix} {hist.count}")
+    return lines
+
+
+registry = Registry()
+
+
+# ---------------------------
+# Hooks used on the hot path
+# ---------------------------
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _StageTimer:
+    __slots__ = ("stage", "_start")
+
+    def __init__(self, stage: str) -> None:
+        self.stage = stage
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        registry.observe_stage(self.stage, time.perf_counter() - self._start)
+
+
+def timed(stage: str) -> "_StageTimer | _NullTimer":
+    return _StageTimer(stage) if ENABLED else _NULL_TIMER
+
+
+def record_stage(stage: str, seconds: float) -> None:
+    if ENABLED:
+        registry.observe_stage(stage, seconds)
+
+
+def record_url(url: str) -> None:
+    if ENABLED:
+        registry.observe_url(len(url))
+
+
+def record_pick(template_index: int, subject_index: int) -> None:
+    if ENABLED:
+        registry.count_pick(template_index, subject_index)
+
+
+def record_session() -> None:
+    if ENABLED:
+        registry.count_session()
+
+
+def record_rerun() -> None:
+    if ENABLED:
+        registry.count_rerun()
+
+
+# ---------------------------
+# Exporters
+# ---------------------------
+_exporters_lock = threading.Lock()
+_exporters_started = False
+
+
+def _process_counters() -> dict[str, float]:
+    stats = get_recipient_cache().stats()
+    rotation = get_rotation().stats()
+    return {
+        "tl_recipient_cache_hits_total": stats["hits"],
+        "tl_recipient_cache_misses_total": stats["misses"],
+        "tl_rotation_picks_total": rotation["picks"],
+        "tl_rotation_cycles_total": rotation["full_cycles"],
+    }
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = registry.render_prometheus(_process_counters()).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def _enable_log_output() -> None:
+    # Python's default is WARNING with no handlers (Streamlit only configures its
+    # own loggers), which would swallow the INFO snapshots. Deployments that set
+    # up logging themselves keep their handlers.
+    logger.setLevel(logging.INFO)
+    if not logger.hasHandlers():
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+        logger.addHandler(handler)
+
+
+def _log_periodically(interval: float) -> None:
+    while True:
+        time.sleep(interval)
+        logger.info(json.dumps({"event": "tl_metrics", **registry.snapshot(), **_process_counters()}))
+
+
+def start_exporters() -> None:
+    """Start the /metrics server and/or periodic log line once per process, per TL_METRICS_* env."""
+    global _exporters_started
+    if not ENABLED or _exporters_started:
+        return
+    with _exporters_lock:
+        if _exporters_started:
+            return
+        _exporters_started = True
+
+        port = os.environ.get("TL_METRICS_PORT")
+        if port:
+            host = os.environ.get("TL_METRICS_HOST") or "127.0.0.1"
+            try:
+                server = ThreadingHTTPServer((host, int(port)), _MetricsHandler)
+            except (OSError, ValueError) as e:
+                # A busy port mustn't take the app down; this process just goes without /metrics.
+                logger.warning("metrics endpoint not started on %s:%s: %s", host, port, e)
+            else:
+                threading.Thread(target=server.serve_forever, name="tl-metrics-http", daemon=True).start()
+
+        interval = os.environ.get("TL_METRICS_LOG_INTERVAL")
+        if interval:
+            _enable_log_output()
+            threading.Thread(
+                target=_log_periodically, args=(float(interval),), name="tl-metrics-log", daemon=True
+            ).start()
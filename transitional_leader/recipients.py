@@ -0,0 +1,212 @@
+# Recipient loading: CSV parsing, email cleanup, the compiled contact store
+# and the shared snapshot cache.
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .filters import FILTER_COLUMNS, ContactIndex
+from .store import ContactStore, StoreSource, write_store
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# The AU contact list ships next to the Streamlit entry point.
+DEFAULT_CSV_PATH = Path(__file__).resolve().parent.parent / "au_parliament_contacts.csv"
+
+
+# ---------------------------
+# Helpers: recipients
+# ---------------------------
+def find_email_column(df: pd.DataFrame) -> str | None:
+    candidates = ["email", "Email", "EMAIL", "e-mail", "E-mail", "mail", "Mail"]
+    for c in candidates:
+        if c in df.columns:
+            return c
+    for c in df.columns:
+        if "email" in str(c).lower():
+            return c
+    return None
+
+
+def load_contacts(csv_path: Path) -> tuple[list[str], dict[str, list[str]]]:
+    """Cleaned, de-duplicated emails plus the FILTER_COLUMNS values of each one's first row."""
+    if not csv_path.exists():
+        raise FileNotFoundError(
+            f"Missing required file: {csv_path.name}. Place it in the same folder as this app."
+        )
+
+    import pandas as pd  # deferred: only paid when the CSV is actually (re)parsed
+
+    from .normalize import normalize_emails
+
+    df = pd.read_csv(csv_path)
+    email_col = find_email_column(df)
+    if not email_col:
+        raise ValueError("Could not find an email column in the CSV. Please ensure it has a column named 'email'.")
+
+    result = normalize_emails(df[email_col])
+    if result.rejections:
+        logger.info(
+            "%s: dropped %d of %d addresses (%s)",
+            csv_path.name,
+            len(result.rejections),
+            len(result.emails) + len(result.rejections),
+            ", ".join(f"{n} {reason}" for reason, n in Counter(r.reason for r in result.rejections).most_common()),
+        )
+    cleaned = result.emails
+    attrs = {
+        c: df[c].fillna("").astype(str).str.strip().take(result.rows).tolist()
+        for c in FILTER_COLUMNS
+        if c in df.columns
+    }
+
+    if not cleaned:
+        raise ValueError("No valid email addresses were found in the CSV.")
+    return cleaned, attrs
+
+
+def load_recipients(csv_path: Path) -> list[str]:
+    return load_contacts(csv_path)[0]
+
+
+# ---------------------------
+# Helpers: shared recipient snapshot
+# ---------------------------
+@dataclass(frozen=True)
+class RecipientSnapshot:
+    path: str
+    mtime_ns: int
+    size: int
+    emails: tuple[str, ...]
+    index: ContactIndex
+    # FILTER_COLUMNS values aligned with emails, and a digest of the file's bytes
+    # (stable across touch/copy, unlike mtime; used for HTTP ETags).
+    attrs: dict[str, tuple[str, ...]]
+    content_hash: str
+
+
+def _stat_key(csv_path: Path) -> tuple[str, int, int]:
+    try:
+        stat = csv_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Missing required file: {csv_path.name}. Place it in the same folder as this app."
+        ) from None
+    return str(csv_path), stat.st_mtime_ns, stat.st_size
+
+
+def store_path_for(csv_path: Path) -> Path:
+    # Compiled next to the CSV unless TL_STORE_DIR points somewhere writable.
+    directory = os.environ.get("TL_STORE_DIR")
+    return (Path(directory) if directory else csv_path.parent) / f"{csv_path.stem}.tlcs"
+
+
+def read_contacts(csv_path: Path, key: tuple[str, int, int]) -> tuple[list[str], dict[str, list[str]], str]:
+    """(emails, attrs, content hash) for csv_path, from its compiled store when that is current.
+
+    The CSV is only parsed (and the store rewritten) when the store is missing or
+    was compiled from different content; a fresh store is read without pandas.
+    """
+    store_path = store_path_for(csv_path)
+    try:
+        store = ContactStore(store_path)
+    except (OSError, ValueError):
+        store = None
+    try:
+        if store is not None and (store.source.mtime_ns, store.source.size) == key[1:]:
+            return (*store.contacts(), store.source.sha256)
+
+        content_hash = hashlib.sha256(csv_path.read_bytes()).hexdigest()
+        if store is not None and store.source.sha256 == content_hash:
+            emails, attrs = store.contacts()  # touched but unchanged: just restamp
+        else:
+            emails, attrs = load_contacts(csv_path)
+    finally:
+        if store is not None:
+            store.close()
+
+    if _stat_key(csv_path) != key:
+        # Rewritten while we read it: don't stamp a store with a mix of versions.
+        return emails, attrs, content_hash
+    try:
+        write_store(store_path, emails, attrs, StoreSource(key[1], key[2], content_hash))
+    except OSError as e:
+        logger.warning("could not write contact store %s: %s", store_path, e)
+    return emails, attrs, content_hash
+
+
+def build_snapshot(csv_path: Path, key: tuple[str, int, int]) -> RecipientSnapshot:
+    emails, attrs, content_hash = read_contacts(csv_path, key)
+    return RecipientSnapshot(
+        *key,
+        emails=tuple(emails),
+        index=ContactIndex(len(emails), attrs),
+        attrs={c: tuple(v) for c, v in attrs.items()},
+        content_hash=content_hash,
+    )
+
+
+class RecipientCache:
+    """Process-wide recipient snapshots, one per CSV, each rebuilt only when its (path, mtime, size) changes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._snapshots: dict[str, RecipientSnapshot] = {}
+        self.watched_paths: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, csv_path: Path) -> RecipientSnapshot:
+        path = str(csv_path)
+        # A ContactWatcher on this file keeps the snapshot fresh off the request
+        # path, so there's nothing to stat or parse here.
+        snapshot = self._snapshots.get(path)
+        if snapshot is not None and path in self.watched_paths:
+            self.hits += 1
+            return snapshot
+
+        key = _stat_key(csv_path)
+        if snapshot is not None and (snapshot.path, snapshot.mtime_ns, snapshot.size) == key:
+            self.hits += 1
+            return snapshot
+
+        with self._lock:
+            # Another session may have rebuilt it while we waited for the lock.
+            snapshot = self._snapshots.get(path)
+            if snapshot is not None and (snapshot.path, snapshot.mtime_ns, snapshot.size) == key:
+                self.hits += 1
+                return snapshot
+            self.misses += 1
+            snapshot = build_snapshot(csv_path, key)
+            self._snapshots[path] = snapshot
+            return snapshot
+
+    def current(self, csv_path: Path) -> RecipientSnapshot | None:
+        return self._snapshots.get(str(csv_path))
+
+    def publish(self, snapshot: RecipientSnapshot) -> None:
+        # A single reference assignment: readers see the old snapshot or the new
+        # one, never a half-built list.
+        with self._lock:
+            self._snapshots[snapshot.path] = snapshot
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "loaded": len(self._snapshots)}
+
+
+# Module-level, so every session in the process shares the same instance.
+_recipient_cache = RecipientCache()
+
+
+def get_recipient_cache() -> RecipientCache:
+    return _recipient_cache
@@ -0,0 +1,151 @@
+# Registry of contact sets (one per legislature), each backed by a CSV named
+# "<key>_..._contacts.csv", e.g. au_parliament_contacts.csv or
+# uk_parliament_contacts.csv, in TL_CONTACTS_DIR (default: the app folder).
+#
+#   python -m transitional_leader.registry list       # sets, sizes, store status
+#   python -m transitional_leader.registry compile    # (re)build every compiled store
+#
+# Listing a set costs a directory scan; its contacts are only loaded, through
+# the compiled store, when a session first selects it.
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from .recipients import DEFAULT_CSV_PATH, _stat_key, read_contacts, store_path_for
+from .store import ContactStore
+
+# Display names (label, audience, Persian audience) for the legislatures we
+# expect; unknown keys fall back to the key itself.
+KNOWN_SETS = {
+    "au": ("Australia", "Australian Senators and MPs", "نمایندگان استرالیا"),
+    "ca": ("Canada", "Canadian Senators and MPs", "نمایندگان کانادا"),
+    "eu": ("European Parliament", "Members of the European Parliament", "نمایندگان پارلمان اروپا"),
+    "uk": ("United Kingdom", "UK MPs and Peers", "نمایندگان بریتانیا"),
+    "us": ("United States", "US Senators and Representatives", "نمایندگان ایالات متحده"),
+}
+CSV_SUFFIX = "_contacts.csv"
+
+
+@dataclass(frozen=True)
+class ContactSet:
+    key: str
+    label: str
+    audience: str
+    audience_fa: str
+    csv_path: Path
+
+
+def contact_set_for(csv_path: Path) -> ContactSet:
+    key = csv_path.stem.split("_", 1)[0].lower()
+    label, audience, audience_fa = KNOWN_SETS.get(
+        key, (key.upper(), f"{key.upper()} legislators", f"نمایندگان پارلمان {key.upper()}")
+    )
+    return ContactSet(key, label, audience, audience_fa, csv_path)
+
+
+class ContactRegistry:
+    def __init__(self, sets: Iterable[ContactSet]) -> None:
+        self._sets: dict[str, ContactSet] = {}
+        for s in sets:
+            if s.key in self._sets:
+                raise ValueError(
+                    f"Contact sets {self._sets[s.key].csv_path.name} and {s.csv_path.name} "
+                    f"share the key {s.key!r}; keep one file per key."
+                )
+            self._sets[s.key] = s
+        if not self._sets:
+            raise ValueError("No contact sets found.")
+
+    @classmethod
+    def from_directory(cls, directory: Path) -> "ContactRegistry":
+        # Australia first (the app's original audience), then alphabetical.
+        paths = sorted(directory.glob(f"*{CSV_SUFFIX}"), key=lambda p: (not p.name.startswith("au_"), p.name))
+        return cls(contact_set_for(p) for p in paths)
+
+    def __getitem__(self, key: str) -> ContactSet:
+        return self._sets[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._sets
+
+    def __iter__(self) -> Iterator[ContactSet]:
+        return iter(self._sets.values())
+
+    def __len__(self) -> int:
+        return len(self._sets)
+
+    def keys(self) -> list[str]:
+        return list(self._sets)
+
+    @property
+    def default(self) -> ContactSet:
+        return next(iter(self._sets.values()))
+
+
+_registry_lock = threading.Lock()
+_registries: dict[tuple[str, str], ContactRegistry] = {}
+
+
+def get_contact_registry() -> ContactRegistry:
+    """Process-wide registry: TL_CONTACTS_CSV pins a single set, else TL_CONTACTS_DIR is scanned.
+
+    Cached per (TL_CONTACTS_CSV, TL_CONTACTS_DIR), so changing either (as the
+    benchmarks do between table sizes) yields the matching registry.
+    """
+    single = os.environ.get("TL_CONTACTS_CSV") or ""
+    directory = os.environ.get("TL_CONTACTS_DIR") or str(DEFAULT_CSV_PATH.parent)
+    key = (single, "" if single else directory)
+    registry = _registries.get(key)
+    if registry is None:
+        with _registry_lock:
+            registry = _registries.get(key)
+            if registry is None:
+                if single:
+                    registry = ContactRegistry([contact_set_for(Path(single))])
+                else:
+                    registry = ContactRegistry.from_directory(Path(directory))
+                _registries[key] = registry
+    return registry
+
+
+# ---------------------------
+# CLI
+# ---------------------------
+def _store_status(contact_set: ContactSet) -> tuple[str, int | None]:
+    try:
+        _, mtime_ns, size = _stat_key(contact_set.csv_path)
+        with ContactStore(store_path_for(contact_set.csv_path)) as store:
+            fresh = (store.source.mtime_ns, store.source.size) == (mtime_ns, size)
+            return ("current" if fresh else "stale"), store.n
+    except (OSError, ValueError):
+        return "missing", None
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m transitional_leader.registry", description="Contact set registry.")
+    parser.add_argument("command", choices=["list", "compile"])
+    parser.add_argument("--dir", type=Path, help="contacts directory (default: TL_CONTACTS_DIR or the app folder)")
+    args = parser.parse_args(argv)
+
+    registry = ContactRegistry.from_directory(args.dir) if args.dir else get_contact_registry()
+    for contact_set in registry:
+        if args.command == "compile":
+            store_path_for(contact_set.csv_path).unlink(missing_ok=True)
+            emails, _, _ = read_contacts(contact_set.csv_path, _stat_key(contact_set.csv_path))
+            print(f"{contact_set.key}: compiled {len(emails)} contacts -> {store_path_for(contact_set.csv_path)}")
+        else:
+            status, n = _store_status(contact_set)
+            size = f"{n} contacts" if n is not None else "not compiled"
+            print(f"{contact_set.key:<4} {contact_set.label:<22} {size:<16} store {status}  {contact_set.csv_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
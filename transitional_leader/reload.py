@@ -0,0 +1,174 @@
+# Hot reload of the contacts CSV.
+#
+# A ContactWatcher thread polls the file's (mtime, size), parses a changed file
+# off the request path, diffs it against the live snapshot and rebuilds only
+# what the diff touches: addresses already percent-encoded are carried over
+# into the new DraftEngine, and per-column filter bitsets are kept when the
+# rows and that column are unchanged. The new engine and snapshot are then
+# published by reference assignment, so a rerun sees either the old list or
+# the new one in full, and never pays for the parse.
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from .engine import get_draft_engine, publish_draft_engine
+from .filters import ContactIndex
+from .recipients import RecipientSnapshot, _stat_key, get_recipient_cache, read_contacts
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 2.0
+
+
+@dataclass(frozen=True)
+class ContactDiff:
+    added: tuple[str, ...]
+    removed: tuple[str, ...]
+    changed: tuple[str, ...]  # same email, different chamber/state/party
+    reordered: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed or self.reordered)
+
+    def __str__(self) -> str:
+        return f"+{len(self.added)} -{len(self.removed)} ~{len(self.changed)}"
+
+
+def diff_contacts(old: RecipientSnapshot, emails: tuple[str, ...], attrs: dict[str, tuple]) -> ContactDiff:
+    # One tuple of filter values per email; the trailing column keeps zip() going when there are none.
+    blank = ("",) * len(old.emails)
+    old_rows = dict(zip(old.emails, zip(*(old.attrs.get(c, blank) for c in attrs), old.emails)))
+    new_rows = dict(zip(emails, zip(*attrs.values(), emails)))
+    return ContactDiff(
+        added=tuple(e for e in emails if e not in old_rows),
+        removed=tuple(e for e in old.emails if e not in new_rows),
+        changed=tuple(e for e in emails if e in old_rows and old_rows[e] != new_rows[e]),
+        reordered=[e for e in emails if e in old_rows] != [e for e in old.emails if e in new_rows],
+    )
+
+
+class _FileChanging(Exception):
+    """The CSV changed while it was being parsed; try again on the next poll."""
+
+
+def reload_snapshot(csv_path: Path, current: RecipientSnapshot) -> tuple[RecipientSnapshot, ContactDiff]:
+    """Parse csv_path and build a snapshot that re-uses whatever `current` already derived."""
+    key = _stat_key(csv_path)
+    emails, attrs, content_hash = read_contacts(csv_path, key)
+    if _stat_key(csv_path) != key:
+        raise _FileChanging(csv_path)
+    emails = tuple(emails)
+    attrs = {c: tuple(v) for c, v in attrs.items()}
+    diff = diff_contacts(current, emails, attrs)
+
+    same_rows = emails == current.emails
+    if same_rows:
+        # Keep the tuple's identity so get_draft_engine (and its subset LRU) carries straight over.
+        emails = current.emails
+        unchanged = [c for c in attrs if current.attrs.get(c) == attrs[c]]
+        index = (
+            current.index
+            if len(unchanged) == len(attrs) == len(current.attrs)
+            else ContactIndex(len(emails), attrs, reuse=current.index, reuse_columns=unchanged)
+        )
+    else:
+        index = ContactIndex(len(emails), attrs)
+        # Install the engine before the snapshot so the first rerun to see the
+        # new emails finds a ready engine instead of encoding the list itself.
+        publish_draft_engine(get_draft_engine(current.emails).with_recipients(emails))
+
+    snapshot = RecipientSnapshot(
+        *key,
+        emails=emails,
+        index=index,
+        attrs=attrs,
+        content_hash=content_hash,
+    )
+    return snapshot, diff
+
+
+class ContactWatcher(threading.Thread):
+    """Daemon thread that keeps the shared RecipientCache snapshot of one CSV up to date."""
+
+    def __init__(
+        self,
+        csv_path: Path,
+        interval: float = DEFAULT_POLL_INTERVAL,
+        on_change: Callable[[RecipientSnapshot, ContactDiff], None] | None = None,
+    ) -> None:
+        super().__init__(name="tl-contact-watcher", daemon=True)
+        self.csv_path = Path(csv_path)
+        self.interval = interval
+        self.on_change = on_change
+        self.reloads = 0
+        self._stop_event = threading.Event()
+
+    def poll(self) -> bool:
+        """Check the file once; returns True if a new snapshot was published."""
+        cache = get_recipient_cache()
+        current = cache.current(self.csv_path)
+        try:
+            key = _stat_key(self.csv_path)
+        except FileNotFoundError:
+            # Mid-replace (or deleted): keep serving the last good list.
+            return False
+        if current is None:
+            cache.get(self.csv_path)
+            return True
+        if (current.path, current.mtime_ns, current.size) == key:
+            return False
+
+        try:
+            snapshot, diff = reload_snapshot(self.csv_path, current)
+        except (_FileChanging, FileNotFoundError):
+            return False
+        except ValueError as e:
+            logger.warning("contacts reload skipped, keeping the current list: %s", e)
+            # Remember the bad version so it isn't re-parsed every poll.
+            cache.publish(dataclasses.replace(current, path=key[0], mtime_ns=key[1], size=key[2]))
+            return False
+
+        cache.publish(snapshot)
+        self.reloads += 1
+        logger.info("contacts reloaded from %s (%s)", self.csv_path.name, diff)
+        if self.on_change is not None:
+            self.on_change(snapshot, diff)
+        return True
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("contacts watcher poll failed")
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+_watchers_lock = threading.Lock()
+_watchers: dict[str, ContactWatcher] = {}
+
+
+def start_contact_watcher(csv_path: Path, interval: float = DEFAULT_POLL_INTERVAL) -> ContactWatcher:
+    """Start (once per process) the watcher for csv_path and route RecipientCache.get through it."""
+    key = str(csv_path)
+    watcher = _watchers.get(key)
+    if watcher is not None:
+        return watcher
+    with _watchers_lock:
+        watcher = _watchers.get(key)
+        if watcher is None:
+            cache = get_recipient_cache()
+            cache.get(csv_path)  # first load stays synchronous so the watcher has a baseline
+            watcher = ContactWatcher(csv_path, interval)
+            watcher.start()
+            _watchers[key] = watcher
+            cache.watched_paths.add(key)
+        return watcher
@@ -0,0 +1,145 @@
+# Process-wide rotation of (template, subject) pairs across every session.
+#
+# Per-session random picks let thousands of visitors land on the same few
+# drafts in the same minute, and used to tie each template to one subject.
+# Instead every pick in the process takes the next slot of one shared cursor,
+# and slot k maps to pair (offset + stride * k) mod (templates * subjects):
+#
+#   - a full cycle hands out every pair exactly once, so at any moment usage
+#     counts differ by at most one and are computed from the cursor, not stored;
+#   - the stride is coprime with the cycle and close to cycle / golden ratio,
+#     so consecutive slots land far apart in the template space (never on the
+#     same template) and any run of n_subjects slots uses every subject once;
+#   - the offset is random per process, so workers don't march in step.
+#
+# A pick is an integer increment under a short lock plus a divmod: O(1). A
+# slot that would repeat a session's previous template is parked on a deque
+# for the next session to take, so it is delayed rather than lost.
+
+from __future__ import annotations
+
+import math
+import random
+import threading
+from collections import deque
+
+from .corpus import EMAIL_TEMPLATES, SUBJECT_OPTIONS
+
+_GOLDEN = (math.sqrt(5) - 1) / 2
+
+
+def _stride(size: int, n_subjects: int) -> int:
+    """Step coprime with `size`, near size / golden ratio, at least n_subjects from 0 and size."""
+    if size < 2 * n_subjects:
+        return 1
+    start = round(size * _GOLDEN)
+    for delta in range(size):
+        for a in (start + delta, start - delta):
+            if n_subjects <= a <= size - n_subjects and math.gcd(a, size) == 1:
+                return a
+    return 1
+
+
+class Rotation:
+    def __init__(self, n_templates: int, n_subjects: int, seed: int | None = None) -> None:
+        if n_templates < 1 or n_subjects < 1:
+            raise ValueError("Rotation needs at least one template and one subject.")
+        self.n_templates = n_templates
+        self.n_subjects = n_subjects
+        self.size = n_templates * n_subjects
+        self.stride = _stride(self.size, n_subjects)
+        self._inverse = pow(self.stride, -1, self.size)
+        self.offset = random.Random(seed).randrange(self.size)
+        self._issued = 0  # slots taken from the cursor so far, parked ones included
+        self._subjects_issued = 0  # subjects handed out by pick_subject, on a cursor of their own
+        self._lock = threading.Lock()
+        self._parked: deque[int] = deque()
+
+    def pair(self, slot: int) -> tuple[int, int]:
+        """(template index, subject index) of cursor slot `slot`."""
+        return divmod((self.offset + self.stride * slot) % self.size, self.n_subjects)
+
+    def pick(self, exclude_template: int | None = None) -> tuple[int, int]:
+        """Next (template, subject) pair, skipping the caller's previous template."""
+        held = []
+        while True:
+            try:
+                slot = self._parked.popleft()
+            except IndexError:
+                with self._lock:
+                    slot = self._issued
+                    self._issued += 1
+            template, subject = self.pair(slot)
+            if template != exclude_template or self.n_templates == 1:
+                self._parked.extend(held)
+                return template, subject
+            held.append(slot)
+
+    def pick_subject(self) -> int:
+        """Next subject for callers that pinned the template themselves.
+
+        Takes no pair slot, so usage() and template_usage() only count pairs
+        that were handed out; subject_usage() includes these picks.
+        """
+        with self._lock:
+            k = self._subjects_issued
+            self._subjects_issued += 1
+        return (self.offset + k) % self.n_subjects
+
+    # ---------------------------
+    # Usage counts
+    # ---------------------------
+    def _snapshot(self) -> tuple[int, list[int]]:
+        return self._issued, list(self._parked)
+
+    def picks(self) -> int:
+        issued, parked = self._snapshot()
+        return issued - len(parked)
+
+    def usage(self, template: int, subject: int) -> int:
+        """How many times the pair has been handed out."""
+        issued, parked = self._snapshot()
+        rank = ((template * self.n_subjects + subject - self.offset) * self._inverse) % self.size
+        cycles, rest = divmod(issued, self.size)
+        return cycles + (rank < rest) - sum(1 for slot in parked if slot % self.size == rank)
+
+    def template_usage(self, template: int) -> int:
+        return sum(self.usage(template, s) for s in range(self.n_subjects))
+
+    def subject_usage(self) -> list[int]:
+        # Slot k has subject s iff k is congruent to (s - offset) / stride mod n_subjects.
+        issued, parked = self._snapshot()
+        counts = []
+        for s in range(self.n_subjects):
+            r = ((s - self.offset) * self._inverse) % self.n_subjects
+            counts.append(issued // self.n_subjects + (r < issued % self.n_subjects))
+        for slot in parked:
+            counts[self.pair(slot)[1]] -= 1
+        pinned = self._subjects_issued
+        for s in range(self.n_subjects):
+            r = (s - self.offset) % self.n_subjects
+            counts[s] += pinned // self.n_subjects + (r < pinned % self.n_subjects)
+        return counts
+
+    def stats(self) -> dict:
+        picks = self.picks()
+        return {
+            "picks": picks,
+            "pairs": self.size,
+            "full_cycles": picks // self.size,
+            "subject_picks": self.subject_usage(),
+        }
+
+
+_rotation_lock = threading.Lock()
+_rotation: Rotation | None = None
+
+
+def get_rotation() -> Rotation:
+    """Process-wide rotation over EMAIL_TEMPLATES x SUBJECT_OPTIONS, shared by every session."""
+    global _rotation
+    if _rotation is None:
+        with _rotation_lock:
+            if _rotation is None:
+                _rotation = Rotation(len(EMAIL_TEMPLATES), len(SUBJECT_OPTIONS))
+    return _rotation
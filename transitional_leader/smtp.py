@@ -0,0 +1,462 @@
+# Optional server-side send mode.
+# A small asyncio SMTP client (stdlib only) with a pool of persistent
+# connections, PIPELINING when the relay offers it, per-recipient-domain rate
+# limiting, retries with exponential backoff and a bounded submission queue.
+# Messages are assembled from the same templates/subjects/greeting as the
+# mailto drafts; recipients travel only in the envelope (never in a Bcc header).
+
+import asyncio
+import base64
+import concurrent.futures
+import os
+import random
+import ssl
+import threading
+import time
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from email.headerregistry import Address
+from email.message import EmailMessage
+from email.policy import SMTP as SMTP_POLICY
+from email.utils import formatdate, make_msgid
+
+from .corpus import EMAIL_TEMPLATES, SUBJECT_OPTIONS, build_full_body
+
+
+@dataclass(frozen=True)
+class SmtpConfig:
+    host: str
+    port: int = 587
+    username: str | None = None
+    password: str | None = None
+    from_address: str = ""
+    starttls: bool = True
+    use_tls: bool = False
+    local_hostname: str = "localhost"
+    timeout: float = 30.0
+    pool_size: int = 3
+    queue_size: int = 100
+    # Token bucket per recipient domain: sustained messages/second and burst.
+    domain_rate: float = 1.0
+    domain_burst: int = 5
+    max_retries: int = 3
+    backoff_base: float = 0.5
+
+    def __post_init__(self) -> None:
+        # Every message is sent From this address; without one compose_message can't build a header.
+        local, _, domain = self.from_address.partition("@")
+        if not local or not domain:
+            raise ValueError("SMTP sending needs a From address (TL_SMTP_FROM_ADDRESS), e.g. campaign@example.org.")
+
+    @classmethod
+    def from_env(cls, prefix: str = "TL_SMTP_") -> "SmtpConfig | None":
+        """Config from TL_SMTP_* environment variables; None when TL_SMTP_HOST is unset.
+
+        Raises ValueError when TL_SMTP_HOST is set but the rest is incomplete.
+        """
+        env = {k[len(prefix):].lower(): v for k, v in os.environ.items() if k.startswith(prefix)}
+        if not env.get("host"):
+            return None
+        kwargs: dict = {}
+        for f in cls.__dataclass_fields__.values():
+            if f.name not in env:
+                continue
+            raw = env[f.name]
+            if f.type is bool:
+                kwargs[f.name] = raw.strip().lower() in {"1", "true", "yes", "on"}
+            elif f.type in (int, float):
+                kwargs[f.name] = f.type(raw)
+            else:
+                kwargs[f.name] = raw
+        return cls(**kwargs)
+
+
+class SmtpError(Exception):
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(f"{code} {message}")
+        self.code = code
+        self.message = message
+
+    @property
+    def transient(self) -> bool:
+        return 400 <= self.code < 500
+
+
+class SenderBusy(Exception):
+    """The send queue is full; the caller should ask the user to try again shortly."""
+
+
+# ---------------------------
+# Message assembly
+# ---------------------------
+def compose_message(
+    name: str,
+    template_index: int,
+    subject_index: int,
+    from_address: str,
+    reply_to: str | None = None,
+) -> bytes:
+    msg = EmailMessage(policy=SMTP_POLICY)
+    msg["From"] = Address(display_name=name, addr_spec=from_address)
+    msg["To"] = "undisclosed-recipients:;"
+    if reply_to:
+        msg["Reply-To"] = reply_to
+    msg["Subject"] = SUBJECT_OPTIONS[subject_index]
+    msg["Date"] = formatdate(localtime=True)
+    msg["Message-ID"] = make_msgid(domain=from_address.rpartition("@")[2] or None)
+    msg.set_content(build_full_body(EMAIL_TEMPLATES[template_index], name))
+    return msg.as_bytes()
+
+
+@dataclass(frozen=True)
+class OutgoingMessage:
+    sender: str
+    recipients: tuple[str, ...]
+    data: bytes
+
+
+@dataclass(frozen=True)
+class SendResult:
+    refused: dict[str, tuple[int, str]]
+    attempts: int
+    latency: float
+
+
+# ---------------------------
+# One SMTP connection
+# ---------------------------
+class SmtpConnection:
+    def __init__(self, config: SmtpConfig) -> None:
+        self.config = config
+        self.extensions: dict[str, str] = {}
+        self.ready = False
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    @property
+    def connected(self) -> bool:
+        return self.ready and self._writer is not None and not self._writer.is_closing()
+
+    async def connect(self) -> None:
+        cfg = self.config
+        self.ready = False
+        tls_context = ssl.create_default_context() if (cfg.use_tls or cfg.starttls) else None
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(cfg.host, cfg.port, ssl=tls_context if cfg.use_tls else None),
+            cfg.timeout,
+        )
+        await self._expect(220)
+        await self._ehlo()
+        if cfg.starttls and not cfg.use_tls:
+            if "starttls" not in self.extensions:
+                raise SmtpError(554, "relay does not offer STARTTLS")
+            await self._command(b"STARTTLS", 220)
+            await self._writer.start_tls(tls_context)
+            await self._ehlo()
+        if cfg.username:
+            token = base64.b64encode(f"\0{cfg.username}\0{cfg.password or ''}".encode()).decode()
+            await self._command(f"AUTH PLAIN {token}".encode(), 235)
+        self.ready = True
+
+    async def close(self) -> None:
+        self.ready = False
+        writer, self._writer = self._writer, None
+        if writer is None:
+            return
+        try:
+            if not writer.is_closing():
+                writer.write(b"QUIT\r\n")
+                await asyncio.wait_for(writer.drain(), 1.0)
+            writer.close()
+            await asyncio.wait_for(writer.wait_closed(), 1.0)
+        except (OSError, asyncio.TimeoutError):
+            pass
+
+    async def send(self, message: OutgoingMessage) -> dict[str, tuple[int, str]]:
+        """One transaction; returns refused recipients. Raises SmtpError if nobody was accepted."""
+        commands = [f"MAIL FROM:<{message.sender}>".encode()]
+        commands += [f"RCPT TO:<{r}>".encode() for r in message.recipients]
+        commands.append(b"DATA")
+
+        if "pipelining" in self.extensions:
+            self._writer.write(b"".join(c + b"\r\n" for c in commands))
+            await self._writer.drain()
+            replies = [await self._read_reply() for _ in commands]
+        else:
+            replies = []
+            for c in commands:
+                replies.append(await self._send_line(c))
+                if c.startswith(b"MAIL") and replies[-1][0] != 250:
+                    break
+
+        mail_code, mail_text = replies[0]
+        if mail_code != 250:
+            await self._reset()
+            raise SmtpError(mail_code, mail_text)
+        refused = {
+            r: reply for r, reply in zip(message.recipients, replies[1:-1]) if reply[0] not in (250, 251)
+        }
+        data_code, data_text = replies[-1] if len(replies) == len(commands) else (503, "DATA not sent")
+        if data_code != 354:
+            await self._reset()
+            if len(refused) == len(message.recipients):
+                # Surface the recipients' own rejection; if it was only 4xx the send is retried.
+                data_code, data_text = max(refused.values())
+            raise SmtpError(data_code, data_text)
+
+        self._writer.write(_dot_stuff(message.data))
+        await self._writer.drain()
+        code, text = await self._read_reply()
+        if code != 250:
+            raise SmtpError(code, text)
+        return refused
+
+    # ---------------------------
+    # Protocol helpers
+    # ---------------------------
+    async def _ehlo(self) -> None:
+        code, text = await self._send_line(f"EHLO {self.config.local_hostname}".encode())
+        if code != 250:
+            raise SmtpError(code, text)
+        self.extensions = {}
+        for line in text.splitlines()[1:]:
+            keyword, _, params = line.partition(" ")
+            self.extensions[keyword.lower()] = params
+
+    async def _reset(self) -> None:
+        try:
+            await self._send_line(b"RSET")
+        except (OSError, asyncio.TimeoutError, SmtpError):
+            await self.close()
+
+    async def _command(self, line: bytes, expected: int) -> str:
+        code, text = await self._send_line(line)
+        if code != expected:
+            raise SmtpError(code, text)
+        return text
+
+    async def _send_line(self, line: bytes) -> tuple[int, str]:
+        self._writer.write(line + b"\r\n")
+        await self._writer.drain()
+        return await self._read_reply()
+
+    async def _expect(self, expected: int) -> None:
+        code, text = await self._read_reply()
+        if code != expected:
+            raise SmtpError(code, text)
+
+    async def _read_reply(self) -> tuple[int, str]:
+        lines = []
+        while True:
+            raw = await asyncio.wait_for(self._reader.readline(), self.config.timeout)
+            if not raw:
+                raise ConnectionResetError("SMTP server closed the connection")
+            line = raw.decode("utf-8", "replace").rstrip("\r\n")
+            lines.append(line[4:])
+            if line[3:4] != "-":
+                return int(line[:3]), "\n".join(lines)
+
+
+def _dot_stuff(data: bytes) -> bytes:
+    data = data.replace(b"\r\n", b"\n").replace(b"\n", b"\r\n")
+    if data.startswith(b"."):
+        data = b"." + data
+    data = data.replace(b"\r\n.", b"\r\n..")
+    if not data.endswith(b"\r\n"):
+        data += b"\r\n"
+    return data + b".\r\n"
+
+
+# ---------------------------
+# Per-domain rate limiting
+# ---------------------------
+class TokenBucket:
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+# ---------------------------
+# Pooled sender
+# ---------------------------
+@dataclass
+class SendStats:
+    sent: int = 0
+    failed: int = 0
+    retries: int = 0
+    latencies: deque = field(default_factory=lambda: deque(maxlen=10_000))
+
+    def percentile(self, q: float) -> float | None:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class SmtpSender:
+    """pool_size workers, each holding one persistent connection, fed by a bounded queue."""
+
+    def __init__(self, config: SmtpConfig) -> None:
+        self.config = config
+        self.stats = SendStats()
+        self._queue: asyncio.Queue | None = None
+        self._workers: list[asyncio.Task] = []
+        self._buckets: dict[str, TokenBucket] = {}
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue(self.config.queue_size)
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.config.pool_size)]
+
+    async def stop(self) -> None:
+        await self._queue.join()
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def __aenter__(self) -> "SmtpSender":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    def submit_nowait(self, message: OutgoingMessage) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((message, future, time.perf_counter()))
+        except asyncio.QueueFull:
+            raise SenderBusy("Too many emails are being sent right now. Please try again shortly.") from None
+        return future
+
+    async def submit(self, message: OutgoingMessage) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((message, future, time.perf_counter()))
+        return future
+
+    async def send(self, message: OutgoingMessage) -> SendResult:
+        return await (await self.submit(message))
+
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize() if self._queue else 0
+
+    async def _worker(self) -> None:
+        conn = SmtpConnection(self.config)
+        try:
+            while True:
+                message, future, enqueued = await self._queue.get()
+                try:
+                    result = await self._deliver(conn, message, enqueued)
+                except Exception as e:
+                    self.stats.failed += 1
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    self.stats.sent += 1
+                    self.stats.latencies.append(result.latency)
+                    if not future.done():
+                        future.set_result(result)
+                finally:
+                    self._queue.task_done()
+        finally:
+            await conn.close()
+
+    async def _deliver(self, conn: SmtpConnection, message: OutgoingMessage, enqueued: float) -> SendResult:
+        for domain in sorted({r.rpartition("@")[2].lower() for r in message.recipients}):
+            bucket = self._buckets.get(domain)
+            if bucket is None:
+                bucket = self._buckets[domain] = TokenBucket(self.config.domain_rate, self.config.domain_burst)
+            await bucket.acquire()
+
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                if not conn.connected:
+                    await conn.connect()
+                refused = await conn.send(message)
+                return SendResult(refused, attempt, time.perf_counter() - enqueued)
+            except (SmtpError, OSError, asyncio.TimeoutError) as e:
+                if isinstance(e, SmtpError) and not e.transient:
+                    raise
+                # A 4xx reply leaves an established session usable; socket errors,
+                # timeouts, 421 and failed handshakes do not.
+                if not isinstance(e, SmtpError) or e.code == 421 or not conn.connected:
+                    await conn.close()
+                if attempt > self.config.max_retries:
+                    raise
+                self.stats.retries += 1
+                delay = self.config.backoff_base * 2 ** (attempt - 1)
+                await asyncio.sleep(delay * random.uniform(0.5, 1.5))
+
+
+# ---------------------------
+# Thread bridge for Streamlit (scripts run in threads, not on an event loop)
+# ---------------------------
+class BackgroundSender:
+    def __init__(self, config: SmtpConfig) -> None:
+        self.sender = SmtpSender(config)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="smtp-sender", daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.sender.start(), self._loop).result()
+
+    def send(self, message: OutgoingMessage) -> concurrent.futures.Future:
+        """Queue a message; raises SenderBusy immediately if the queue is full."""
+        queued = asyncio.run_coroutine_threadsafe(_enqueue(self.sender, message), self._loop).result()
+        return asyncio.run_coroutine_threadsafe(_await(queued), self._loop)
+
+    def close(self) -> None:
+        asyncio.run_coroutine_threadsafe(self.sender.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+async def _enqueue(sender: SmtpSender, message: OutgoingMessage) -> asyncio.Future:
+    return sender.submit_nowait(message)
+
+
+async def _await(future: asyncio.Future) -> SendResult:
+    return await future
+
+
+_background_lock = threading.Lock()
+_background: BackgroundSender | None = None
+
+
+def get_background_sender(config: SmtpConfig) -> BackgroundSender:
+    global _background
+    with _background_lock:
+        if _background is None or _background.sender.config != config:
+            if _background is not None:
+                _background.close()
+            _background = BackgroundSender(config)
+        return _background
+
+
+def build_outgoing(
+    config: SmtpConfig,
+    recipients: Sequence[str],
+    name: str,
+    template_index: int,
+    subject_index: int,
+    reply_to: str | None = None,
+) -> OutgoingMessage:
+    data = compose_message(name, template_index, subject_index, config.from_address, reply_to)
+    return OutgoingMessage(config.from_address, tuple(recipients), data)
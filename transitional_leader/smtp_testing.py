@@ -0,0 +1,83 @@
+# In-process SMTP stand-in for exercising the sender without a relay: an
+# asyncio server on 127.0.0.1 that speaks just enough ESMTP, can answer every
+# Nth DATA with a 451, and counts what it accepted. No mail leaves the machine.
+# Used by tests/test_smtp.py and benchmarks/smtp_send.py.
+
+import asyncio
+
+
+class LocalSmtpServer:
+    """Just enough ESMTP (EHLO/MAIL/RCPT/DATA/RSET/NOOP/QUIT, PIPELINING) to exercise the client."""
+
+    def __init__(self, pipelining: bool = True, fail_every: int = 0, reply_delay: float = 0.0) -> None:
+        self.pipelining = pipelining
+        self.fail_every = fail_every
+        self.reply_delay = reply_delay
+        self.messages = 0
+        self.recipients = 0
+        self.accepted: list[bytes] = []  # DATA of every accepted message, dot-stuffing removed
+        self.connections = 0
+        self._transactions = 0
+        self._server: asyncio.base_events.Server | None = None
+        self._handlers: set[asyncio.Task] = set()
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self._server.close()
+        await asyncio.wait_for(asyncio.gather(*self._handlers, return_exceptions=True), 5.0)
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        task.add_done_callback(self._handlers.discard)
+
+        async def reply(line: str) -> None:
+            if self.reply_delay:
+                await asyncio.sleep(self.reply_delay)
+            writer.write(line.encode() + b"\r\n")
+
+        await reply("220 localhost ESMTP stand-in")
+        rcpts = 0
+        try:
+            while raw := await reader.readline():
+                verb = raw[:4].upper()
+                if verb == b"EHLO":
+                    await reply("250-localhost\r\n250-8BITMIME" + ("\r\n250-PIPELINING" if self.pipelining else "") + "\r\n250 SIZE 10485760")
+                elif verb == b"MAIL":
+                    rcpts = 0
+                    await reply("250 OK")
+                elif verb == b"RCPT":
+                    rcpts += 1
+                    await reply("250 OK")
+                elif verb == b"DATA":
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    await writer.drain()
+                    data = []
+                    while (line := await reader.readline()) != b".\r\n":
+                        if not line:
+                            return
+                        data.append(line[1:] if line.startswith(b"..") else line)
+                    self._transactions += 1
+                    if self.fail_every and self._transactions % self.fail_every == 0:
+                        await reply("451 Temporary local problem")
+                    else:
+                        self.messages += 1
+                        self.recipients += rcpts
+                        self.accepted.append(b"".join(data))
+                        await reply("250 Queued")
+                elif verb == b"RSET" or verb == b"NOOP":
+                    await reply("250 OK")
+                elif verb == b"QUIT":
+                    await reply("221 Bye")
+                    await writer.drain()
+                    break
+                else:
+                    await reply("502 Command not implemented")
+                await writer.drain()
+        finally:
+            writer.close()
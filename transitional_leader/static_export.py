@@ -0,0 +1,236 @@
+# Static export: a self-contained HTML/JS page that builds the mailto link in
+# the browser, so a CDN or plain file server can take viral traffic with zero
+# server reruns per click.
+#
+#   python -m transitional_leader.static_export --out site/index.html
+#   python -m transitional_leader.static_export --out site/index.html --verify
+#
+# The page embeds DraftEngine.encoded_parts() (BCC list, subjects and body
+# paragraph banks already percent-encoded); per click the browser picks a draft
+# index, decodes it to one paragraph per bank and encodes only the name,
+# exactly like DraftEngine.build. --verify runs the embedded JS under Node and
+# checks it against build_mailto_bcc_link for every subject with the curated
+# drafts and a sample of the rest.
+
+import argparse
+import html
+import json
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+
+from .corpus import EMAIL_TEMPLATES, SUBJECT_OPTIONS, build_full_body
+from .drafts import build_mailto_bcc_link
+from .engine import DraftEngine
+from .filters import FILTER_COLUMNS, ContactIndex
+from .recipients import DEFAULT_CSV_PATH, load_contacts
+from .registry import KNOWN_SETS, contact_set_for
+
+# Same semantics as the Python side: urllib.parse.quote(name, safe=""),
+# TemplateSpace.indices and pick_new_index (uniform over every index except
+# the previous pick). The subject is not derived from the draft index: each
+# page starts at a random subject and steps through them one per click.
+ENGINE_JS = r"""
+function tlQuote(value) {
+  // encodeURIComponent leaves !'()* alone; urllib.parse.quote(safe="") does not.
+  return encodeURIComponent(value).replace(/[!'()*]/g,
+    (c) => "%" + c.charCodeAt(0).toString(16).toUpperCase());
+}
+
+function tlDraftCount(data) {
+  return data.banks.reduce((n, bank) => n * bank.length, 1);
+}
+
+function tlEncodedBody(data, draftIndex) {
+  // Curated drafts are pinned to the first indices; the rest is mixed-radix.
+  let r = draftIndex < data.curated.length ? data.curated[draftIndex]
+    : (data.displaced[draftIndex] ?? draftIndex);
+  const parts = new Array(data.banks.length);
+  for (let k = data.banks.length - 1; k >= 0; k--) {
+    const n = data.banks[k].length;
+    parts[k] = data.banks[k][r % n];
+    r = Math.floor(r / n);
+  }
+  return parts.join(data.separator) + data.references;
+}
+
+function tlBuildUrl(data, draftIndex, subjectIndex, name) {
+  return "mailto:?bcc=" + data.bcc + "&subject=" + data.subjects[subjectIndex] +
+    "&body=" + data.head + tlEncodedBody(data, draftIndex) + data.mid + tlQuote(name) + data.tail;
+}
+
+function tlPickNewIndex(excludeIndex, n) {
+  if (n <= 1) return 0;
+  if (excludeIndex === null || excludeIndex < 0 || excludeIndex >= n) {
+    return Math.floor(Math.random() * n);
+  }
+  const pick = Math.floor(Math.random() * (n - 1));
+  return pick >= excludeIndex ? pick + 1 : pick;
+}
+"""
+
+PAGE_TEMPLATE = """<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Email Draft Generator</title>
+<style>
+  body {{ font-family: system-ui, -apple-system, "Segoe UI", sans-serif; max-width: 46rem; margin: 2rem auto; padding: 0 1rem; color: #262730; }}
+  h3, h5 {{ text-align: center; }}
+  .rtl {{ direction: rtl; }}
+  .caption {{ color: #6b6f7b; font-size: 0.9rem; }}
+  .info {{ background: #e8f0fe; border-radius: 0.5rem; padding: 0.8rem 1rem; }}
+  .warning {{ background: #fff4e5; border-radius: 0.5rem; padding: 0.8rem 1rem; }}
+  label {{ display: block; margin: 1rem 0 0.3rem; font-size: 0.9rem; }}
+  input {{ width: 100%; box-sizing: border-box; padding: 0.5rem; font-size: 1rem; }}
+  .button {{ display: block; width: 100%; box-sizing: border-box; margin: 0.8rem 0; padding: 0.6rem; text-align: center;
+            font-size: 1rem; border: 1px solid #d0d3da; border-radius: 0.5rem; background: #fff; color: inherit; text-decoration: none; cursor: pointer; }}
+  .button:hover {{ border-color: #ff4b4b; color: #ff4b4b; }}
+  [hidden] {{ display: none !important; }}
+</style>
+</head>
+<body>
+<h3>Sending Email to {audience} in Support of the Iranian National Revolution and Crown Prince Reza Pahlavi as a Transitional Leader</h3>
+<h5 class="rtl">ارسال ایمیل به {audience_fa} در حمایت از انقلاب ملی ایران و شاهزاده رضا پهلوی به‌عنوان رهبر دوران گذار</h5>
+<p class="caption">Enter your name and open a prefilled email with all recipients included in BCC.</p>
+<p class="info">This tool can be used by anyone, anywhere in the world, no matter where you live. | این ابزار برای همه افراد، در هر نقطه‌ای از جهان و فارغ از محل سکونت، قابل استفاده است.</p>
+
+<label for="name">Your name (English)</label>
+<input id="name" autocomplete="name">
+<button id="generate" class="button" type="button">Step 1: Generate draft email</button>
+<p id="warning" class="warning" hidden>Please enter your name first.</p>
+<a id="open" class="button" hidden>Step 2: Open email in your email app</a>
+
+<p class="caption">Note: This tool opens a draft email in your email app with all recipients included in BCC.
+The photo album and YouTube references are included as clickable links in the email body.</p>
+
+<script>
+const TL_DATA = {data};
+{engine_js}
+(function () {{
+  let lastPick = null;
+  let subjectPick = Math.floor(Math.random() * TL_DATA.subjects.length);
+  const name = document.getElementById("name");
+  const warning = document.getElementById("warning");
+  const open = document.getElementById("open");
+  document.getElementById("generate").addEventListener("click", function () {{
+    const trimmed = name.value.trim();
+    if (!trimmed) {{
+      warning.hidden = false;
+      return;
+    }}
+    warning.hidden = true;
+    lastPick = tlPickNewIndex(lastPick, tlDraftCount(TL_DATA));
+    subjectPick = (subjectPick + 1) % TL_DATA.subjects.length;
+    open.href = tlBuildUrl(TL_DATA, lastPick, subjectPick, trimmed);
+    open.hidden = false;
+  }});
+}})();
+</script>
+</body>
+</html>
+"""
+
+
+def render_page(
+    engine: DraftEngine,
+    audience: str = KNOWN_SETS["au"][1],
+    audience_fa: str = KNOWN_SETS["au"][2],
+) -> str:
+    # Percent-encoded data is pure ASCII; only "</" needs escaping inside <script>.
+    data = json.dumps(engine.encoded_parts(), separators=(",", ":")).replace("</", "<\\/")
+    return PAGE_TEMPLATE.format(
+        audience=html.escape(audience),
+        audience_fa=html.escape(audience_fa),
+        data=data,
+        engine_js=ENGINE_JS.strip(),
+    )
+
+
+# ---------------------------
+# Parity check (needs Node.js)
+# ---------------------------
+PARITY_NAMES = ["Jane Doe", "Zoë O’Brien", "A & B ?=/#%+", "it's (a) *test*!", "رضا پهلوی", "😀 emoji", ""]
+
+
+PARITY_SAMPLE = 100
+
+
+def verify_with_node(engine: DraftEngine, names: Sequence[str] = PARITY_NAMES) -> int:
+    """Run the embedded JS under Node and compare with build_mailto_bcc_link; returns cases checked."""
+    node = shutil.which("node")
+    if node is None:
+        raise RuntimeError("--verify needs Node.js on PATH")
+
+    n_curated = len(EMAIL_TEMPLATES.curated)
+    drafts = [
+        *range(n_curated),
+        *random.Random(0).sample(range(n_curated, len(EMAIL_TEMPLATES)), PARITY_SAMPLE),
+        len(EMAIL_TEMPLATES) - 1,
+    ]
+    cases = [
+        (t, s, name)
+        for t in drafts
+        for s in range(len(SUBJECT_OPTIONS))
+        for name in names
+    ]
+    script = (
+        f"const TL_DATA = {json.dumps(engine.encoded_parts())};\n{ENGINE_JS}\n"
+        f"const cases = {json.dumps(cases)};\n"
+        "process.stdout.write(JSON.stringify(cases.map(([t, s, n]) => tlBuildUrl(TL_DATA, t, s, n))));\n"
+    )
+    with tempfile.NamedTemporaryFile("w", suffix=".js", encoding="utf-8", delete=False) as f:
+        f.write(script)
+    try:
+        proc = subprocess.run([node, f.name], capture_output=True, text=True, check=True)
+    finally:
+        Path(f.name).unlink()
+
+    js_urls = json.loads(proc.stdout)
+    for (t, s, name), js_url in zip(cases, js_urls):
+        expected = build_mailto_bcc_link(
+            engine.recipients, SUBJECT_OPTIONS[s], build_full_body(EMAIL_TEMPLATES[t], name)
+        )
+        if js_url != expected:
+            raise AssertionError(f"static page URL differs for template={t} subject={s} name={name!r}")
+    return len(cases)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m transitional_leader.static_export",
+        description="Render a self-contained static page that builds the mailto link client-side.",
+    )
+    parser.add_argument("--out", type=Path, default=Path("site/index.html"), help="output HTML file (default: %(default)s)")
+    parser.add_argument("--csv", type=Path, default=DEFAULT_CSV_PATH, help="contacts CSV (default: %(default)s)")
+    for column in FILTER_COLUMNS:
+        parser.add_argument(f"--{column}", action="append", default=[], help=f"only recipients with this {column} (repeatable)")
+    parser.add_argument("--verify", action="store_true", help="check the page's JS against build_mailto_bcc_link (needs Node.js)")
+    args = parser.parse_args(argv)
+
+    emails, attrs = load_contacts(args.csv)
+    mask = ContactIndex(len(emails), attrs).mask({c: getattr(args, c) for c in FILTER_COLUMNS})
+    engine = DraftEngine(emails).subset(mask)
+    if not engine.recipients:
+        parser.error("no recipients match the selected filters")
+
+    if args.verify:
+        checked = verify_with_node(engine)
+        print(f"parity OK: {checked} URLs identical to build_mailto_bcc_link", file=sys.stderr)
+
+    # The heading names whoever the CSV's contact set addresses (see registry).
+    contact_set = contact_set_for(args.csv)
+    page = render_page(engine, contact_set.audience, contact_set.audience_fa)
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(page, encoding="utf-8")
+    print(f"wrote {args.out} ({len(page.encode()) / 1024:.1f} KB, {len(engine.recipients)} recipients)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
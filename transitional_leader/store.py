@@ -0,0 +1,155 @@
+# Compiled contact store: a compact binary, columnar copy of a cleaned
+# contacts CSV, so workers can load a contact set with a memory-mapped read
+# instead of pandas.
+#
+# Layout (little-endian):
+#   header     magic "TLCS", u16 version, u16 n_columns, u32 n_rows,
+#              u64 source mtime_ns, u64 source size, 32-byte source sha256
+#   directory  per column: u8 name length, name, u8 kind, u64 offset, u64 length
+#   data       PLAIN columns: the values UTF-8 encoded and NUL-joined
+#              DICT columns:  u32 dictionary byte length, the NUL-joined
+#                             dictionary, then one u16 code per row
+#
+# Opening a store only reads the header and directory; a column's bytes are
+# paged in when it is first decoded. The map is a fast loading path, not a
+# resident one: contacts() decodes every column into Python lists and callers
+# (read_contacts) close the store straight after, so a loaded contact set lives
+# in ordinary lists. The savings are in skipping pandas and in DICT columns,
+# whose rows share the dictionary's str objects, so a 100k-row "state" column
+# costs a list of pointers rather than 100k strings.
+
+from __future__ import annotations
+
+import array
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import NamedTuple
+
+MAGIC = b"TLCS"
+VERSION = 1
+PLAIN = 0
+DICT = 1
+
+_HEADER = struct.Struct("<4sHHIQQ32s")
+_ENTRY = struct.Struct("<BQQ")
+_DICT_LEN = struct.Struct("<I")
+_MAX_DICT = 1 << 16
+
+
+class StoreSource(NamedTuple):
+    mtime_ns: int
+    size: int
+    sha256: str
+
+
+def _join(values: Sequence[str]) -> bytes:
+    # NUL can't come out of the CSV cleaning in practice; drop it rather than corrupt the column.
+    return "\x00".join(v.replace("\x00", "") for v in values).encode("utf-8")
+
+
+def _split(data: bytes | memoryview) -> list[str]:
+    return bytes(data).decode("utf-8").split("\x00")
+
+
+def write_store(
+    path: Path,
+    emails: Sequence[str],
+    attrs: Mapping[str, Sequence[str]],
+    source: StoreSource,
+) -> None:
+    """Write atomically: readers in other processes see the old file or the new one."""
+    columns: list[tuple[str, int, bytes]] = [("email", PLAIN, _join(emails))]
+    for name, values in attrs.items():
+        dictionary = list(dict.fromkeys(values))
+        if len(dictionary) >= _MAX_DICT:
+            columns.append((name, PLAIN, _join(values)))
+            continue
+        codes = {v: i for i, v in enumerate(dictionary)}
+        blob = _join(dictionary)
+        packed = array.array("H", (codes[v] for v in values))
+        if sys.byteorder != "little":
+            packed.byteswap()
+        columns.append((name, DICT, _DICT_LEN.pack(len(blob)) + blob + packed.tobytes()))
+
+    header = _HEADER.pack(MAGIC, VERSION, len(columns), len(emails), source.mtime_ns, source.size, bytes.fromhex(source.sha256))
+    directory_size = sum(1 + len(name.encode()) + _ENTRY.size for name, _, _ in columns)
+    offset = len(header) + directory_size
+    directory = b""
+    for name, kind, data in columns:
+        encoded = name.encode()
+        directory += bytes([len(encoded)]) + encoded + _ENTRY.pack(kind, offset, len(data))
+        offset += len(data)
+
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(directory)
+        for _, _, data in columns:
+            f.write(data)
+    os.replace(tmp, path)
+
+
+class ContactStore:
+    """Read-only view of a compiled store; raises ValueError if the file isn't one."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, n_columns, n_rows, mtime_ns, size, digest = _HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path.name} is not a version {VERSION} contact store")
+            self.n = n_rows
+            self.source = StoreSource(mtime_ns, size, digest.hex())
+            self._columns: dict[str, tuple[int, int, int]] = {}
+            pos = _HEADER.size
+            for _ in range(n_columns):
+                name_len = self._map[pos]
+                name = self._map[pos + 1:pos + 1 + name_len].decode()
+                pos += 1 + name_len
+                self._columns[name] = _ENTRY.unpack_from(self._map, pos)
+                pos += _ENTRY.size
+        except (struct.error, IndexError, UnicodeDecodeError):
+            self.close()
+            raise ValueError(f"{path.name} is not a valid contact store") from None
+        except ValueError:
+            self.close()
+            raise
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return tuple(self._columns)
+
+    def column(self, name: str) -> list[str]:
+        kind, offset, length = self._columns[name]
+        data = memoryview(self._map)[offset:offset + length]
+        try:
+            if kind == PLAIN:
+                return _split(data) if self.n else []
+            (dict_len,) = _DICT_LEN.unpack_from(data, 0)
+            dictionary = _split(data[_DICT_LEN.size:_DICT_LEN.size + dict_len])
+            codes = array.array("H")
+            codes.frombytes(data[_DICT_LEN.size + dict_len:])
+            if sys.byteorder != "little":
+                codes.byteswap()
+            return [dictionary[c] for c in codes]
+        finally:
+            data.release()
+
+    def contacts(self) -> tuple[list[str], dict[str, list[str]]]:
+        """Every column decoded into lists (same shape as recipients.load_contacts); nothing stays mapped."""
+        return self.column("email"), {c: self.column(c) for c in self._columns if c != "email"}
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> "ContactStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,131 @@
+# Combinatorial draft bodies.
+# A TemplateSpace is a handful of paragraph banks (opening, situation, ...);
+# every combination of one paragraph per bank, followed by the references, is
+# a draft body. Draft index -> paragraph choice is a mixed-radix decode, so any
+# of the (tens of thousands of) bodies is O(1) to reach and none is stored.
+#
+# A few curated combinations (the original hand-written drafts) can be pinned
+# to indices 0..k-1; the rest of the space keeps plain mixed-radix order,
+# except for the k indices those curated drafts displaced.
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Iterable, Sequence
+from typing import Generic, TypeVar, overload
+
+T = TypeVar("T", str, bytes)
+
+SEPARATOR = "\n\n"
+
+
+class TemplateSpace(Sequence[str]):
+    def __init__(
+        self,
+        banks: Iterable[Sequence[str]],
+        references: str | None = None,
+        curated: Sequence[Sequence[int]] = (),
+        required: Iterable[str] = (),
+    ) -> None:
+        self.banks = tuple(tuple(bank) for bank in banks)
+        self.references = references
+        self.sizes = tuple(len(bank) for bank in self.banks)
+        if not self.sizes or not all(self.sizes):
+            raise ValueError("Every paragraph bank needs at least one paragraph.")
+        self._len = math.prod(self.sizes)
+
+        # Checked once, when the corpus is compiled: a phrase is in every
+        # combination iff some bank has it in every paragraph (or the references do).
+        for phrase in required:
+            if phrase in (references or "") or any(all(phrase in p for p in bank) for bank in self.banks):
+                continue
+            raise ValueError(f"Not every draft would contain the required text {phrase!r}.")
+
+        # curated[j] is pinned to index j; the index it displaced takes the
+        # mixed-radix slot curated[j] vacated.
+        self.curated = tuple(self._radix(c) for c in curated)
+        if len(set(self.curated)) != len(self.curated):
+            raise ValueError("Curated drafts must be distinct.")
+        k = len(self.curated)
+        self._curated_index = {r: j for j, r in enumerate(self.curated)}
+        vacated = sorted(r for r in self.curated if r >= k)
+        free = sorted(set(range(k)) - set(self.curated))
+        self.displaced = dict(zip(vacated, free))
+        self._displaced_back = {r: d for d, r in self.displaced.items()}
+
+    @classmethod
+    def from_templates(cls, templates: Iterable[str]) -> "TemplateSpace":
+        """A one-bank space whose drafts are exactly the given bodies."""
+        return cls([list(templates)])
+
+    def _radix(self, choice: Sequence[int]) -> int:
+        if len(choice) != len(self.sizes) or not all(0 <= c < n for c, n in zip(choice, self.sizes)):
+            raise ValueError(f"{tuple(choice)} is not a paragraph choice for banks of sizes {self.sizes}.")
+        r = 0
+        for c, n in zip(choice, self.sizes):
+            r = r * n + c
+        return r
+
+    def __len__(self) -> int:
+        return self._len
+
+    def indices(self, index: int) -> tuple[int, ...]:
+        """Paragraph choice (one index per bank) of draft `index`."""
+        if not 0 <= index < self._len:
+            raise IndexError(f"draft index {index} out of range for {self._len} drafts")
+        if index < len(self.curated):
+            r = self.curated[index]
+        else:
+            r = self.displaced.get(index, index)
+        choice = []
+        for n in reversed(self.sizes):
+            r, c = divmod(r, n)
+            choice.append(c)
+        return tuple(reversed(choice))
+
+    def index_of(self, choice: Sequence[int]) -> int:
+        r = self._radix(choice)
+        if r in self._curated_index:
+            return self._curated_index[r]
+        return self._displaced_back.get(r, r)
+
+    def paragraphs(self, index: int) -> tuple[str, ...]:
+        return tuple(bank[c] for bank, c in zip(self.banks, self.indices(index)))
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        body = SEPARATOR.join(self.paragraphs(index))
+        return body if self.references is None else f"{body}{SEPARATOR}{self.references}"
+
+    def encoded(self, encode: Callable[[str], T]) -> "EncodedTemplateSpace[T]":
+        """The space with every distinct piece run through `encode` once.
+
+        Only valid for encodings that commute with concatenation at paragraph
+        boundaries (percent-encoding; quoted-printable, since pieces end at line breaks).
+        """
+        return EncodedTemplateSpace(self, encode)
+
+
+class EncodedTemplateSpace(Generic[T]):
+    def __init__(self, space: TemplateSpace, encode: Callable[[str], T]) -> None:
+        self.space = space
+        self.banks = tuple(tuple(encode(p) for p in bank) for bank in space.banks)
+        self.separator = encode(SEPARATOR)
+        self.tail = encode("" if space.references is None else SEPARATOR + space.references)
+
+    def __len__(self) -> int:
+        return len(self.space)
+
+    def __getitem__(self, index: int) -> T:
+        if index < 0:
+            index += len(self.space)
+        parts = [bank[c] for bank, c in zip(self.banks, self.space.indices(index))]
+        return self.separator.join(parts) + self.tail